@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 __author__ = 'Andy'
 
-from androguard.core.dex import DEX
+from core.DexReader import DEX_HEADER, DEX_HEADER_FIELDS
 
 class InitDEX:
     def __init__(self, apk_obj):
@@ -12,12 +12,14 @@ class InitDEX:
         self.dexheader = {}
         try:
             # Get the first dex file
-            # androguard returns bytes, so we need to wrap it in DEX object
-            dex_files = list(self.apk.get_all_dex())
-            if not dex_files:
+            # Only the header (0x70 bytes) is needed, no need to inflate and parse the whole DEX
+            dex_names = list(self.apk.get_dex_names())
+            if not dex_names:
                 return {}
             
-            d = DEX(dex_files[0])
+            raw = self.apk.get_file_head(dex_names[0], DEX_HEADER.size)
+            fields = DEX_HEADER.unpack(raw)
+            h = dict(zip(('magic', 'checksum', 'signature') + DEX_HEADER_FIELDS, fields))
             
             # Helper to format values
             def fmt(val):
@@ -29,32 +31,29 @@ class InitDEX:
                     return val.hex().upper()
                 return str(val)
 
-            h = d.header
-            
-            # Use getattr to be safe with different androguard versions, or assume standard fields
-            self.dexheader["header_magic"] = fmt(getattr(h, "magic", b""))
-            self.dexheader["header_checksum"] = fmt(getattr(h, "checksum", 0))
-            self.dexheader["header_signature"] = fmt(getattr(h, "signature", b""))
-            self.dexheader["header_fileSize"] = fmt(getattr(h, "file_size", 0))
-            self.dexheader["header_headerSize"] = fmt(getattr(h, "header_size", 0))
-            self.dexheader["header_endianTag"] = fmt(getattr(h, "endian_tag", 0))
-            self.dexheader["header_linkSize"] = fmt(getattr(h, "link_size", 0))
-            self.dexheader["header_linkOff"] = fmt(getattr(h, "link_off", 0))
-            self.dexheader["header_mapOff"] = fmt(getattr(h, "map_off", 0))
-            self.dexheader["header_stringIdsSize"] = fmt(getattr(h, "string_ids_size", 0))
-            self.dexheader["header_stringIdsOff"] = fmt(getattr(h, "string_ids_off", 0))
-            self.dexheader["header_typeIdsSize"] = fmt(getattr(h, "type_ids_size", 0))
-            self.dexheader["header_typeIdsOff"] = fmt(getattr(h, "type_ids_off", 0))
-            self.dexheader["header_protoIdsSize"] = fmt(getattr(h, "proto_ids_size", 0))
-            self.dexheader["header_protoIdsOff"] = fmt(getattr(h, "proto_ids_off", 0))
-            self.dexheader["header_fieldIdsSize"] = fmt(getattr(h, "field_ids_size", 0))
-            self.dexheader["header_fieldIdsOff"] = fmt(getattr(h, "field_ids_off", 0))
-            self.dexheader["header_methodIdsSize"] = fmt(getattr(h, "method_ids_size", 0))
-            self.dexheader["header_methodIdsOff"] = fmt(getattr(h, "method_ids_off", 0))
-            self.dexheader["header_classDefsSize"] = fmt(getattr(h, "class_defs_size", 0))
-            self.dexheader["header_classDefsOff"] = fmt(getattr(h, "class_defs_off", 0))
-            self.dexheader["header_dataSize"] = fmt(getattr(h, "data_size", 0))
-            self.dexheader["header_dataOff"] = fmt(getattr(h, "data_off", 0))
+            self.dexheader["header_magic"] = fmt(h.get("magic", b""))
+            self.dexheader["header_checksum"] = fmt(h.get("checksum", 0))
+            self.dexheader["header_signature"] = fmt(h.get("signature", b""))
+            self.dexheader["header_fileSize"] = fmt(h.get("file_size", 0))
+            self.dexheader["header_headerSize"] = fmt(h.get("header_size", 0))
+            self.dexheader["header_endianTag"] = fmt(h.get("endian_tag", 0))
+            self.dexheader["header_linkSize"] = fmt(h.get("link_size", 0))
+            self.dexheader["header_linkOff"] = fmt(h.get("link_off", 0))
+            self.dexheader["header_mapOff"] = fmt(h.get("map_off", 0))
+            self.dexheader["header_stringIdsSize"] = fmt(h.get("string_ids_size", 0))
+            self.dexheader["header_stringIdsOff"] = fmt(h.get("string_ids_off", 0))
+            self.dexheader["header_typeIdsSize"] = fmt(h.get("type_ids_size", 0))
+            self.dexheader["header_typeIdsOff"] = fmt(h.get("type_ids_off", 0))
+            self.dexheader["header_protoIdsSize"] = fmt(h.get("proto_ids_size", 0))
+            self.dexheader["header_protoIdsOff"] = fmt(h.get("proto_ids_off", 0))
+            self.dexheader["header_fieldIdsSize"] = fmt(h.get("field_ids_size", 0))
+            self.dexheader["header_fieldIdsOff"] = fmt(h.get("field_ids_off", 0))
+            self.dexheader["header_methodIdsSize"] = fmt(h.get("method_ids_size", 0))
+            self.dexheader["header_methodIdsOff"] = fmt(h.get("method_ids_off", 0))
+            self.dexheader["header_classDefsSize"] = fmt(h.get("class_defs_size", 0))
+            self.dexheader["header_classDefsOff"] = fmt(h.get("class_defs_off", 0))
+            self.dexheader["header_dataSize"] = fmt(h.get("data_size", 0))
+            self.dexheader["header_dataOff"] = fmt(h.get("data_off", 0))
 
         except Exception as e:
             print(f"Error getting DEX info: {e}")
@@ -5,6 +5,7 @@ import sys
 import os
 import platform
 import ctypes
+import multiprocessing
 
 # === FIX FOR PYINSTALLER NOCONSOLE ===
 # Some libraries (like androguard) try to write to stdout/stderr even if it's None.
@@ -224,6 +225,9 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 if __name__ == "__main__":
+    # Required for the deep scan worker processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+
     # Fix for Windows Taskbar Icon
     if platform.system() == 'Windows':
         try:
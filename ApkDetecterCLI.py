@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+__author__ = 'Andy'
+
+import sys
+import os
+import argparse
+import json
+import multiprocessing
+
+# Add libs to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'libs'))
+
+from core.BatchAnalyzer import BatchAnalyzer, collect_samples, to_json_line
+from core.TamperCheck import TAMPER_TIME_BUDGET, TAMPER_MEMORY_BUDGET
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Headless batch analysis of APK/IPA samples. Results are written as JSON Lines."
+    )
+    parser.add_argument('inputs', nargs='*', help="APK/IPA files or directories to scan")
+    parser.add_argument('-l', '--file-list', action='append', default=[],
+                        help="text file with one sample path per line (can be repeated)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="JSON Lines output file (default: stdout)")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help="max samples queued at once (default: 2 x workers)")
+    parser.add_argument('--cache', default=None, metavar='PATH',
+                        help="reuse/store results in this SQLite result cache")
+    parser.add_argument('--quick', action='store_true',
+                        help="triage from the ZIP central directory only (file list, sizes, packer, DEX count)")
+    parser.add_argument('--tamper-timeout', type=float, default=None, metavar='SECONDS',
+                        help="time budget of the APK zip/manifest tamper pre-check (default: 10)")
+    parser.add_argument('--tamper-memory', type=int, default=None, metavar='MB',
+                        help="max data the tamper pre-check may hold decompressed at once (default: 256)")
+    parser.add_argument('--deep', action='store_true',
+                        help="also deep scan every sample (URLs, IPs, keywords, anti-debug and crypto APIs)")
+    parser.add_argument('--keywords', default=None, metavar='FILE',
+                        help="text file with extra suspicious keywords for --deep, one per line")
+    parser.add_argument('--macho-sections', default=None, metavar='NAMES',
+                        help="comma separated Mach-O sections --deep scans in iOS binaries "
+                             "(e.g. __cstring,__objc_methname; default: the whole binary)")
+    parser.add_argument('--no-recursive', action='store_true',
+                        help="do not descend into sub directories")
+    parser.add_argument('--stats', default=None,
+                        help="write the throughput summary as JSON to this file")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="do not print progress/summary to stderr")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="show analyzer logs from the workers")
+    args = parser.parse_args(argv)
+    if not args.inputs and not args.file_list:
+        parser.error("no input given")
+    if (args.keywords or args.macho_sections) and not args.deep:
+        parser.error("--keywords and --macho-sections require --deep")
+    if args.deep and args.quick:
+        parser.error("--deep cannot be combined with --quick")
+    return args
+
+
+def read_keywords(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+
+def print_summary(summary, stream=sys.stderr):
+    stream.write(
+        f"\nFiles: {summary['files']}  Failures: {summary['failures']}  "
+        f"Elapsed: {summary['elapsed']:.2f}s  "
+        f"Throughput: {summary['files_per_sec']:.2f} files/s, {summary['mb_per_sec']:.2f} MB/s\n"
+    )
+    stream.write(f"{'Worker':>10} {'Files':>7} {'Fail':>6} {'MB':>10} {'Busy(s)':>9} {'Util':>6}\n")
+    for pid, w in summary['workers'].items():
+        stream.write(
+            f"{pid:>10} {w['files']:>7} {w['failures']:>6} {w['mb']:>10.2f} "
+            f"{w['busy']:>9.2f} {w['utilization']:>6.0%}\n"
+        )
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.output == '-':
+        out = sys.stdout
+    else:
+        out = open(args.output, 'w', encoding='utf-8')
+
+    def sink(record):
+        out.write(to_json_line(record) + "\n")
+        out.flush()
+
+    def progress(stats):
+        if not args.quiet:
+            summary = stats.to_dict()
+            sys.stderr.write(
+                f"\r[{summary['files']} done, {summary['failures']} failed] "
+                f"{summary['files_per_sec']:.2f} files/s {summary['mb_per_sec']:.2f} MB/s"
+            )
+            sys.stderr.flush()
+
+    tamper_budget = None
+    if args.tamper_timeout is not None or args.tamper_memory is not None:
+        tamper_budget = (
+            args.tamper_timeout if args.tamper_timeout is not None else TAMPER_TIME_BUDGET,
+            args.tamper_memory * 1024 * 1024 if args.tamper_memory is not None else TAMPER_MEMORY_BUDGET,
+        )
+
+    deep_scan = None
+    if args.deep:
+        deep_scan = {}
+        if args.keywords:
+            deep_scan['extra_keywords'] = read_keywords(args.keywords)
+        if args.macho_sections:
+            deep_scan['macho_sections'] = tuple(name.strip() for name in args.macho_sections.split(',') if name.strip())
+
+    batch = BatchAnalyzer(workers=args.workers, max_pending=args.max_pending,
+                          verbose=args.verbose, cache_path=args.cache, quick=args.quick,
+                          tamper_budget=tamper_budget, deep_scan=deep_scan)
+    batch.set_progress_callback(progress)
+    try:
+        samples = collect_samples(args.inputs, args.file_list, recursive=not args.no_recursive)
+        stats = batch.run(samples, sink)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    summary = stats.to_dict()
+    if not args.quiet:
+        print_summary(summary)
+    if args.stats:
+        with open(args.stats, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=4)
+
+    return 1 if summary['failures'] else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -2,108 +2,208 @@
 __author__ = 'Andy'
 
 import json
+import logging
 import os
-from androguard.core.apk import APK
+import re
+import threading
+
+_signature_index = None
+_signature_lock = threading.Lock()
+
+
+class SignatureIndex:
+    """
+    Resources/signatures.json compiled into lookup indexes.
+
+    Every distinct condition (type, match, pattern) gets an id. The set of
+    basenames / paths is matched once against each index to collect the
+    satisfied ids:
+
+    - exact:      set intersection with the patterns
+    - startswith: intersection of {item[:n]} for each distinct prefix length n
+    - endswith:   intersection of {item[-n:]} for each distinct suffix length n
+    - contains:   one combined regex with a named group per pattern
+
+    Signatures are then decided from the satisfied ids, so the cost grows
+    with the number of files and distinct pattern lengths, not the rules.
+    """
+
+    def __init__(self, signatures):
+        self.signatures = signatures
+        self.condition_ids = {}
+        # {target: {match: {pattern: [condition ids]}}}, target is 'file' or 'path'
+        self.index = {
+            target: {'exact': {}, 'startswith': {}, 'endswith': {}, 'contains': {}}
+            for target in ('file', 'path')
+        }
+        # [(name, [[condition ids of a rule], ...])]
+        self.compiled = []
+
+        for signature in signatures:
+            rules = []
+            for rule in signature.get('rules', []):
+                if rule.get('type', 'file') == 'combined':
+                    # All conditions must be met
+                    conditions = rule.get('conditions', [])
+                else:
+                    conditions = [rule]
+                ids = [self._condition_id(cond) for cond in conditions]
+                if all(i is not None for i in ids):
+                    rules.append(ids)
+            self.compiled.append((signature['name'], rules))
+
+        self.prefix_lengths = {}
+        self.suffix_lengths = {}
+        self.contains_re = {}
+        # {target: {group name: condition ids of the pattern and of every pattern it contains}}
+        self.contains_groups = {}
+        for target, by_match in self.index.items():
+            self.prefix_lengths[target] = sorted({len(p) for p in by_match['startswith']})
+            self.suffix_lengths[target] = sorted({len(p) for p in by_match['endswith']})
+            self.contains_re[target], self.contains_groups[target] = self._compile_contains(by_match['contains'])
+
+    @staticmethod
+    def _compile_contains(contains):
+        """
+        One alternation, longest patterns first, with a named group per
+        pattern. Every pattern matching at a given position is a prefix of
+        the longest one, hence the ids of the patterns a pattern contains are
+        attached to its group. The empty pattern is left out, it is contained
+        in any item.
+        """
+        patterns = sorted((p for p in contains if p), key=len, reverse=True)
+        if not patterns:
+            return None, {}
+        groups = {}
+        alternatives = []
+        for i, pattern in enumerate(patterns):
+            name = f'c{i}'
+            groups[name] = {cond_id for other in patterns if other in pattern for cond_id in contains[other]}
+            alternatives.append(f'(?P<{name}>{re.escape(pattern)})')
+        return re.compile('|'.join(alternatives)), groups
+
+    def _condition_id(self, cond):
+        target = 'file' if cond.get('type', 'file') == 'file' else 'path'
+        match_mode = cond.get('match', 'exact')  # exact, startswith, endswith, contains
+        pattern = cond.get('pattern', '')
+        if match_mode not in self.index[target]:
+            logging.warning(f"Unknown signature match mode '{match_mode}'")
+            return None
+
+        key = (target, match_mode, pattern)
+        cond_id = self.condition_ids.get(key)
+        if cond_id is None:
+            cond_id = len(self.condition_ids)
+            self.condition_ids[key] = cond_id
+            self.index[target][match_mode].setdefault(pattern, []).append(cond_id)
+        return cond_id
+
+    def _match_items(self, target, items, satisfied):
+        """
+        :param items: set of basenames ('file') or full paths ('path')
+        """
+        if not items:
+            # Even empty patterns need an item to match
+            return
+        by_match = self.index[target]
+
+        exact = by_match['exact']
+        for key in items & exact.keys():
+            satisfied.update(exact[key])
+
+        prefixes = by_match['startswith']
+        for n in self.prefix_lengths[target]:
+            for key in {item[:n] for item in items} & prefixes.keys():
+                satisfied.update(prefixes[key])
+
+        suffixes = by_match['endswith']
+        for n in self.suffix_lengths[target]:
+            heads = {item[-n:] for item in items} if n else {''}
+            for key in heads & suffixes.keys():
+                satisfied.update(suffixes[key])
+
+        satisfied.update(by_match['contains'].get('', ()))
+        contains_re = self.contains_re[target]
+        if contains_re:
+            # Names never contain a newline, so a pattern found in the joined
+            # text is contained in one of the items. Searching again from the
+            # next character, not the end of the match, finds overlapping ones.
+            joined = '\n'.join(items)
+            groups = self.contains_groups[target]
+            found = set()
+            match = contains_re.search(joined)
+            while match:
+                found.add(match.lastgroup)
+                match = contains_re.search(joined, match.start() + 1)
+            for name in found:
+                satisfied.update(groups[name])
+
+    def match(self, files):
+        """
+        :param files: iterable of paths inside the APK
+        :returns: set of detected protector names
+        """
+        paths = set(files)
+        basenames = {path.rsplit('/', 1)[-1] for path in paths}
+
+        satisfied = set()
+        self._match_items('file', basenames, satisfied)
+        self._match_items('path', paths, satisfied)
+
+        detected = set()
+        for name, rules in self.compiled:
+            for ids in rules:
+                if all(i in satisfied for i in ids):
+                    detected.add(name)
+                    break
+        return detected
+
+
+def get_signature_index():
+    """
+    Load and compile Resources/signatures.json once per process
+    """
+    global _signature_index
+    with _signature_lock:
+        if _signature_index is None:
+            signatures = []
+            try:
+                base_dir = os.path.dirname(os.path.abspath(__file__))
+                json_path = os.path.join(base_dir, 'Resources', 'signatures.json')
+
+                if os.path.exists(json_path):
+                    with open(json_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                        signatures = data.get('signatures', [])
+                else:
+                    # Fallback if file not found (though it should be there)
+                    logging.warning(f"Signature file not found at {json_path}")
+            except Exception as e:
+                logging.error(f"Error loading signatures: {e}")
+            _signature_index = SignatureIndex(signatures)
+        return _signature_index
+
 
 class CheckProtect:
     def __init__(self, apk_obj):
         """
-        :param apk_obj: androguard.core.apk.APK object
+        :param apk_obj: androguard.core.apk.APK object (or anything with get_files())
         """
         self.apk = apk_obj
-        self.signatures = []
-        self._load_signatures()
+        self.index = get_signature_index()
+        self.signatures = self.index.signatures
 
-    def _load_signatures(self):
+    def get_protectors(self):
         """
-        Load signatures from Resources/signatures.json
+        :returns: sorted list of detected protector names
         """
-        try:
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-            json_path = os.path.join(base_dir, 'Resources', 'signatures.json')
-            
-            if os.path.exists(json_path):
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.signatures = data.get('signatures', [])
-            else:
-                # Fallback if file not found (though it should be there)
-                print(f"Warning: Signature file not found at {json_path}")
-        except Exception as e:
-            print(f"Error loading signatures: {e}")
+        return sorted(self.index.match(self.apk.get_files()))
 
     def check_protectflag(self):
-        detected_protectors = set()
-        files = self.apk.get_files()
-        
-        # Pre-process files for faster matching
-        # file_set: just filenames (e.g., "libjiagu.so")
-        file_set = set()
-        # path_set: full paths (e.g., "assets/libjiagu.so")
-        path_set = set(files)
-        
-        for f in files:
-            # Extract basename
-            if '/' in f:
-                basename = f.split('/')[-1]
-            else:
-                basename = f
-            file_set.add(basename)
-
-        for signature in self.signatures:
-            name = signature['name']
-            rules = signature.get('rules', [])
-            
-            match_found = False
-            for rule in rules:
-                rule_type = rule.get('type', 'file')
-                
-                if rule_type == 'combined':
-                    # All conditions must be met
-                    conditions = rule.get('conditions', [])
-                    all_conditions_met = True
-                    for cond in conditions:
-                        if not self._check_rule(cond, file_set, path_set):
-                            all_conditions_met = False
-                            break
-                    if all_conditions_met:
-                        match_found = True
-                        break
-                else:
-                    # Single rule
-                    if self._check_rule(rule, file_set, path_set):
-                        match_found = True
-                        break
-            
-            if match_found:
-                detected_protectors.add(name)
+        detected_protectors = self.get_protectors()
 
         if detected_protectors:
             # Format: "该APK已加固=>360加固 腾讯加固"
-            return "该APK已加固=>" + " ".join(sorted(detected_protectors))
-        
-        return "该APK未加密"
+            return "该APK已加固=>" + " ".join(detected_protectors)
 
-    def _check_rule(self, rule, file_set, path_set):
-        rule_type = rule.get('type', 'file')
-        pattern = rule.get('pattern', '')
-        match_mode = rule.get('match', 'exact') # exact, startswith, endswith, contains
-
-        target_set = file_set if rule_type == 'file' else path_set
-
-        # Optimization for exact match on file set
-        if rule_type == 'file' and match_mode == 'exact':
-            return pattern in target_set
-
-        # For other cases, iterate
-        for item in target_set:
-            if match_mode == 'exact':
-                if item == pattern: return True
-            elif match_mode == 'startswith':
-                if item.startswith(pattern): return True
-            elif match_mode == 'endswith':
-                if item.endswith(pattern): return True
-            elif match_mode == 'contains':
-                if pattern in item: return True
-        
-        return False
+        return "该APK未加密"
@@ -104,6 +104,8 @@ class AppInfoWidget(QtWidgets.QWidget):
         keys = [
             ("Size", "size"),
             ("MD5", "md5"),
+            ("SHA-1", "sha1"),
+            ("SHA-256", "sha256"),
             ("Min SDK / OS", "min_sdk"),
             ("Target SDK", "target_sdk"),
             ("Protection", "protect")
@@ -148,27 +150,31 @@ class AppInfoWidget(QtWidgets.QWidget):
         self.perms_text.setReadOnly(True)
         layout.addWidget(self.perms_text)
 
+    def update_header(self, header):
+        """
+        First paint from the lite manifest header, before the full analysis
+        ends. update_data() overwrites everything once it is available.
+        """
+        # The label lives in resources.arsc, which the lite header does not read
+        self.app_name_label.setText("Loading...")
+        self.package_label.setText(str(header.get('package') or 'Unknown'))
+        self.version_label.setText(str(header.get('version', 'Unknown')))
+        self.icon_label.setText("Loading...")
+
+        for key, widget in self.basic_labels.items():
+            widget.setText(str(header.get(key) or 'Loading...'))
+
+        self.cert_text.setHtml("Loading...")
+        self.perms_text.setHtml("<h2>Permissions</h2><p>Loading...</p>")
+        self.tab_components.setText("Loading...")
+
     def update_data(self, analyzer_type, analyzer):
         # Update Header
         info = analyzer.get_basic_info()
-        self.app_name_label.setText(str(info.get('name', 'Unknown')))
-        self.package_label.setText(str(info.get('package', 'Unknown')))
-        self.version_label.setText(str(info.get('version', 'Unknown')))
+        self._update_basic(info)
 
         # Update Icon
-        if analyzer.icon_data:
-            pixmap = QtGui.QPixmap()
-            if not pixmap.loadFromData(analyzer.icon_data):
-                self.icon_label.setText("Bad Icon")
-            else:
-                self.icon_label.setPixmap(pixmap.scaled(100, 100, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
-        else:
-            self.icon_label.setText("No Icon")
-
-        # Update Basic Info (Grid)
-        for key, widget in self.basic_labels.items():
-            val = info.get(key, 'N/A')
-            widget.setText(str(val))
+        self._update_icon(analyzer.icon_data)
 
         # Update Cert/Prov Info & Permissions based on type
         if analyzer_type == 'apk':
@@ -176,10 +182,56 @@ class AppInfoWidget(QtWidgets.QWidget):
         else:
             self._update_ipa_details(analyzer)
 
+    def update_stage(self, name, payload):
+        """
+        Apply the result of one ApkAnalyzer stage as soon as it is done,
+        update_data() then redraws everything at the end.
+        """
+        if name == 'basic':
+            # Values not known yet (e.g. protect) keep their placeholder
+            self._update_basic({key: val for key, val in payload.items() if val is not None}, partial=True)
+        elif name == 'icon':
+            self._update_icon(payload)
+        elif name == 'cert':
+            self._update_cert(payload)
+        elif name == 'protect':
+            self.basic_labels['protect'].setText(str(payload))
+        elif name == 'components':
+            self._update_components(payload)
+
+    def _update_basic(self, info, partial=False):
+        """
+        :param partial: only touch the keys present in info
+        """
+        header = (('name', self.app_name_label), ('package', self.package_label), ('version', self.version_label))
+        for key, label in header:
+            if not partial or key in info:
+                label.setText(str(info.get(key, 'Unknown')))
+
+        # Update Basic Info (Grid)
+        for key, widget in self.basic_labels.items():
+            if not partial or key in info:
+                widget.setText(str(info.get(key, 'N/A')))
+
+    def _update_icon(self, icon_data):
+        if icon_data:
+            pixmap = QtGui.QPixmap()
+            if not pixmap.loadFromData(icon_data):
+                self.icon_label.setText("Bad Icon")
+            else:
+                self.icon_label.setPixmap(pixmap.scaled(100, 100, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
+        else:
+            self.icon_label.setText("No Icon")
+
     def _update_apk_details(self, analyzer):
         # 1. Certificate Info (Now in Basic Tab)
+        self._update_cert(analyzer.cert_info)
+
+        # 2. Permissions (Now in Permissions Tab) & 3. Components
+        self._update_components(analyzer.info)
+
+    def _update_cert(self, cert):
         content = ""
-        cert = analyzer.cert_info
         if cert:
             content += f"<b>Issuer:</b> {cert.get('issuer')}<br>"
             content += f"<b>Subject:</b> {cert.get('subject')}<br>"
@@ -191,9 +243,9 @@ class AppInfoWidget(QtWidgets.QWidget):
         
         self.cert_text.setHtml(content)
 
-        # 2. Permissions (Now in Permissions Tab)
+    def _update_components(self, info):
         perm_content = "<h2>Permissions</h2>"
-        perms = analyzer.info.get('permissions', [])
+        perms = info.get('permissions', [])
         if perms:
             perm_content += "<ul>"
             for p in perms:
@@ -204,11 +256,10 @@ class AppInfoWidget(QtWidgets.QWidget):
 
         self.perms_text.setHtml(perm_content)
 
-        # 3. Components
-        comp_text = "Activities:\n" + "\n".join(analyzer.info.get('activities', []))
-        comp_text += "\n\nServices:\n" + "\n".join(analyzer.info.get('services', []))
-        comp_text += "\n\nReceivers:\n" + "\n".join(analyzer.info.get('receivers', []))
-        comp_text += "\n\nProviders:\n" + "\n".join(analyzer.info.get('providers', []))
+        comp_text = "Activities:\n" + "\n".join(info.get('activities', []))
+        comp_text += "\n\nServices:\n" + "\n".join(info.get('services', []))
+        comp_text += "\n\nReceivers:\n" + "\n".join(info.get('receivers', []))
+        comp_text += "\n\nProviders:\n" + "\n".join(info.get('providers', []))
         self.tab_components.setText(comp_text)
 
     def _update_ipa_details(self, analyzer):
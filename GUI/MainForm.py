@@ -2,30 +2,52 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
 import sys
 import os
+import logging
 import platform
 
 from GUI.AppInfoWidget import AppInfoWidget
 from Core.ApkAnalyzer import ApkAnalyzer
 from Core.IpaAnalyzer import IpaAnalyzer
 from Core.DeepScanner import DeepScanner
+from Core.ResultCache import ResultCache
 
 class DeepScanThread(QtCore.QThread):
     progress_signal = QtCore.pyqtSignal(int, str)
     finished_signal = QtCore.pyqtSignal(object)
 
-    def __init__(self, apk_obj=None, ipa_path=None, analyzer=None):
+    def __init__(self, apk_obj=None, ipa_path=None, analyzer=None, cache=None):
         super(DeepScanThread, self).__init__()
         self.apk = apk_obj
         self.ipa_path = ipa_path
         self.analyzer = analyzer
+        self.cache = cache
 
     def run(self):
+        sha256 = None
+        if self.analyzer and hasattr(self.analyzer, 'info'):
+            sha256 = self.analyzer.info.get('sha256')
+
+        if self.cache and sha256:
+            cached = self.cache.get(sha256, kind='deep_scan')
+            if cached:
+                cached.pop('icon_data', None)
+                self.emit_progress(100, "Deep scan results loaded from cache")
+                self.finished_signal.emit(cached)
+                return
+
+        # Analysis results may come from the cache, in which case the APK was never parsed
+        if self.apk is None and not self.ipa_path and hasattr(self.analyzer, 'load_apk'):
+            self.emit_progress(5, "Parsing APK...")
+            self.apk = self.analyzer.load_apk()
+
         binary_path_in_zip = None
         if self.analyzer and hasattr(self.analyzer, 'binary_path'):
             binary_path_in_zip = self.analyzer.binary_path
             
         scanner = DeepScanner(self.apk, self.ipa_path, binary_path_in_zip)
         results = scanner.scan(self.emit_progress)
+        if self.cache and sha256:
+            self.cache.put(sha256, results, kind='deep_scan')
         self.finished_signal.emit(results)
 
     def emit_progress(self, value, message):
@@ -33,27 +55,33 @@ class DeepScanThread(QtCore.QThread):
 
 class AnalysisThread(QtCore.QThread):
     progress_signal = QtCore.pyqtSignal(int, str)
+    header_signal = QtCore.pyqtSignal(object)
+    stage_signal = QtCore.pyqtSignal(str, object)
     finished_signal = QtCore.pyqtSignal(bool, object, str)
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, cache=None):
         super(AnalysisThread, self).__init__()
         self.file_path = file_path
+        self.cache = cache
         self.analyzer = None
         self.analyzer_type = None
 
     def run(self):
         try:
             if self.file_path.lower().endswith('.apk'):
-                self.analyzer = ApkAnalyzer(self.file_path)
+                self.analyzer = ApkAnalyzer(self.file_path, self.cache)
                 self.analyzer_type = 'apk'
             elif self.file_path.lower().endswith('.ipa'):
-                self.analyzer = IpaAnalyzer(self.file_path)
+                self.analyzer = IpaAnalyzer(self.file_path, self.cache)
                 self.analyzer_type = 'ipa'
             else:
                 self.finished_signal.emit(False, None, "Unsupported file type")
                 return
 
             self.analyzer.set_progress_callback(self.emit_progress)
+            if self.analyzer_type == 'apk':
+                self.analyzer.set_header_callback(self.emit_header)
+                self.analyzer.set_stage_callback(self.emit_stage)
             success = self.analyzer.analyze()
             
             if success:
@@ -68,6 +96,12 @@ class AnalysisThread(QtCore.QThread):
     def emit_progress(self, value, message):
         self.progress_signal.emit(value, message)
 
+    def emit_header(self, header):
+        self.header_signal.emit(header)
+
+    def emit_stage(self, name, payload):
+        self.stage_signal.emit(name, payload)
+
 class OverlayWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super(OverlayWidget, self).__init__(parent)
@@ -262,6 +296,13 @@ class MainForm(QtWidgets.QMainWindow):
             self.resize(900, 600) # Mac default
             
         self.setAcceptDrops(True)
+
+        # Content-addressed result cache (optional: analysis still works without it)
+        try:
+            self.result_cache = ResultCache()
+        except Exception as e:
+            logging.warning(f"Result cache disabled: {e}")
+            self.result_cache = None
         
         self.init_ui()
 
@@ -414,6 +455,13 @@ class MainForm(QtWidgets.QMainWindow):
         # Status Bar
         self.status_bar = self.statusBar()
         self.status_bar.showMessage("Ready")
+        # Keeps the progress visible once the overlay gives way to the early header
+        self.status_progress = QtWidgets.QProgressBar()
+        self.status_progress.setMaximumWidth(200)
+        self.status_progress.setMaximumHeight(14)
+        self.status_progress.setTextVisible(False)
+        self.status_progress.hide()
+        self.status_bar.addPermanentWidget(self.status_progress)
 
     def resizeEvent(self, event):
         # Resize overlay to cover entire window content area
@@ -450,19 +498,33 @@ class MainForm(QtWidgets.QMainWindow):
         self.overlay.raise_()
         self.overlay.set_progress(0, f"Initializing analysis for {os.path.basename(file_path)}...")
         self.status_bar.showMessage(f"Analyzing {file_path}...")
+        self.status_progress.setValue(0)
 
         # Start Thread
-        self.thread = AnalysisThread(file_path)
+        self.thread = AnalysisThread(file_path, self.result_cache)
         self.thread.progress_signal.connect(self.update_progress)
+        self.thread.header_signal.connect(self.header_ready)
+        self.thread.stage_signal.connect(self.app_info_widget.update_stage)
         self.thread.finished_signal.connect(self.analysis_finished)
         self.thread.start()
 
     def update_progress(self, value, message):
         self.overlay.set_progress(value, message)
+        self.status_progress.setValue(value)
         self.status_bar.showMessage(message)
 
+    def header_ready(self, header):
+        # Show the manifest header right away, the rest follows in analysis_finished().
+        # Icon, certificate and protector stages are still running: the status bar
+        # takes over the progress until then
+        self.overlay.hide()
+        self.status_progress.show()
+        self.stacked_widget.setCurrentWidget(self.app_info_widget)
+        self.app_info_widget.update_header(header)
+
     def analysis_finished(self, success, analyzer, analyzer_type):
         self.overlay.hide()
+        self.status_progress.hide()
         
         if success:
             self.stacked_widget.setCurrentWidget(self.app_info_widget)
@@ -525,9 +587,13 @@ class MainForm(QtWidgets.QMainWindow):
              # Determine type
              apk_obj = None
              ipa_path = None
+             is_apk = False
              
              if hasattr(analyzer, 'apk'):
+                 # May be None when the analysis was served from the cache;
+                 # DeepScanThread then parses the APK (or reuses cached scan results)
                  apk_obj = analyzer.apk
+                 is_apk = True
              elif hasattr(analyzer, 'file_path') and analyzer.file_path.lower().endswith('.ipa'):
                  ipa_path = analyzer.file_path
                  # Pass the found binary path if available
@@ -537,13 +603,13 @@ class MainForm(QtWidgets.QMainWindow):
                      # Let's pass the analyzer itself to DeepScanThread instead?
                      pass
              
-             if apk_obj or ipa_path:
+             if is_apk or ipa_path:
                  self.overlay.show()
                  self.overlay.raise_()
                  self.overlay.set_progress(0, "Starting Deep Scan...")
                  
                  # Run in a new thread to avoid blocking UI
-                 self.scan_thread = DeepScanThread(apk_obj, ipa_path, analyzer)
+                 self.scan_thread = DeepScanThread(apk_obj, ipa_path, analyzer, self.result_cache)
                  self.scan_thread.progress_signal.connect(self.update_progress)
                  self.scan_thread.finished_signal.connect(self.deep_scan_finished)
                  self.scan_thread.start()
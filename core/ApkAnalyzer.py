@@ -1,10 +1,9 @@
 
+import io
 import os
-import hashlib
 import sys
-import zipfile
-import re
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # Import existing helpers
@@ -17,6 +16,20 @@ except ImportError:
     from CheckProtect import CheckProtect
 
 from androguard.core.apk import APK
+from apkInspector.headers import ZipEntry
+from apkInspector.axml import get_manifest_lite
+
+from .SampleHasher import SampleHasher
+from .QuickTriage import QuickTriage
+from .IconResolver import IconResolver
+from .TamperCheck import TamperCheck, TAMPER_TIME_BUDGET, TAMPER_MEMORY_BUDGET
+
+# Manifest chunks read by the lite parser: namespace, <manifest>, <uses-sdk>
+LITE_MANIFEST_ELEMENTS = 3
+
+# Icon, certificate and protection stages run concurrently
+STAGE_WORKERS = 3
+COMPONENT_KEYS = ('activities', 'services', 'receivers', 'providers', 'permissions')
 
 # Try to import loguru to check if it's available in the environment
 try:
@@ -26,8 +39,15 @@ except ImportError:
     HAS_LOGURU = False
 
 class ApkAnalyzer:
-    def __init__(self, file_path):
+    def __init__(self, file_path, cache=None, tamper_time_budget=TAMPER_TIME_BUDGET,
+                 tamper_memory_budget=TAMPER_MEMORY_BUDGET):
         self.file_path = file_path
+        self.cache = cache # Optional ResultCache
+        # Budget of the zip/manifest tampering pre-check (None: unlimited)
+        self.tamper_time_budget = tamper_time_budget
+        self.tamper_memory_budget = tamper_memory_budget
+        self.tamper_check = None
+        self.from_cache = False
         self.apk = None
         self.info = {}
         self.cert_info = {}
@@ -35,6 +55,8 @@ class ApkAnalyzer:
         self.icon_data = None
         self.error = None
         self.progress_callback = None
+        self.header_callback = None
+        self.stage_callback = None
         self.loguru_sink_id = None
         
         # Capture Androguard logs
@@ -100,29 +122,36 @@ class ApkAnalyzer:
     def set_progress_callback(self, callback):
         self.progress_callback = callback
 
+    def set_stage_callback(self, callback):
+        """
+        :param callback: called as callback(name, payload) each time a stage
+                         of analyze() completes: 'basic' (get_basic_info()),
+                         'icon' (bytes or None), 'cert' (dict, empty if unsigned),
+                         'protect' (str) and 'components' (dict)
+        """
+        self.stage_callback = callback
+
+    def _stage_done(self, name, payload):
+        if self.stage_callback:
+            self.stage_callback(name, payload)
+
+    def set_header_callback(self, callback):
+        """
+        :param callback: called with the read_lite_header() dict before the
+                         full analysis starts, so a UI can paint it early
+        """
+        self.header_callback = callback
+
     def _update_progress(self, value, message=""):
         if self.progress_callback:
             self.progress_callback(value, message)
 
-    def _calculate_md5_chunked(self, path):
-        hash_md5 = hashlib.md5()
-        file_size = os.path.getsize(path)
-        read_size = 0
-        chunk_size = 8192  # 8KB chunks
-        
-        with open(path, "rb") as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    break
-                hash_md5.update(chunk)
-                read_size += len(chunk)
-                
-                # Progress 0-10%
-                percent = int((read_size / file_size) * 10)
-                self._update_progress(percent, f"Calculating MD5... ({int((read_size/file_size)*100)}%)")
-        
-        return hash_md5.hexdigest().upper()
+    def _calculate_hashes(self, path):
+        # MD5 / SHA-1 / SHA-256 in one pass. The content is not kept: the APK
+        # parser maps the same file, so its pages are served from the page cache
+        hasher = SampleHasher(path)
+        hasher.set_progress_callback(self.progress_callback)
+        return hasher.run(0, 10)
 
     def analyze(self):
         if not os.path.exists(self.file_path):
@@ -130,13 +159,33 @@ class ApkAnalyzer:
             return False
 
         try:
-            self._update_progress(0, "Calculating MD5...")
+            if self.header_callback:
+                self._emit_lite_header()
+
+            self._update_progress(0, "Calculating hashes...")
             # File Stats
             stat = os.stat(self.file_path)
             self.info['file_size'] = stat.st_size
             
-            # Chunked MD5
-            self.info['md5'] = self._calculate_md5_chunked(self.file_path)
+            # Single-pass MD5 / SHA-1 / SHA-256
+            digests = self._calculate_hashes(self.file_path)
+            self.info['md5'] = digests['md5']
+            self.info['sha1'] = digests['sha1']
+            self.info['sha256'] = digests['sha256']
+
+            # Cache hit: skip parsing entirely
+            if self._load_from_cache():
+                self._update_progress(100, "Loaded from cache")
+                return True
+
+            # Tamper pre-check: picks the parser, pathological samples fail fast
+            self._update_progress(12, "Checking ZIP structure...")
+            strategy = self._tamper_precheck()
+            if strategy is None:
+                self.error = self.tamper_check.error
+                return False
+            if strategy == 'apkinspector':
+                return self._analyze_lenient()
 
             self._update_progress(15, "Parsing APK Manifest (This may take a while)...")
             
@@ -147,6 +196,8 @@ class ApkAnalyzer:
             self._parsing_log_count = 0
             
             # Androguard Analysis (APK only, no DEX)
+            # Memory-mapped: only the central directory and the entries actually
+            # read are paged in, not the whole sample
             self.apk = APK(self.file_path)
             
             # Basic Info
@@ -157,138 +208,12 @@ class ApkAnalyzer:
             self.info['min_sdk'] = self.apk.get_min_sdk_version()
             self.info['target_sdk'] = self.apk.get_target_sdk_version()
             
-            self._update_progress(45, "Extracting Icon...")
-            # Icon Extraction Strategy
-            # 1. Try get_app_icon()
-            # 2. If it returns None or XML, try to search for high-res PNGs in standard locations
-            
-            try:
-                icon_path = self.apk.get_app_icon()
-                logging.getLogger('androguard').info(f"Original icon path: {icon_path}")
-                if HAS_LOGURU: loguru_logger.info(f"Original icon path: {icon_path}")
-                
-                # Check if icon is XML (Adaptive Icon) or None
-                is_valid_icon = False
-                if icon_path and not icon_path.endswith('.xml'):
-                    try:
-                        self.icon_data = self.apk.get_file(icon_path)
-                        is_valid_icon = True
-                    except:
-                        pass
-                
-                if not is_valid_icon:
-                    msg = "Attempting fallback icon search..."
-                    logging.getLogger('androguard').info(msg)
-                    if HAS_LOGURU: loguru_logger.info(msg)
-                    
-                    # Fallback Strategy: Search for PNG icons
-                    files = self.apk.get_files()
-                    
-                    # Priority list for densities
-                    densities = ['xxxhdpi', 'xxhdpi', 'xhdpi', 'hdpi', 'mdpi']
-                    
-                    # Keywords to look for
-                    icon_keywords = ['ic_launcher', 'icon', 'ic_app', 'launcher']
-                    if icon_path:
-                        # Try to use the basename of the reported icon path (even if xml)
-                        # e.g. res/mipmap-anydpi-v26/ic_launcher.xml -> ic_launcher
-                        basename = os.path.splitext(os.path.basename(icon_path))[0]
-                        icon_keywords.insert(0, basename)
-                        # Sometimes xml is ic_launcher_round, but png is ic_launcher
-                        if '_round' in basename:
-                            icon_keywords.insert(1, basename.replace('_round', ''))
-                    
-                    best_icon = None
-                    
-                    # Strategy A: Strict density + keyword match
-                    for density in densities:
-                        for keyword in icon_keywords:
-                            pattern = re.compile(f".*res/.*{density}.*/.*{keyword}.*\.png$", re.IGNORECASE)
-                            for f in files:
-                                if pattern.match(f):
-                                    best_icon = f
-                                    break
-                            if best_icon: break
-                        if best_icon: break
-                    
-                    # Strategy B: Loose match in res/ (any density, strict keyword)
-                    if not best_icon:
-                        for keyword in icon_keywords:
-                            for f in files:
-                                if f.endswith(f"/{keyword}.png"):
-                                    best_icon = f
-                                    break
-                            if best_icon: break
-
-                    # Strategy C: Desperation - ANY png with 'launcher' or 'icon' in name
-                    if not best_icon:
-                        for f in files:
-                            if f.endswith('.png') and ('launcher' in f or 'icon' in f) and 'notification' not in f:
-                                best_icon = f
-                                break
-
-                    # Strategy D: The "Big Gun" - Find the largest PNGs in the APK (heuristic)
-                    if not best_icon:
-                        msg = "Strategy D: Searching by file size..."
-                        logging.getLogger('androguard').info(msg)
-                        if HAS_LOGURU: loguru_logger.info(msg)
-                        
-                        png_files = []
-                        with zipfile.ZipFile(self.file_path, 'r') as z:
-                            for info in z.infolist():
-                                if info.filename.endswith('.png') and not info.filename.endswith('.9.png'):
-                                    if 'assets/' not in info.filename:
-                                        png_files.append(info)
-                        
-                        # Sort by size descending
-                        png_files.sort(key=lambda x: x.file_size, reverse=True)
-                        
-                        if png_files:
-                            best_icon = png_files[0].filename
-                            msg = f"Strategy D picked largest PNG: {best_icon} ({png_files[0].file_size} bytes)"
-                            logging.getLogger('androguard').info(msg)
-                            if HAS_LOGURU: loguru_logger.info(msg)
-
-                    if best_icon:
-                        msg = f"Fallback icon found: {best_icon}"
-                        logging.getLogger('androguard').info(msg)
-                        if HAS_LOGURU: loguru_logger.info(msg)
-                        self.icon_data = self.apk.get_file(best_icon)
-                    else:
-                        msg = "No fallback icon found."
-                        logging.getLogger('androguard').warning(msg)
-                        if HAS_LOGURU: loguru_logger.warning(msg)
-                    
-            except Exception as e:
-                msg = f"Error getting icon: {e}"
-                logging.getLogger('androguard').error(msg)
-                if HAS_LOGURU: loguru_logger.error(msg)
-
-            self._update_progress(60, "Analyzing Certificate...")
-            # Cert Info (Fast Way)
-            try:
-                certs = self.apk.get_certificates()
-                if certs:
-                    cert = certs[0]
-                    self.cert_info = {
-                        'serial': hex(cert.serial_number)[2:].upper(),
-                        'issuer': cert.issuer.human_friendly,
-                        'subject': cert.subject.human_friendly,
-                        'sha1': cert.sha1_fingerprint.replace(" ", ":"),
-                        'sha256': cert.sha256_fingerprint.replace(" ", ":")
-                    }
-            except Exception as e:
-                msg = f"Error getting cert info: {e}"
-                logging.getLogger('androguard').error(msg)
-                if HAS_LOGURU: loguru_logger.error(msg)
-
-            self._update_progress(80, "Checking Protection...")
-            # Protection
-            try:
-                cp = CheckProtect(self.apk)
-                self.protect_info = cp.check_protectflag()
-            except Exception as e:
-                self.protect_info = f"Check failed: {e}"
+            self._stage_done('basic', self.get_basic_info())
+
+            # Independent stages, run concurrently: the total is bounded by
+            # the slowest one rather than the sum
+            self._update_progress(45, "Extracting icon, certificate and protection...")
+            self._run_stages()
 
             # Components
             self.info['activities'] = self.apk.get_activities()
@@ -296,7 +221,9 @@ class ApkAnalyzer:
             self.info['receivers'] = self.apk.get_receivers()
             self.info['providers'] = self.apk.get_providers()
             self.info['permissions'] = self.apk.get_permissions()
+            self._stage_done('components', {key: self.info[key] for key in COMPONENT_KEYS})
 
+            self._store_to_cache()
             self._update_progress(100, "Done")
 
         except Exception as e:
@@ -305,20 +232,248 @@ class ApkAnalyzer:
             traceback.print_exc()
             return False
         finally:
-             # Clean up standard logger
-             loggers_to_hook = ['androguard', 'androguard.core.axml', 'androguard.core.apk']
-             for name in loggers_to_hook:
-                 if hasattr(self, 'log_handler'):
-                     logging.getLogger(name).removeHandler(self.log_handler)
-             
-             # Clean up loguru
-             if HAS_LOGURU and self.loguru_sink_id is not None:
-                 try:
-                     loguru_logger.remove(self.loguru_sink_id)
-                 except: pass
+            self._remove_logging()
         
         return True
 
+    def _run_stages(self):
+        stages = {
+            'icon': self._extract_icon,
+            'cert': self._extract_cert,
+            'protect': self._check_protect,
+        }
+        done = 0
+        with ThreadPoolExecutor(max_workers=STAGE_WORKERS, thread_name_prefix='ApkStage') as pool:
+            futures = {pool.submit(func): name for name, func in stages.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                payload = future.result()
+                if name == 'icon':
+                    self.icon_data = payload
+                elif name == 'cert':
+                    self.cert_info = payload
+                else:
+                    self.protect_info = payload
+                done += 1
+                self._update_progress(45 + done * 12, f"{name.capitalize()} done")
+                self._stage_done(name, payload)
+
+    def _extract_icon(self):
+        # Icon Extraction Strategy
+        # 1. Try get_app_icon()
+        # 2. If it returns None or XML, try to search for high-res PNGs in standard locations
+        icon_data = None
+        try:
+            icon_path = self.apk.get_app_icon()
+            logging.getLogger('androguard').info(f"Original icon path: {icon_path}")
+            if HAS_LOGURU: loguru_logger.info(f"Original icon path: {icon_path}")
+
+            # Check if icon is XML (Adaptive Icon) or None
+            is_valid_icon = False
+            if icon_path and not icon_path.endswith('.xml'):
+                try:
+                    icon_data = self.apk.get_file(icon_path)
+                    is_valid_icon = True
+                except:
+                    pass
+
+            if not is_valid_icon:
+                msg = "Attempting fallback icon search..."
+                logging.getLogger('androguard').info(msg)
+                if HAS_LOGURU: loguru_logger.info(msg)
+
+                # Fallback Strategy: indexed lookup over the central directory
+                resolver = IconResolver(self.apk.zip.infolist())
+                best_icon, strategy = resolver.resolve(icon_path)
+
+                if best_icon:
+                    msg = f"Fallback icon found: {best_icon} [{strategy}]"
+                    logging.getLogger('androguard').info(msg)
+                    if HAS_LOGURU: loguru_logger.info(msg)
+                    icon_data = self.apk.get_file(best_icon)
+                else:
+                    msg = "No fallback icon found."
+                    logging.getLogger('androguard').warning(msg)
+                    if HAS_LOGURU: loguru_logger.warning(msg)
+
+        except Exception as e:
+            msg = f"Error getting icon: {e}"
+            logging.getLogger('androguard').error(msg)
+            if HAS_LOGURU: loguru_logger.error(msg)
+
+
+        return icon_data
+
+    def _extract_cert(self):
+        # Cert Info (Fast Way)
+        try:
+            certs = self.apk.get_certificates()
+            if certs:
+                cert = certs[0]
+                return {
+                    'serial': hex(cert.serial_number)[2:].upper(),
+                    'issuer': cert.issuer.human_friendly,
+                    'subject': cert.subject.human_friendly,
+                    'sha1': cert.sha1_fingerprint.replace(" ", ":"),
+                    'sha256': cert.sha256_fingerprint.replace(" ", ":")
+                }
+        except Exception as e:
+            msg = f"Error getting cert info: {e}"
+            logging.getLogger('androguard').error(msg)
+            if HAS_LOGURU: loguru_logger.error(msg)
+        # Unsigned or unreadable: same empty dict as before the stages ran
+        return {}
+
+    def _check_protect(self):
+        try:
+            cp = CheckProtect(self.apk)
+            return cp.check_protectflag()
+        except Exception as e:
+            return f"Check failed: {e}"
+
+    def read_lite_header(self):
+        """
+        Package name, version and SDK levels from the first manifest chunks
+        (apkInspector lite parser). Only the central directory and the
+        manifest are read, no hashing, no full AXML decoding.
+        """
+        with ZipEntry.parse(self.file_path, False, use_mmap=True) as zipentry:
+            manifest = zipentry.read('AndroidManifest.xml')
+        attributes = get_manifest_lite(io.BytesIO(manifest), num_of_elements=LITE_MANIFEST_ELEMENTS)
+        return {
+            'package_name': attributes.get('package'),
+            'version_name': attributes.get('versionName'),
+            'version_code': attributes.get('versionCode'),
+            'min_sdk': attributes.get('minSdkVersion'),
+            'target_sdk': attributes.get('targetSdkVersion'),
+            'file_size': os.path.getsize(self.file_path),
+        }
+
+    def _emit_lite_header(self):
+        try:
+            header = self.read_lite_header()
+        except Exception as e:
+            # Malformed manifests are left to the full analysis
+            msg = f"Lite manifest parse failed: {e}"
+            logging.getLogger('androguard').warning(msg)
+            if HAS_LOGURU: loguru_logger.warning(msg)
+            return
+        self.header_callback({
+            'package': header['package_name'],
+            'version': f"{header['version_name']} ({header['version_code']})",
+            'min_sdk': header['min_sdk'],
+            'target_sdk': header['target_sdk'],
+            'size': self._format_size(header['file_size']),
+        })
+
+    def _tamper_precheck(self):
+        """
+        Run the apkInspector tampering indicators under the configured budget.
+        The result is stored in self.info['tamper'].
+
+        :returns: 'androguard', 'apkinspector', or None if the budget was exceeded
+        """
+        self.tamper_check = TamperCheck(self.file_path, self.tamper_time_budget, self.tamper_memory_budget)
+        strategy = self.tamper_check.run()
+        self.info['tamper'] = self.tamper_check.info
+        if self.tamper_check.info.get('tampered'):
+            msg = f"Tampering indicators found, using the lenient parser: {self.tamper_check.info}"
+            logging.getLogger('androguard').warning(msg)
+            if HAS_LOGURU: loguru_logger.warning(msg)
+        return strategy
+
+    def _analyze_lenient(self):
+        """
+        Analysis of a tampered APK with apkInspector only, androguard is not
+        used: manifest from the lenient AXML decoder, packer verdict from the
+        file list. Resources (app name, icon) and certificates are not resolved.
+        """
+        self._update_progress(20, "Decoding tampered manifest with apkInspector...")
+        self.info.update(self.tamper_check.get_manifest_info())
+
+        self._update_progress(80, "Checking Protection...")
+        try:
+            cp = CheckProtect(self.tamper_check)
+            self.protect_info = cp.check_protectflag()
+        except Exception as e:
+            self.protect_info = f"Check failed: {e}"
+
+        self._store_to_cache()
+        self._update_progress(100, "Done")
+        return True
+
+    def _remove_logging(self):
+        # Clean up standard logger
+        loggers_to_hook = ['androguard', 'androguard.core.axml', 'androguard.core.apk']
+        for name in loggers_to_hook:
+            if hasattr(self, 'log_handler'):
+                logging.getLogger(name).removeHandler(self.log_handler)
+
+        # Clean up loguru
+        if HAS_LOGURU and self.loguru_sink_id is not None:
+            try:
+                loguru_logger.remove(self.loguru_sink_id)
+            except: pass
+            self.loguru_sink_id = None
+
+    def quick_triage(self):
+        """
+        Fast mode: packer verdict, file list and DEX count from the central
+        directory only (no hashing, no manifest parsing). The result is stored
+        in self.info['triage'] and self.protect_info.
+        """
+        try:
+            if not os.path.exists(self.file_path):
+                self.error = "File not found"
+                return False
+
+            triage = QuickTriage(self.file_path)
+            if not triage.run():
+                self.error = triage.error
+                return False
+
+            self.info['file_size'] = triage.info['file_size']
+            self.info['triage'] = triage.info
+            self.protect_info = triage.info.get('protect', "")
+            self._update_progress(100, "Quick triage done")
+            return True
+        finally:
+            self._remove_logging()
+
+    def _load_from_cache(self):
+        if not self.cache:
+            return False
+        cached = self.cache.get(self.info['sha256'])
+        if not cached:
+            return False
+        # Keep the freshly computed file stats/hashes, restore everything else
+        cached_info = cached.get('info', {})
+        cached_info.update(self.info)
+        self.info = cached_info
+        self.cert_info = cached.get('cert_info', {})
+        self.protect_info = cached.get('protect_info', "")
+        self.icon_data = cached.get('icon_data')
+        self.from_cache = True
+        return True
+
+    def _store_to_cache(self):
+        if not self.cache:
+            return
+        self.cache.put(self.info['sha256'], {
+            'info': self.info,
+            'cert_info': self.cert_info,
+            'protect_info': self.protect_info
+        }, icon=self.icon_data)
+
+    def load_apk(self):
+        """
+        Return the androguard APK object, parsing the file if the result came
+        from the cache (e.g. when a deep scan is requested afterwards).
+        """
+        if self.apk is None:
+            self.apk = APK(self.file_path)
+        return self.apk
+
     def get_basic_info(self):
         return {
             'name': self.info.get('app_name'),
@@ -328,6 +483,8 @@ class ApkAnalyzer:
             'target_sdk': self.info.get('target_sdk'),
             'size': self._format_size(self.info.get('file_size', 0)),
             'md5': self.info.get('md5'),
+            'sha1': self.info.get('sha1'),
+            'sha256': self.info.get('sha256'),
             'protect': self.protect_info
         }
 
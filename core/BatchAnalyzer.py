@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+import json
+import time
+import base64
+import logging
+from datetime import datetime, date
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+# Ensure project root and libs are in path (workers may be spawned fresh)
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+libs_dir = os.path.join(current_dir, 'libs')
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+if libs_dir not in sys.path:
+    sys.path.insert(0, libs_dir)
+
+SUPPORTED_EXTENSIONS = ('.apk', '.ipa')
+
+
+def collect_samples(inputs, list_files=None, recursive=True):
+    """
+    Expand directories, single files and path-list files into sample paths.
+
+    :param inputs: files or directories given on the command line
+    :param list_files: text files containing one sample path per line
+    :param recursive: walk sub directories when a directory is given
+    """
+    seen = set()
+
+    def _emit(path):
+        path = os.path.abspath(path)
+        if path not in seen:
+            seen.add(path)
+            return True
+        return False
+
+    for list_file in (list_files or []):
+        with open(list_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#') and _emit(line):
+                    yield os.path.abspath(line)
+
+    for item in (inputs or []):
+        if os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                        path = os.path.join(root, name)
+                        if _emit(path):
+                            yield os.path.abspath(path)
+                if not recursive:
+                    break
+        elif _emit(item):
+            yield os.path.abspath(item)
+
+
+def _json_default(obj):
+    # plist values (IPA) may contain dates and raw data blobs
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (bytes, bytearray)):
+        return base64.b64encode(bytes(obj)).decode('ascii')
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    return str(obj)
+
+
+def to_json_line(record):
+    return json.dumps(record, ensure_ascii=False, default=_json_default)
+
+
+_worker_cache = None
+
+
+def _init_worker(verbose, cache_path=None):
+    # Androguard logs everything at DEBUG through loguru; keep workers quiet
+    try:
+        from loguru import logger as loguru_logger
+        loguru_logger.remove()
+        if verbose:
+            loguru_logger.add(sys.stderr, level="INFO")
+    except ImportError:
+        pass
+    logging.getLogger().setLevel(logging.INFO if verbose else logging.ERROR)
+
+    global _worker_cache
+    if cache_path:
+        from core.ResultCache import ResultCache
+        _worker_cache = ResultCache(cache_path)
+
+
+def _deep_scan(analyzer, sample_type, file_path, options):
+    """
+    Run the DeepScanner on an analyzed sample. Executed inside a worker process.
+
+    :param options: DeepScanner keyword arguments (macho_sections, extra_keywords)
+    """
+    from core.DeepScanner import DeepScanner
+
+    sha256 = analyzer.info.get('sha256')
+    # Cached scans were made with the default rules, custom ones are always rescanned
+    use_cache = _worker_cache is not None and sha256 and not options
+    if use_cache:
+        cached = _worker_cache.get(sha256, kind='deep_scan')
+        if cached:
+            return cached
+
+    # The batch already runs one sample per core, scan the DEX files of a sample one after the other
+    if sample_type == 'apk':
+        scanner = DeepScanner(analyzer.load_apk(), workers=1, **options)
+    else:
+        scanner = DeepScanner(ipa_path=file_path, binary_path_in_zip=analyzer.binary_path, workers=1, **options)
+    results = scanner.scan()
+    if use_cache:
+        _worker_cache.put(sha256, results, kind='deep_scan')
+    return results
+
+
+def analyze_sample(file_path, quick=False, tamper_budget=None, deep_scan=None):
+    """
+    Run the matching analyzer on one sample. Executed inside a worker process.
+
+    :param quick: central-directory-only triage instead of the full analysis
+    :param tamper_budget: (seconds, bytes) budget of the APK tamper pre-check, None for the defaults
+    :param deep_scan: DeepScanner keyword arguments to also deep scan the sample, None to skip it
+
+    :returns: a picklable record with the analysis result and worker statistics
+    """
+    from core.ApkAnalyzer import ApkAnalyzer
+    from core.IpaAnalyzer import IpaAnalyzer
+    from core.QuickTriage import QuickTriage
+
+    record = {
+        'file': file_path,
+        'type': None,
+        'ok': False,
+        'error': None,
+        'worker': os.getpid(),
+        'size': 0,
+        'elapsed': 0.0,
+    }
+    start = time.time()
+    try:
+        record['size'] = os.path.getsize(file_path)
+        lower_path = file_path.lower()
+        if quick and lower_path.endswith(SUPPORTED_EXTENSIONS):
+            record['type'] = 'apk' if lower_path.endswith('.apk') else 'ipa'
+            # Protector signatures only make sense for APKs
+            triage = QuickTriage(file_path, check_protect=(record['type'] == 'apk'))
+            if triage.run():
+                record['ok'] = True
+                record['triage'] = triage.info
+            else:
+                record['error'] = triage.error
+            return record
+
+        if lower_path.endswith('.apk'):
+            if tamper_budget:
+                analyzer = ApkAnalyzer(file_path, _worker_cache, *tamper_budget)
+            else:
+                analyzer = ApkAnalyzer(file_path, _worker_cache)
+            record['type'] = 'apk'
+        elif lower_path.endswith('.ipa'):
+            analyzer = IpaAnalyzer(file_path, _worker_cache)
+            record['type'] = 'ipa'
+        else:
+            record['error'] = "Unsupported file type"
+            return record
+
+        if analyzer.analyze():
+            record['ok'] = True
+            record['cached'] = analyzer.from_cache
+            record['basic_info'] = analyzer.get_basic_info()
+            record['info'] = analyzer.info
+            if record['type'] == 'apk':
+                record['cert_info'] = analyzer.cert_info
+            else:
+                record['details'] = analyzer.get_details()
+            if deep_scan is not None:
+                record['deep_scan'] = _deep_scan(analyzer, record['type'], file_path, deep_scan)
+        else:
+            record['error'] = analyzer.error
+    except Exception as e:
+        record['error'] = f"{type(e).__name__}: {e}"
+    finally:
+        record['elapsed'] = round(time.time() - start, 4)
+    return record
+
+
+class BatchStats:
+    def __init__(self):
+        self.start_time = time.time()
+        self.files = 0
+        self.failures = 0
+        self.bytes = 0
+        self.workers = {}
+
+    def add(self, record):
+        self.files += 1
+        self.bytes += record.get('size', 0)
+        worker = self.workers.setdefault(record.get('worker'), {
+            'files': 0, 'failures': 0, 'bytes': 0, 'busy': 0.0
+        })
+        worker['files'] += 1
+        worker['bytes'] += record.get('size', 0)
+        worker['busy'] += record.get('elapsed', 0.0)
+        if not record.get('ok'):
+            self.failures += 1
+            worker['failures'] += 1
+
+    def to_dict(self):
+        elapsed = max(time.time() - self.start_time, 1e-6)
+        return {
+            'files': self.files,
+            'failures': self.failures,
+            'bytes': self.bytes,
+            'elapsed': round(elapsed, 3),
+            'files_per_sec': round(self.files / elapsed, 3),
+            'mb_per_sec': round(self.bytes / elapsed / (1024 * 1024), 3),
+            'workers': {
+                str(pid): {
+                    'files': w['files'],
+                    'failures': w['failures'],
+                    'mb': round(w['bytes'] / (1024 * 1024), 3),
+                    'busy': round(w['busy'], 3),
+                    'utilization': round(w['busy'] / elapsed, 3),
+                }
+                for pid, w in sorted(self.workers.items(), key=lambda kv: str(kv[0]))
+            }
+        }
+
+
+class BatchAnalyzer:
+    def __init__(self, workers=None, max_pending=None, verbose=False, cache_path=None, quick=False,
+                 tamper_budget=None, deep_scan=None):
+        """
+        :param workers: number of worker processes (default: CPU count)
+        :param max_pending: max samples queued/in-flight at once (default: 2 x workers)
+        :param verbose: let androguard/analyzer logs reach stderr
+        :param cache_path: SQLite result cache shared by all workers (optional)
+        :param quick: only triage samples from their ZIP central directory
+        :param tamper_budget: (seconds, bytes) budget of the APK tamper pre-check, None for the defaults
+        :param deep_scan: DeepScanner keyword arguments to also deep scan every sample, None to skip it
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 2
+        self.verbose = verbose
+        self.cache_path = cache_path
+        self.quick = quick
+        self.tamper_budget = tamper_budget
+        self.deep_scan = deep_scan
+        self.progress_callback = None
+
+    def set_progress_callback(self, callback):
+        self.progress_callback = callback
+
+    def _create_executor(self):
+        return ProcessPoolExecutor(max_workers=self.workers,
+                                   initializer=_init_worker,
+                                   initargs=(self.verbose, self.cache_path))
+
+    def run(self, file_paths, sink):
+        """
+        Analyze all samples and hand every finished record to `sink`.
+
+        Submission is bounded by `max_pending`, so arbitrarily long path
+        iterators never pile up in the executor's queue. A worker dying (OOM,
+        crash in a native parser) breaks the whole pool: its in-flight samples
+        get an error record and a new pool takes over the rest of the batch.
+
+        :param file_paths: iterable of sample paths
+        :param sink: callable receiving one record dict per sample
+        :returns: BatchStats
+        """
+        stats = BatchStats()
+        paths = iter(file_paths)
+        pending = set()
+        futures_paths = {}
+
+        def _collect(done):
+            broken = False
+            for future in done:
+                try:
+                    record = future.result()
+                except Exception as e:
+                    # Worker died (e.g. killed by OOM) - report instead of aborting the batch
+                    broken = broken or isinstance(e, BrokenProcessPool)
+                    record = {
+                        'file': futures_paths.get(future),
+                        'type': None,
+                        'ok': False,
+                        'error': f"Worker failure: {type(e).__name__}: {e}",
+                        'worker': None,
+                        'size': 0,
+                        'elapsed': 0.0,
+                    }
+                futures_paths.pop(future, None)
+                stats.add(record)
+                sink(record)
+                if self.progress_callback:
+                    self.progress_callback(stats)
+            return broken
+
+        executor = self._create_executor()
+        try:
+            exhausted = False
+            retry = None
+            while True:
+                broken = False
+                while retry is not None or (not exhausted and len(pending) < self.max_pending):
+                    if retry is not None:
+                        path, retry = retry, None
+                    else:
+                        try:
+                            path = next(paths)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                    try:
+                        future = executor.submit(analyze_sample, path, self.quick, self.tamper_budget,
+                                                 self.deep_scan)
+                    except BrokenProcessPool:
+                        # A worker died since the last wait: this sample never ran, resubmit it
+                        # to the new pool once the in-flight ones are reported
+                        retry = path
+                        broken = True
+                        break
+                    futures_paths[future] = path
+                    pending.add(future)
+
+                if pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    broken = _collect(done) or broken
+                elif retry is None:
+                    break
+
+                if broken:
+                    # A broken pool fails all of its in-flight samples, report them and start over
+                    done, pending = wait(pending)
+                    _collect(done)
+                    executor.shutdown(wait=True)
+                    executor = self._create_executor()
+        finally:
+            executor.shutdown(wait=True)
+
+        return stats
@@ -1,20 +1,95 @@
 # -*- coding: utf-8 -*-
+import os
 import re
+import struct
 import logging
 import zipfile
-import string
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+from .StringExtractor import extract_strings, iter_stream_strings, read_macho_section_strings
+from .PatternMatcher import PatternMatcher
+from .DexReader import DexReader
 
 try:
     from androguard.core.dex import DEX
 except ImportError:
     DEX = None
 
+# Below this much DEX code, starting worker processes costs more than it saves
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _init_scan_worker():
+    # Androguard logs every parsed item at DEBUG through loguru; keep workers quiet
+    try:
+        from loguru import logger as loguru_logger
+        loguru_logger.remove()
+    except ImportError:
+        pass
+
+
+def scan_dex_strings(dex_data, matcher):
+    """
+    Classify every string of one DEX file. Module level so it can run in a
+    worker process.
+
+    :returns: {category: {value: rule}}
+    """
+    found = {}
+
+    def _add(hits):
+        for category, value, rule in hits:
+            found.setdefault(category, {}).setdefault(value, rule)
+
+    try:
+        # Only the string pool is needed: skip androguard's full DEX parsing
+        reader = DexReader(dex_data)
+        strings = reader.get_strings()
+    except (ValueError, IndexError, struct.error) as e:
+        logging.info(f"Fast DEX string reader failed ({e}), using full parser")
+        reader = None
+        if DEX:
+            # Lazy: only the string data section gets parsed
+            strings = DEX(dex_data, lazy=True).get_strings()
+        else:
+            # Fallback if androguard dex not available
+            strings = extract_strings(dex_data)
+
+    for s in strings:
+        _add(matcher.classify(s))
+
+    if reader:
+        # Fully qualified API references: 'Lpkg/Cls;->name' and 'Lpkg/Cls;'.
+        # A malformed id table only loses these, not the strings already classified
+        try:
+            for name in reader.get_method_names():
+                _add(matcher.match_api(name[1:]))
+            for name in reader.get_types():
+                if name.startswith('L') and name.endswith(';'):
+                    _add(matcher.match_api(name[1:-1]))
+        except (ValueError, IndexError, struct.error) as e:
+            logging.info(f"Unreadable DEX id tables ({e}), API references skipped")
+    return found
+
+
 class DeepScanner:
-    def __init__(self, apk_obj=None, ipa_path=None, binary_path_in_zip=None):
+    def __init__(self, apk_obj=None, ipa_path=None, binary_path_in_zip=None, macho_sections=None,
+                 extra_keywords=None, workers=None):
+        """
+        :param macho_sections: only scan these Mach-O sections of the iOS binary
+                               (e.g. ('__cstring', '__objc_methname')). The whole
+                               binary is scanned when None or when none are found.
+        :param extra_keywords: user supplied keywords added to suspicious_keywords
+        :param workers: processes used to scan multidex APKs (default: CPU count, 1 = sequential)
+        """
         self.apk = apk_obj
         self.ipa_path = ipa_path
         self.binary_path_in_zip = binary_path_in_zip
         self.is_ipa = (ipa_path is not None)
+        self.macho_sections = macho_sections
+        self.workers = workers
         
         self.results = {
             "urls": [],
@@ -23,6 +98,9 @@ class DeepScanner:
             "anti_debug": [],
             "crypto": []
         }
+        # Which rule reported each result: {category: {value: rule}}
+        self.matched_rules = {k: {} for k in self.results}
+        self.matcher = None
         
         # Regex Patterns
         self.patterns = {
@@ -36,6 +114,8 @@ class DeepScanner:
             "root", "su", "superuser", "magisk", "xposed", "frida", 
             "substrate", "hook", "proxy", "vpn", "emulator", "jailbreak", "cydia"
         ]
+        if extra_keywords:
+            self.suspicious_keywords.extend(extra_keywords)
         
         # Android Patterns
         self.android_anti_debug = [
@@ -74,6 +154,12 @@ class DeepScanner:
         ]
 
     def scan(self, progress_callback=None):
+        self.matcher = PatternMatcher(
+            self.patterns['url'].pattern,
+            self.patterns['ip'].pattern,
+            self.suspicious_keywords,
+            self._build_api_terms()
+        )
         if self.is_ipa:
             return self._scan_ipa(progress_callback)
         else:
@@ -96,33 +182,97 @@ class DeepScanner:
         if total_dex == 0:
             return self.results
 
-        for idx, dex_path in enumerate(dex_files):
+        # Progress is reported by uncompressed bytes, so one huge classes.dex
+        # doesn't look the same as a tiny secondary DEX
+        try:
+            entries = self.apk.zip.infolist()
+            sizes = {p: entries[p].uncompressed_size for p in dex_files}
+        except Exception:
+            sizes = {}
+        total_bytes = sum(sizes.values())
+        state = {'bytes': 0}
+        scanned = set()
+
+        def report(message):
             if progress_callback:
-                progress_callback(int((idx / total_dex) * 100), f"Scanning {dex_path}...")
+                if total_bytes:
+                    percent = int(state['bytes'] * 100 / total_bytes)
+                else:
+                    percent = int((len(scanned) / total_dex) * 100)
+                progress_callback(min(percent, 99), message)
+
+        def finished(dex_path, found):
+            self._merge_found(found)
+            scanned.add(dex_path)
+            state['bytes'] += sizes.get(dex_path, 0)
+            report(f"Scanned {dex_path} ({len(scanned)}/{total_dex})")
 
+        workers = min(self.workers or os.cpu_count() or 1, total_dex)
+        # Daemonic processes (e.g. batch CLI workers) are not allowed to have children
+        if workers > 1 and total_bytes >= PARALLEL_MIN_BYTES and not multiprocessing.current_process().daemon:
+            report(f"Scanning {total_dex} DEX files with {workers} processes...")
             try:
-                dex_data = self.apk.get_file(dex_path)
-                if DEX:
-                    d = DEX(dex_data)
-                    # 1. String Analysis
-                    for s in d.get_strings():
-                         self._analyze_string(s)
-                            
-                    # 2. Method/API Analysis
-                    all_strings = set(d.get_strings())
-                    self._analyze_apis(all_strings)
-                else:
-                    # Fallback if androguard dex not available
-                    strings = self._extract_strings(dex_data)
-                    for s in strings:
-                        self._analyze_string(s)
+                self._scan_dex_parallel(dex_files, workers, finished)
+            except (BrokenProcessPool, OSError) as e:
+                logging.error(f"Parallel DEX scan failed ({e}), continuing sequentially")
 
+        for dex_path in dex_files:
+            if dex_path in scanned:
+                continue
+            report(f"Scanning {dex_path}...")
+            found = {}
+            try:
+                found = scan_dex_strings(self.apk.get_file(dex_path), self.matcher)
             except Exception as e:
                 logging.error(f"Error scanning {dex_path}: {e}")
+            finished(dex_path, found)
 
         self._deduplicate()
         return self.results
 
+    def _scan_dex_parallel(self, dex_files, workers, finished):
+        """
+        Scan each DEX in its own worker process. At most 2 x workers DEX
+        buffers are in flight; partial results are handed to `finished` as
+        soon as a worker is done.
+        """
+        paths = iter(dex_files)
+        pending = {}
+        # spawn: forking a process that runs Qt threads is not safe
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_scan_worker) as executor:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < workers * 2:
+                    try:
+                        dex_path = next(paths)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    try:
+                        dex_data = self.apk.get_file(dex_path)
+                    except Exception as e:
+                        logging.error(f"Error reading {dex_path}: {e}")
+                        finished(dex_path, {})
+                        continue
+                    pending[executor.submit(scan_dex_strings, dex_data, self.matcher)] = dex_path
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dex_path = pending.pop(future)
+                    try:
+                        found = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        logging.error(f"Error scanning {dex_path}: {e}")
+                        found = {}
+                    finished(dex_path, found)
+
     def _scan_ipa(self, progress_callback):
         if not self.ipa_path:
             return self.results
@@ -224,23 +374,19 @@ class DeepScanner:
                     if progress_callback:
                         progress_callback(10, f"Scanning binary {target_binary_info.filename}...")
                     
+                    total = target_binary_info.file_size or 1
+
+                    def on_bytes(consumed, total=total):
+                        if progress_callback:
+                            percent = min(int(consumed * 100 / total), 100)
+                            progress_callback(10 + int(percent * 0.8), f"Analyzing strings... ({percent}%)")
+
+                    # Stream the binary: extraction, classification and API
+                    # matching happen per string, nothing is materialized
                     with z.open(target_binary_info) as f:
-                        data = f.read()
-                        # Extract strings from binary
-                        strings_gen = self._extract_strings(data)
-                        
-                        # Convert generator to list to get length
-                        string_list = list(strings_gen)
-                        total = len(string_list)
-                        
-                        for i, s in enumerate(string_list):
-                            if i % 5000 == 0 and progress_callback and total > 0:
-                                progress_callback(int((i / total) * 90), "Analyzing strings...")
+                        for s in self._iter_binary_strings(f, on_bytes):
                             self._analyze_string(s)
-                        
-                        # Simple API check via strings presence
-                        self._analyze_apis(set(string_list))
-                            
+
                 else:
                     logging.error(f"Binary {self.binary_path_in_zip} not found in zip (Encoding issue?)")
 
@@ -250,40 +396,45 @@ class DeepScanner:
         self._deduplicate()
         return self.results
 
-    def _extract_strings(self, data, min_length=4):
+    def _iter_binary_strings(self, f, on_bytes=None, min_length=4):
         """
-        Extract printable strings from binary data
+        Stream strings out of the (seekable) binary file object f
         """
-        result = ""
-        for b in data:
-            c = chr(b)
-            if c in string.printable:
-                result += c
-            else:
-                if len(result) >= min_length:
-                    yield result
-                result = ""
-        if len(result) >= min_length:
-            yield result
+        if self.macho_sections:
+            found = False
+            for s in read_macho_section_strings(f, self.macho_sections, min_length, on_bytes):
+                found = True
+                yield s
+            if found:
+                return
+            logging.info("Requested Mach-O sections not found, scanning the whole binary")
+            f.seek(0)
+        yield from iter_stream_strings(f, min_length, progress_callback=on_bytes)
 
     def _analyze_string(self, s):
-        # Check URL
-        if self.patterns['url'].match(s):
-            self.results['urls'].append(s)
-        # Check IP
-        elif self.patterns['ip'].match(s) and not s.startswith("0."):
-            self.results['ips'].append(s)
-        
-        # Check Keywords
-        s_lower = s.lower()
-        for kw in self.suspicious_keywords:
-            if kw in s_lower:
-                # Store only the string content, not the keyword prefix
-                # We can append the keyword as metadata if needed, but user requested clean string
-                self.results['sensitive_strings'].append(s)
-                break # Avoid adding same string multiple times if it matches multiple keywords
-
-    def _analyze_apis(self, all_strings):
+        # URL / IP / keyword / API rules are all checked by the compiled matcher
+        for category, value, rule in self.matcher.classify(s):
+            rules = self.matched_rules[category]
+            if value not in rules:
+                rules[value] = rule
+                self.results[category].append(value)
+
+    def _merge_found(self, found):
+        """
+        Merge {category: {value: rule}} partial results (e.g. from a worker process)
+        """
+        for category, rules in found.items():
+            known = self.matched_rules[category]
+            for value, rule in rules.items():
+                if value not in known:
+                    known[value] = rule
+                    self.results[category].append(value)
+
+    def _build_api_terms(self):
+        """
+        Map the searched term of every API pattern to its (category, api) pairs,
+        so each extracted string is checked with a single dict lookup.
+        """
         if self.is_ipa:
             target_anti_debug = self.ios_anti_debug
             target_crypto = self.ios_crypto
@@ -291,18 +442,22 @@ class DeepScanner:
             target_anti_debug = self.android_anti_debug
             target_crypto = self.android_crypto
 
+        api_terms = {}
         for api in target_anti_debug:
             # Loose check
             parts = api.split('->')
             term = parts[-1] if len(parts) > 1 else api
-            if term in all_strings:
-                 self.results['anti_debug'].append(api)
-        
+            api_terms.setdefault(term, []).append(('anti_debug', api))
+            if term != api:
+                # Exact name, matched against DEX method / type tables
+                api_terms.setdefault(api, []).append(('anti_debug', api))
+
         for api in target_crypto:
-             parts = api.split('/')
-             term = parts[-1]
-             if term in all_strings:
-                 self.results['crypto'].append(api)
+            term = api.split('/')[-1]
+            api_terms.setdefault(term, []).append(('crypto', api))
+            if term != api:
+                api_terms.setdefault(api, []).append(('crypto', api))
+        return api_terms
 
     def _deduplicate(self):
         for k in self.results:
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+import re
+import sys
+import struct
+from array import array
+
+try:
+    from mutf8 import decode_modified_utf8
+except ImportError:
+    decode_modified_utf8 = None
+
+DEX_MAGIC = b'dex\n'
+
+# header_item: magic, checksum, signature, then 20 uint sizes/offsets (0x70 bytes)
+DEX_HEADER = struct.Struct('<8sI20s20I')
+DEX_HEADER_FIELDS = (
+    'file_size', 'header_size', 'endian_tag', 'link_size', 'link_off', 'map_off',
+    'string_ids_size', 'string_ids_off', 'type_ids_size', 'type_ids_off',
+    'proto_ids_size', 'proto_ids_off', 'field_ids_size', 'field_ids_off',
+    'method_ids_size', 'method_ids_off', 'class_defs_size', 'class_defs_off',
+    'data_size', 'data_off',
+)
+ENDIAN_CONSTANT = 0x12345678
+
+METHOD_ID = struct.Struct('<HHI')
+
+
+# Lead bytes of 4-byte UTF-8 sequences. MUTF-8 never uses them, it encodes
+# supplementary characters as surrogate pairs
+_FOUR_BYTE_LEAD = re.compile(b'[\xf0-\xf4]')
+
+
+def _decode_mutf8(raw):
+    # MUTF-8 only differs from UTF-8 for U+0000 (C0 80) and supplementary
+    # characters (surrogate pairs), both invalid in strict UTF-8, and for
+    # 4-byte sequences, valid UTF-8 but invalid MUTF-8. So without a 4-byte
+    # lead byte, a successful UTF-8 decode is exactly the MUTF-8 result.
+    if raw.isascii():
+        # The string data ends at the first NUL, plain ASCII is valid MUTF-8
+        return raw.decode('ascii')
+    if not _FOUR_BYTE_LEAD.search(raw):
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+    if decode_modified_utf8:
+        try:
+            return decode_modified_utf8(raw)
+        except (UnicodeDecodeError, RuntimeError):
+            # RuntimeError: 4-byte sequences
+            pass
+    # Malformed string: everything that is not MUTF-8 becomes U+FFFD,
+    # 4-byte sequences included
+    return _FOUR_BYTE_LEAD.sub(b'\xff', raw).decode('utf-8', 'replace')
+
+
+def _uint_array(data, offset, count):
+    table = array('I')
+    if count:
+        table.frombytes(data[offset:offset + count * 4])
+        if sys.byteorder == 'big':
+            table.byteswap()
+    return table
+
+
+class DexReader:
+    """
+    Reads the string pool (and the type / method id tables) straight from a
+    DEX buffer, without building androguard's full DEX object (map list,
+    class defs, code items, debug info...). Used by DeepScanner, which only
+    needs the strings.
+    """
+
+    def __init__(self, data):
+        """
+        :param data: the DEX file content (bytes-like)
+        :raises ValueError: if data is not a little-endian DEX file
+        """
+        self.data = data
+        if len(data) < DEX_HEADER.size or bytes(data[:4]) != DEX_MAGIC:
+            raise ValueError("Not a DEX file")
+
+        fields = DEX_HEADER.unpack_from(data, 0)
+        self.magic = fields[0]
+        self.header = dict(zip(DEX_HEADER_FIELDS, fields[3:]))
+        if self.header['endian_tag'] != ENDIAN_CONSTANT:
+            raise ValueError("Unsupported DEX endianness")
+
+        for name in ('string_ids', 'type_ids'):
+            end = self.header[name + '_off'] + self.header[name + '_size'] * 4
+            if end > len(data):
+                raise ValueError(f"Truncated DEX {name} table")
+        end = self.header['method_ids_off'] + self.header['method_ids_size'] * METHOD_ID.size
+        if end > len(data):
+            raise ValueError("Truncated DEX method_ids table")
+
+        self.string_offsets = _uint_array(data, self.header['string_ids_off'], self.header['string_ids_size'])
+        self._strings = None
+        self._types = None
+
+    def _read_string(self, off):
+        data = self.data
+        # uleb128 utf16_size: nearly always a single byte
+        pos = off + 1
+        if data[off] & 0x80:
+            while data[pos] & 0x80:
+                pos += 1
+            pos += 1
+        end = data.find(b'\x00', pos)
+        if end < 0:
+            end = len(data)
+        return _decode_mutf8(bytes(data[pos:end]))
+
+    def iter_strings(self):
+        """
+        Yield every string of the string pool, in string_ids order
+        """
+        if self._strings is not None:
+            yield from self._strings
+            return
+        read = self._read_string
+        for off in self.string_offsets:
+            yield read(off)
+
+    def get_strings(self):
+        """
+        :returns: list of all strings (decoded once and cached)
+        """
+        if self._strings is None:
+            self._strings = list(self.iter_strings())
+        return self._strings
+
+    def get_string(self, idx):
+        if self._strings is not None:
+            return self._strings[idx]
+        return self._read_string(self.string_offsets[idx])
+
+    def get_types(self):
+        """
+        :returns: list of type descriptors (e.g. 'Landroid/os/Debug;')
+        """
+        if self._types is None:
+            type_ids = _uint_array(self.data, self.header['type_ids_off'], self.header['type_ids_size'])
+            self._types = [self.get_string(idx) for idx in type_ids]
+        return self._types
+
+    def get_method_names(self):
+        """
+        :returns: list of 'Lclass;->name' for every method_id (proto omitted)
+        """
+        types = self.get_types()
+        off = self.header['method_ids_off']
+        size = self.header['method_ids_size'] * METHOD_ID.size
+        return [
+            f"{types[class_idx]}->{self.get_string(name_idx)}"
+            for class_idx, _proto_idx, name_idx in METHOD_ID.iter_unpack(self.data[off:off + size])
+        ]
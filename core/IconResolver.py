@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import os
+
+# Highest density first
+DENSITIES = ('xxxhdpi', 'xxhdpi', 'xhdpi', 'hdpi', 'mdpi')
+DENSITY_RANK = {density: rank for rank, density in enumerate(DENSITIES)}
+
+ICON_KEYWORDS = ('ic_launcher', 'icon', 'ic_app', 'launcher')
+ICON_EXTENSIONS = ('.png', '.webp')
+
+
+class IconResolver:
+    """
+    Fallback icon lookup when the manifest icon is missing or is an XML
+    (adaptive) drawable.
+
+    The central directory is walked once to index the res/ bitmaps by
+    (basename, density) with their uncompressed size. Candidates are then
+    dict lookups, and among several files for the same candidate the
+    largest one wins. Nothing is decompressed and the APK is not reopened.
+    """
+
+    def __init__(self, entries):
+        """
+        :param entries: central directory {filename: entry}, e.g. ZipEntry.infolist()
+        """
+        # {(basename, density): (size, filename)}, density is None for
+        # unqualified / anydpi / obfuscated (res/a1.png) directories
+        self.index = {}
+        # {basename: (density rank, size, filename)} best file per basename
+        self.best_by_name = {}
+        # Largest bitmap outside assets/, whatever its name
+        self.largest = None
+
+        index = self.index
+        best_by_name = self.best_by_name
+        unranked = len(DENSITIES)
+        largest_size = -1
+        largest_name = None
+        for filename, entry in entries.items():
+            lower = filename.lower()
+            if not lower.endswith(ICON_EXTENSIONS) or lower.endswith('.9.png') or lower.startswith('assets/'):
+                continue
+            size = entry.uncompressed_size
+            if size > largest_size:
+                largest_size, largest_name = size, filename
+            if not lower.startswith('res/'):
+                continue
+
+            directory, _, basename = lower.rpartition('/')
+            basename = basename.rpartition('.')[0]
+            density = None
+            rank = unranked
+            if directory != 'res':
+                for qualifier in directory[4:].split('-'):
+                    if qualifier in DENSITY_RANK:
+                        density = qualifier
+                        rank = DENSITY_RANK[qualifier]
+                        break
+
+            key = (basename, density)
+            found = index.get(key)
+            if found is None or size > found[0]:
+                index[key] = (size, filename)
+            best = best_by_name.get(basename)
+            if best is None or rank < best[0] or (rank == best[0] and size > best[1]):
+                best_by_name[basename] = (rank, size, filename)
+        if largest_name is not None:
+            self.largest = (largest_size, largest_name)
+
+    @staticmethod
+    def keywords(icon_path=None):
+        keywords = list(ICON_KEYWORDS)
+        if icon_path:
+            # Try to use the basename of the reported icon path (even if xml)
+            # e.g. res/mipmap-anydpi-v26/ic_launcher.xml -> ic_launcher
+            basename = os.path.splitext(os.path.basename(icon_path))[0].lower()
+            keywords.insert(0, basename)
+            # Sometimes xml is ic_launcher_round, but png is ic_launcher
+            if '_round' in basename:
+                keywords.insert(1, basename.replace('_round', ''))
+        return keywords
+
+    def resolve(self, icon_path=None):
+        """
+        :param icon_path: the icon reported by the manifest, if any
+        :returns: (filename, strategy) of the best candidate, or (None, None)
+        """
+        keywords = self.keywords(icon_path)
+
+        # Exact name, highest density first
+        for density in DENSITIES:
+            for keyword in keywords:
+                found = self.index.get((keyword, density))
+                if found:
+                    return found[1], f'{keyword} ({density})'
+
+        # Exact name, any density (drawable/, anydpi, ...)
+        for keyword in keywords:
+            found = self.best_by_name.get(keyword)
+            if found:
+                return found[2], keyword
+
+        # Any name containing one of the keywords (ic_launcher_foreground, app_icon...)
+        matches = [
+            best for basename, best in self.best_by_name.items()
+            if 'notification' not in basename and any(keyword in basename for keyword in keywords)
+        ]
+        if matches:
+            return min(matches, key=lambda best: (best[0], -best[1]))[2], 'keyword match'
+
+        # Largest bitmap of the APK
+        if self.largest:
+            return self.largest[1], f'largest bitmap ({self.largest[0]} bytes)'
+        return None, None
@@ -2,7 +2,6 @@
 import zipfile
 import plistlib
 import os
-import hashlib
 import sys
 import struct
 from datetime import datetime
@@ -15,9 +14,13 @@ if libs_dir not in sys.path:
 
 from asn1crypto import cms
 
+from .SampleHasher import SampleHasher
+
 class IpaAnalyzer:
-    def __init__(self, file_path):
+    def __init__(self, file_path, cache=None):
         self.file_path = file_path
+        self.cache = cache # Optional ResultCache
+        self.from_cache = False
         self.info = {}
         self.provision = {}
         self.icon_data = None
@@ -110,25 +113,12 @@ class IpaAnalyzer:
                  
         return best_candidate
 
-    def _calculate_md5_chunked(self, path):
-        hash_md5 = hashlib.md5()
-        file_size = os.path.getsize(path)
-        read_size = 0
-        chunk_size = 8192  # 8KB chunks
-        
-        with open(path, "rb") as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    break
-                hash_md5.update(chunk)
-                read_size += len(chunk)
-                
-                # Progress 0-10%
-                percent = int((read_size / file_size) * 10)
-                self._update_progress(percent, f"Calculating MD5... ({int((read_size/file_size)*100)}%)")
-        
-        return hash_md5.hexdigest().upper()
+    def _calculate_hashes(self, path):
+        # MD5 / SHA-1 / SHA-256 in one pass. The content is not kept: the zip
+        # reader opens the same file, so its pages are served from the page cache
+        hasher = SampleHasher(path)
+        hasher.set_progress_callback(self.progress_callback)
+        return hasher.run(0, 10)
 
     def analyze(self):
         if not os.path.exists(self.file_path):
@@ -136,13 +126,21 @@ class IpaAnalyzer:
             return False
 
         try:
-            self._update_progress(0, "Calculating MD5...")
+            self._update_progress(0, "Calculating hashes...")
             # File Stats
             stat = os.stat(self.file_path)
             self.info['file_size'] = stat.st_size
             
-            # Chunked MD5
-            self.info['md5'] = self._calculate_md5_chunked(self.file_path)
+            # Single-pass MD5 / SHA-1 / SHA-256
+            digests = self._calculate_hashes(self.file_path)
+            self.info['md5'] = digests['md5']
+            self.info['sha1'] = digests['sha1']
+            self.info['sha256'] = digests['sha256']
+
+            # Cache hit: skip parsing entirely
+            if self._load_from_cache():
+                self._update_progress(100, "Loaded from cache")
+                return True
 
             self._update_progress(10, "Reading IPA Structure...")
             with zipfile.ZipFile(self.file_path, 'r') as z:
@@ -272,6 +270,7 @@ class IpaAnalyzer:
                         except KeyError:
                             continue
             
+            self._store_to_cache()
             self._update_progress(100, "Done")
 
         except Exception as e:
@@ -282,6 +281,33 @@ class IpaAnalyzer:
         
         return True
 
+    def _load_from_cache(self):
+        if not self.cache:
+            return False
+        cached = self.cache.get(self.info['sha256'])
+        if not cached:
+            return False
+        # Keep the freshly computed file stats/hashes, restore everything else
+        cached_info = cached.get('info', {})
+        cached_info.update(self.info)
+        self.info = cached_info
+        self.provision = cached.get('provision', {})
+        self.is_encrypted = cached.get('is_encrypted', False)
+        self.binary_path = cached.get('binary_path')
+        self.icon_data = cached.get('icon_data')
+        self.from_cache = True
+        return True
+
+    def _store_to_cache(self):
+        if not self.cache:
+            return
+        self.cache.put(self.info['sha256'], {
+            'info': self.info,
+            'provision': self.provision,
+            'is_encrypted': self.is_encrypted,
+            'binary_path': self.binary_path
+        }, icon=self.icon_data)
+
     def _check_cryptid(self, f):
         """
         Check LC_ENCRYPTION_INFO or LC_ENCRYPTION_INFO_64 load commands in Mach-O binary.
@@ -429,6 +455,8 @@ class IpaAnalyzer:
             'target_sdk': 'N/A', 
             'size': self._format_size(self.info.get('file_size', 0)),
             'md5': self.info.get('md5'),
+            'sha1': self.info.get('sha1'),
+            'sha256': self.info.get('sha256'),
             'protect': protect_status
         }
     
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import re
+
+
+def build_trie_regex(words):
+    """
+    Build a regex source matching any of `words`, shaped as a prefix trie
+    (e.g. ['hook', 'host', 'root'] -> '(?:ho(?:ok|st)|root)').
+
+    Unlike a flat 'w1|w2|...' alternation, the engine only follows branches
+    that share the current prefix, so the cost per position grows with the
+    keyword length rather than the number of keywords.
+    """
+    trie = {}
+    for word in words:
+        if not word:
+            continue
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = True
+
+    def _build(node):
+        alternatives = [re.escape(ch) + _build(child) for ch, child in sorted(node.items()) if ch != '']
+        if not alternatives:
+            return ''
+        if len(alternatives) == 1:
+            body = alternatives[0]
+        else:
+            body = '(?:' + '|'.join(alternatives) + ')'
+        if '' in node:
+            # A keyword ends here but longer ones continue: prefer the longer match
+            body = '(?:' + body + ')?'
+        return body
+
+    return _build(trie)
+
+
+class PatternMatcher:
+    """
+    Classifies a string against all DeepScanner rules in one pass:
+
+    - one anchored regex combining the URL and IP rules (named groups)
+    - one trie regex for all suspicious keywords, run on the lower-cased string
+    - one dict lookup for the API terms
+
+    The matcher is built once per scan; its cost per string grows with the
+    keyword length rather than the keyword count, so thousands of user
+    supplied keywords stay cheap.
+    """
+
+    def __init__(self, url_pattern, ip_pattern, keywords, api_terms):
+        """
+        :param url_pattern: regex source of the URL rule
+        :param ip_pattern: regex source of the IP rule
+        :param keywords: suspicious keywords (matched case-insensitively as substrings)
+        :param api_terms: dict mapping an exact string to a list of (category, api)
+        """
+        self.network_re = re.compile(f'(?P<url>{url_pattern})|(?P<ip>{ip_pattern})')
+        keywords = sorted(set(kw.lower() for kw in keywords if kw))
+        # Matching the lower-cased string is much faster than re.IGNORECASE
+        self.keyword_re = re.compile(build_trie_regex(keywords)) if keywords else None
+        self.api_terms = api_terms
+
+    def classify(self, s):
+        """
+        :returns: list of (category, value, rule) for every rule matching `s`.
+                  value is what gets reported (the string itself, or the API
+                  name for API rules); rule names the rule that fired.
+        """
+        hits = []
+
+        m = self.network_re.match(s)
+        if m:
+            if m.lastgroup == 'url':
+                hits.append(('urls', s, 'url'))
+            elif not s.startswith("0."):
+                hits.append(('ips', s, 'ip'))
+
+        if self.keyword_re:
+            m = self.keyword_re.search(s.lower())
+            if m:
+                hits.append(('sensitive_strings', s, 'keyword:' + m.group()))
+
+        hits.extend(self.match_api(s))
+        return hits
+
+    def match_api(self, name):
+        """
+        Only apply the API rules, e.g. to method / type names from a DEX id table.
+
+        :returns: list of (category, api, rule)
+        """
+        apis = self.api_terms.get(name)
+        if not apis:
+            return []
+        return [(category, api, 'api:' + name) for category, api in apis]
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+import os
+import re
+import sys
+import time
+
+try:
+    from CheckProtect import CheckProtect
+except ImportError:
+    current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if current_dir not in sys.path:
+        sys.path.insert(0, current_dir)
+    from CheckProtect import CheckProtect
+
+from apkInspector.headers import EndOfCentralDirectoryRecord, CentralDirectory
+
+# DEX files loaded by the runtime (classes.dex, classes2.dex, ...)
+DEX_NAME_RE = re.compile(r'^classes\d*\.dex$')
+
+
+class QuickTriage:
+    """
+    Triage of an APK/IPA from the ZIP central directory only.
+
+    The End-Of-Central-Directory record is located by seeking from the tail
+    of the file, then only the central directory is read. No hashing, no
+    local headers, no manifest parsing: the cost depends on the number of
+    entries, not on the size of the sample.
+    """
+
+    def __init__(self, file_path, check_protect=True):
+        """
+        :param file_path: path of the sample
+        :param check_protect: run the protector signatures (APK only)
+        """
+        self.file_path = file_path
+        self.check_protect = check_protect
+        self.entries = {}
+        self.info = {}
+        self.error = None
+
+    def get_files(self):
+        # Same interface as androguard's APK.get_files(), for CheckProtect
+        return list(self.entries)
+
+    def run(self):
+        start = time.time()
+        try:
+            with open(self.file_path, 'rb') as f:
+                eocd = EndOfCentralDirectoryRecord.parse(f)
+                self.entries = CentralDirectory.parse(f, eocd).entries
+        except Exception as e:
+            self.error = f"Failed to read the central directory: {e}"
+            return False
+
+        files = [
+            {
+                'name': name,
+                'size': entry.uncompressed_size,
+                'compressed_size': entry.compressed_size,
+                'compression': entry.compression_method,
+            }
+            for name, entry in self.entries.items()
+        ]
+        dex_files = [name for name in self.entries if DEX_NAME_RE.match(name)]
+
+        self.info = {
+            'file_size': os.path.getsize(self.file_path),
+            'entry_count': len(files),
+            'uncompressed_size': sum(f['size'] for f in files),
+            'dex_count': len(dex_files),
+            'dex_files': sorted(dex_files),
+            'files': files,
+        }
+
+        if self.check_protect:
+            cp = CheckProtect(self)
+            self.info['protectors'] = cp.get_protectors()
+            self.info['protect'] = cp.check_protectflag()
+
+        self.info['elapsed'] = round(time.time() - start, 4)
+        return True
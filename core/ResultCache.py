@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import time
+import zlib
+import base64
+import sqlite3
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+# Version of the payload stored for each kind. Bump a kind whenever its analyzer
+# changes what it stores, so stale entries are ignored:
+#   analysis  2: tamper pre-check results in info['tamper']
+#   deep_scan 2: matcher-deduplicated categories, DEX API matches, multidex merge
+PAYLOAD_VERSIONS = {
+    'analysis': 2,
+    'deep_scan': 2,
+}
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".apkdetecter", "cache.sqlite3")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_signatures_digest = None
+_signatures_lock = threading.Lock()
+
+
+def get_signatures_digest():
+    """
+    SHA-256 of Resources/signatures.json, computed once per process.
+    Editing the signature DB therefore invalidates cached protection verdicts.
+    """
+    global _signatures_digest
+    with _signatures_lock:
+        if _signatures_digest is None:
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            json_path = os.path.join(base_dir, 'Resources', 'signatures.json')
+            try:
+                with open(json_path, 'rb') as f:
+                    _signatures_digest = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                _signatures_digest = "none"
+        return _signatures_digest
+
+
+def _json_default(obj):
+    # plist values (IPA) contain dates and raw data; tag them so they round-trip
+    if isinstance(obj, datetime):
+        return {"__datetime__": obj.isoformat()}
+    if isinstance(obj, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(bytes(obj)).decode('ascii')}
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def _json_object_hook(obj):
+    if len(obj) == 1:
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        if "__bytes__" in obj:
+            return base64.b64decode(obj["__bytes__"])
+    return obj
+
+
+class ResultCache:
+    """
+    On-disk cache of analysis results, keyed by the SHA-256 of the sample plus
+    the PAYLOAD_VERSIONS entry of the kind and the signatures.json digest. Payloads are stored as
+    zlib-compressed JSON in SQLite; the least recently used rows are evicted
+    once the total stored size exceeds `max_bytes`.
+    """
+
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path or os.environ.get("APKDETECTER_CACHE") or DEFAULT_CACHE_PATH
+        self.max_bytes = max_bytes
+        cache_dir = os.path.dirname(os.path.abspath(self.path))
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " kind TEXT NOT NULL,"
+                " payload BLOB NOT NULL,"
+                " icon BLOB,"
+                " size INTEGER NOT NULL,"
+                " created REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_access ON results (last_access)")
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per operation: safe across Qt threads and batch workers
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def make_key(self, sha256, kind):
+        return f"{sha256.lower()}:{kind}:{PAYLOAD_VERSIONS.get(kind, 1)}:{get_signatures_digest()}"
+
+    def get(self, sha256, kind='analysis'):
+        """
+        :returns: the stored payload dict (with the icon bytes under 'icon_data') or None
+        """
+        key = self.make_key(sha256, kind)
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT payload, icon FROM results WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.Error as e:
+            logging.error(f"Result cache read failed: {e}")
+            return None
+
+        try:
+            payload = json.loads(zlib.decompress(row[0]).decode('utf-8'), object_hook=_json_object_hook)
+        except (zlib.error, ValueError) as e:
+            logging.error(f"Corrupted result cache entry {key}: {e}")
+            self.delete(sha256, kind)
+            return None
+        payload['icon_data'] = row[1]
+        return payload
+
+    def put(self, sha256, payload, kind='analysis', icon=None):
+        key = self.make_key(sha256, kind)
+        blob = zlib.compress(
+            json.dumps(payload, ensure_ascii=False, default=_json_default).encode('utf-8'), 6
+        )
+        size = len(blob) + (len(icon) if icon else 0)
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, kind, payload, icon, size, created, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, kind, blob, icon, size, now, now)
+                )
+            self.evict()
+        except sqlite3.Error as e:
+            logging.error(f"Result cache write failed: {e}")
+
+    def delete(self, sha256, kind='analysis'):
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM results WHERE key = ?", (self.make_key(sha256, kind),))
+        except sqlite3.Error as e:
+            logging.error(f"Result cache delete failed: {e}")
+
+    def evict(self):
+        """
+        Drop least recently used entries until the cache is below 90% of max_bytes.
+        """
+        with self._connect() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            target = int(self.max_bytes * 0.9)
+            for key, size in conn.execute("SELECT key, size FROM results ORDER BY last_access ASC").fetchall():
+                if total <= target:
+                    break
+                conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                total -= size
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results")
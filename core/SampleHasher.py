@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import os
+import mmap
+import hashlib
+
+
+class SampleHasher:
+    """
+    Reads a sample exactly once: MD5, SHA-1 and SHA-256 are updated from the
+    same memory-mapped chunk. The content is not kept: the APK/IPA parsers open
+    the same file afterwards, so its pages are served from the page cache.
+    """
+    ALGORITHMS = ('md5', 'sha1', 'sha256')
+
+    def __init__(self, file_path, chunk_size=1024 * 1024):
+        """
+        :param file_path: path of the sample
+        :param chunk_size: bytes hashed per step (also the progress granularity)
+        """
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.digests = {}
+        self.progress_callback = None
+
+    def set_progress_callback(self, callback):
+        self.progress_callback = callback
+
+    def run(self, progress_min=0, progress_max=10):
+        """
+        Hash the sample, reporting progress in the range [progress_min, progress_max].
+        The callback only fires when the integer percentage changes, so at most
+        ~100 updates are sent regardless of the sample size.
+
+        :returns: dict of upper-case hex digests keyed by algorithm name
+        """
+        hashers = [hashlib.new(name) for name in self.ALGORITHMS]
+        file_size = os.path.getsize(self.file_path)
+        last_percent = -1
+
+        # mmap refuses empty files, which hash to the initial digests
+        if file_size:
+            with open(self.file_path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    view = memoryview(mm)
+                    try:
+                        for offset in range(0, file_size, self.chunk_size):
+                            chunk = view[offset:offset + self.chunk_size]
+                            for h in hashers:
+                                h.update(chunk)
+                            chunk.release()
+
+                            percent = int(min(offset + self.chunk_size, file_size) * 100 / file_size)
+                            if percent != last_percent:
+                                last_percent = percent
+                                self._update_progress(
+                                    progress_min + int(percent * (progress_max - progress_min) / 100),
+                                    f"Calculating hashes... ({percent}%)"
+                                )
+                    finally:
+                        view.release()
+                finally:
+                    mm.close()
+
+        self.digests = {name: h.hexdigest().upper() for name, h in zip(self.ALGORITHMS, hashers)}
+        return self.digests
+
+    def _update_progress(self, value, message=""):
+        if self.progress_callback:
+            self.progress_callback(value, message)
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""
+Printable string extraction for binaries (Mach-O, DEX fallback).
+
+All scanning is done by compiled regular expressions running over the raw
+buffer (bytes / memoryview / mmap), so no Python code runs per byte.
+"""
+import re
+import struct
+
+DEFAULT_MIN_LENGTH = 4
+
+# Mach-O sections that hold NUL-terminated C strings
+DEFAULT_MACHO_SECTIONS = ('__cstring', '__objc_methname')
+
+MH_MAGIC = 0xfeedface
+MH_CIGAM = 0xcefaedfe
+MH_MAGIC_64 = 0xfeedfacf
+MH_CIGAM_64 = 0xcffaedfe
+FAT_MAGIC = 0xcafebabe
+FAT_MAGIC_64 = 0xcafebabf
+
+LC_SEGMENT = 0x1
+LC_SEGMENT_64 = 0x19
+
+_ascii_patterns = {}
+_utf16_patterns = {}
+
+
+def _ascii_pattern(min_length):
+    pattern = _ascii_patterns.get(min_length)
+    if pattern is None:
+        pattern = re.compile(rb'[\x20-\x7e\t\n\r]{%d,}' % min_length)
+        _ascii_patterns[min_length] = pattern
+    return pattern
+
+
+def _utf16_pattern(min_length):
+    pattern = _utf16_patterns.get(min_length)
+    if pattern is None:
+        # Unrolled prefix: a literal sequence is much cheaper for the regex
+        # engine to reject than a repeated group at every start position
+        char = rb'[\x20-\x7e\t\n\r]\x00'
+        pattern = re.compile(char * min_length + rb'(?:' + char + rb')*')
+        _utf16_patterns[min_length] = pattern
+    return pattern
+
+
+def extract_ascii(data, min_length=DEFAULT_MIN_LENGTH):
+    """
+    Yield runs of printable ASCII (plus tab/newline/CR) of at least min_length chars.
+
+    :param data: bytes-like object (bytes, bytearray, memoryview, mmap)
+    """
+    for m in _ascii_pattern(min_length).finditer(data):
+        yield m.group().decode('ascii')
+
+
+def extract_utf16le(data, min_length=DEFAULT_MIN_LENGTH):
+    """
+    Yield UTF-16LE encoded printable strings (e.g. NSString literals, wide char tables).
+    """
+    for m in _utf16_pattern(min_length).finditer(data):
+        yield m.group().decode('utf-16-le')
+
+
+def extract_strings(data, min_length=DEFAULT_MIN_LENGTH, utf16=True):
+    """
+    Yield ASCII strings followed by UTF-16LE strings found in data.
+    """
+    yield from extract_ascii(data, min_length)
+    if utf16:
+        yield from extract_utf16le(data, min_length)
+
+
+def _macho_slices(data):
+    """
+    Return the (offset, size) of every thin Mach-O image in data (fat or thin).
+    """
+    if len(data) < 8:
+        return []
+    magic = struct.unpack_from('>I', data, 0)[0]
+    if magic in (FAT_MAGIC, FAT_MAGIC_64):
+        nfat_arch = struct.unpack_from('>I', data, 4)[0]
+        # Java class files share the 0xcafebabe magic; their "count" is huge
+        if nfat_arch > 32:
+            return []
+        slices = []
+        entry_size = 32 if magic == FAT_MAGIC_64 else 20
+        for i in range(nfat_arch):
+            pos = 8 + i * entry_size
+            if magic == FAT_MAGIC_64:
+                offset, size = struct.unpack_from('>QQ', data, pos + 8)
+            else:
+                offset, size = struct.unpack_from('>II', data, pos + 8)
+            slices.append((offset, size))
+        return slices
+    return [(0, len(data))]
+
+
+def _parse_macho_header(data, base):
+    """
+    :returns: (endian, is_64, ncmds, sizeofcmds, header size) for the Mach-O image at base, or None
+    """
+    if base + 28 > len(data):
+        return None
+    magic = struct.unpack_from('<I', data, base)[0]
+    if magic == MH_MAGIC:
+        endian, is_64 = '<', False
+    elif magic == MH_CIGAM:
+        endian, is_64 = '>', False
+    elif magic == MH_MAGIC_64:
+        endian, is_64 = '<', True
+    elif magic == MH_CIGAM_64:
+        endian, is_64 = '>', True
+    else:
+        return None
+    ncmds, sizeofcmds = struct.unpack_from(endian + 'II', data, base + 16)
+    return endian, is_64, ncmds, sizeofcmds, (32 if is_64 else 28)
+
+
+def _iter_load_command_sections(data, base, header, end):
+    """
+    Walk the load commands of one Mach-O image. `data` must contain the
+    header and load commands; section offsets are made absolute with `base`.
+    """
+    endian, is_64, ncmds, _sizeofcmds, header_size = header
+    pos = header_size
+    for _ in range(ncmds):
+        if pos + 8 > end:
+            break
+        cmd, cmd_size = struct.unpack_from(endian + 'II', data, pos)
+        if cmd_size < 8:
+            break
+
+        if cmd == LC_SEGMENT_64 and is_64:
+            nsects = struct.unpack_from(endian + 'I', data, pos + 64)[0]
+            sect_pos = pos + 72
+            for _ in range(nsects):
+                if sect_pos + 80 > end:
+                    break
+                sectname, segname, _addr, size, offset = struct.unpack_from(
+                    endian + '16s16sQQI', data, sect_pos)
+                yield (segname.rstrip(b'\x00').decode('ascii', 'replace'),
+                       sectname.rstrip(b'\x00').decode('ascii', 'replace'),
+                       base + offset, size)
+                sect_pos += 80
+        elif cmd == LC_SEGMENT and not is_64:
+            nsects = struct.unpack_from(endian + 'I', data, pos + 48)[0]
+            sect_pos = pos + 56
+            for _ in range(nsects):
+                if sect_pos + 68 > end:
+                    break
+                sectname, segname, _addr, size, offset = struct.unpack_from(
+                    endian + '16s16sIII', data, sect_pos)
+                yield (segname.rstrip(b'\x00').decode('ascii', 'replace'),
+                       sectname.rstrip(b'\x00').decode('ascii', 'replace'),
+                       base + offset, size)
+                sect_pos += 68
+
+        pos += cmd_size
+
+
+def iter_macho_sections(data):
+    """
+    Yield (segment name, section name, file offset, size) for every section of
+    every architecture in a (possibly fat) Mach-O binary. Offsets are absolute
+    positions in data.
+    """
+    for base, slice_size in _macho_slices(data):
+        header = _parse_macho_header(data, base)
+        if header is None:
+            continue
+        view = memoryview(data)[base:base + slice_size]
+        try:
+            yield from _iter_load_command_sections(view, base, header, slice_size)
+        finally:
+            view.release()
+
+
+def read_macho_sections(f):
+    """
+    Same as iter_macho_sections, but reads only the headers and load commands
+    from a seekable file object instead of needing the whole binary in memory.
+
+    :returns: list of (segment name, section name, file offset, size)
+    """
+    f.seek(0)
+    head = f.read(4096)
+
+    sections = []
+    # Visit slices in file order: backward seeks restart decompression in zip streams
+    for base, _slice_size in sorted(_macho_slices(head)):
+        f.seek(base)
+        commands = f.read(32)
+        header = _parse_macho_header(commands, 0)
+        if header is None:
+            continue
+        header_size, sizeofcmds = header[4], header[3]
+        remaining = header_size + sizeofcmds - len(commands)
+        if remaining > 0:
+            commands += f.read(remaining)
+        sections.extend(_iter_load_command_sections(commands, base, header, len(commands)))
+    return sections
+
+
+def _split_c_strings(raw, min_length):
+    for item in raw.split(b'\x00'):
+        if len(item) >= min_length:
+            yield item.decode('utf-8', 'replace')
+
+
+def extract_macho_section_strings(data, sections=DEFAULT_MACHO_SECTIONS, min_length=DEFAULT_MIN_LENGTH):
+    """
+    Yield the NUL-terminated strings stored in the given Mach-O sections.
+    Returns nothing if data is not a Mach-O binary or has none of the sections.
+
+    Unlike the printable-run scan this keeps non-ASCII (UTF-8) literals intact
+    and never glues neighbouring strings together.
+    """
+    wanted = set(sections)
+    view = memoryview(data)
+    try:
+        for _segname, sectname, offset, size in iter_macho_sections(data):
+            if sectname not in wanted or size == 0 or offset + size > len(data):
+                continue
+            yield from _split_c_strings(bytes(view[offset:offset + size]), min_length)
+    finally:
+        view.release()
+
+
+def read_macho_section_strings(f, sections=DEFAULT_MACHO_SECTIONS, min_length=DEFAULT_MIN_LENGTH,
+                               progress_callback=None):
+    """
+    Stream version of extract_macho_section_strings: only the load commands and
+    the requested sections are read from the seekable file object `f`.
+
+    :param progress_callback: called with (bytes read, total section bytes)
+    """
+    wanted = set(sections)
+    targets = sorted((offset, size) for _segname, sectname, offset, size in read_macho_sections(f)
+                     if sectname in wanted and size > 0)
+    total = sum(size for _offset, size in targets)
+    done = 0
+    for offset, size in targets:
+        f.seek(offset)
+        yield from _split_c_strings(f.read(size), min_length)
+        done += size
+        if progress_callback:
+            progress_callback(done, total)
+
+
+class _RunScanner:
+    """
+    Feeds consecutive chunks of a stream to one string pattern and yields every
+    match exactly once, as if the whole stream had been scanned in one piece.
+    A run that touches the end of a chunk is carried over to the next one.
+    """
+
+    def __init__(self, pattern, unit, min_length, encoding):
+        self.pattern = pattern
+        self.unit = unit
+        self.keep = unit * min_length
+        self.encoding = encoding
+        self.carry = b''
+        self.skip = 0
+
+    def feed(self, chunk, final=False):
+        buf = self.carry + chunk if self.carry else chunk
+        limit = len(buf) - self.unit
+        last_end = self.skip
+        self.carry = b''
+        self.skip = 0
+        for m in self.pattern.finditer(buf, last_end):
+            if not final and m.end() > limit:
+                # The run may continue in the next chunk
+                self.carry = buf[m.start():]
+                return
+            last_end = m.end()
+            yield m.group().decode(self.encoding)
+        if not final:
+            # A run shorter than min_length may still be growing at the end
+            tail_start = max(0, len(buf) - self.keep)
+            self.carry = buf[tail_start:]
+            self.skip = max(0, last_end - tail_start)
+
+
+def iter_stream_strings(f, min_length=DEFAULT_MIN_LENGTH, utf16=True, chunk_size=4 * 1024 * 1024,
+                        progress_callback=None):
+    """
+    Yield the same strings as extract_strings() while reading `f` chunk by chunk,
+    so memory use stays bounded by chunk_size instead of the file size.
+    (ASCII and UTF-16LE strings are interleaved per chunk instead of grouped.)
+
+    :param progress_callback: called with the number of bytes consumed so far
+    """
+    scanners = [_RunScanner(_ascii_pattern(min_length), 1, min_length, 'ascii')]
+    if utf16:
+        scanners.append(_RunScanner(_utf16_pattern(min_length), 2, min_length, 'utf-16-le'))
+
+    consumed = 0
+    while True:
+        chunk = f.read(chunk_size)
+        final = not chunk
+        for scanner in scanners:
+            yield from scanner.feed(chunk, final)
+        if final:
+            break
+        consumed += len(chunk)
+        if progress_callback:
+            progress_callback(consumed)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+import io
+import time
+
+from lxml import etree
+
+from apkInspector.headers import ZipEntry
+from apkInspector.extract import ExtractionLimitError
+from apkInspector.indicators import zip_tampering_indicators, manifest_tampering_indicators, check_deadline
+from apkInspector.axml import get_manifest
+
+# Default per-sample budgets of the pre-check
+TAMPER_TIME_BUDGET = 10.0  # seconds
+TAMPER_MEMORY_BUDGET = 256 * 1024 * 1024  # bytes held decompressed at once by the checks
+
+# Threads verifying the extraction of entries with an unexpected compression method
+VERIFY_WORKERS = 4
+
+NS_ANDROID = '{http://schemas.android.com/apk/res/android}'
+
+# Zip indicators after which androguard is known to choke or crawl
+ZIP_EVASION_KEYS = ('unique_entries', 'empty_keys', 'eocd_count')
+
+
+class TamperCheck:
+    """
+    Zip / AndroidManifest tampering pre-check of an APK (apkInspector
+    indicators), run under a time and memory budget.
+
+    The result tells ApkAnalyzer which parser is the cheapest safe one:
+
+    - 'androguard':   clean structure, full analysis
+    - 'apkinspector': evasion tricks found, use the lenient apkInspector
+                      extractor / manifest decoder instead of androguard
+    - None:           the budget was exceeded, the sample should fail fast
+
+    Both budgets are enforced from inside the checks: the apkInspector loops
+    test a deadline and stop with a TimeoutError, and extractions stop as
+    soon as the data actually inflated goes over the memory budget. Header
+    sizes are never trusted, they are what a tampered APK forges.
+    """
+
+    def __init__(self, file_path, time_budget=TAMPER_TIME_BUDGET, memory_budget=TAMPER_MEMORY_BUDGET):
+        """
+        :param file_path: path of the APK
+        :param time_budget: seconds the check may take (None: no limit)
+        :param memory_budget: max bytes the check may hold decompressed at once (None: no limit)
+        """
+        self.file_path = file_path
+        self.time_budget = time_budget
+        self.memory_budget = memory_budget
+        self.files = []
+        self.manifest = None
+        self.info = {}
+        self.error = None
+
+    def get_files(self):
+        # Same interface as androguard's APK.get_files(), for CheckProtect
+        return self.files
+
+    def run(self):
+        """
+        :returns: the chosen strategy ('androguard', 'apkinspector') or None if the budget was exceeded
+        """
+        start = time.monotonic()
+        deadline = None if self.time_budget is None else start + self.time_budget
+        self.info = {'status': 'running', 'strategy': None}
+        try:
+            self._check(deadline)
+        except TimeoutError:
+            self.info['status'] = 'timeout'
+            self.error = f"Tamper pre-check exceeded its time budget ({self.time_budget}s)"
+        except ExtractionLimitError as e:
+            self.info['status'] = 'memory'
+            self.error = f"Tamper pre-check is over its memory budget ({self.memory_budget} bytes): {e}"
+        except Exception as e:
+            self.info['status'] = 'error'
+            # Unparsable for apkInspector: let androguard try and report its own error
+            self.info['strategy'] = 'androguard'
+            self.error = f"Tamper pre-check failed: {e}"
+        self.info['elapsed'] = round(time.monotonic() - start, 4)
+        return self.info['strategy']
+
+    def _check(self, deadline):
+        info = self.info
+        # Closing the entry releases the memory map, the check keeps only names and the manifest
+        with ZipEntry.parse(self.file_path, False, use_mmap=True) as zipentry:
+            self.files = zipentry.namelist()
+            check_deadline(deadline)
+
+            # Entries are verified in parallel, each may hold its share of the budget
+            max_size = None if self.memory_budget is None else self.memory_budget // VERIFY_WORKERS
+            info['zip'] = zip_tampering_indicators(zipentry.zip, False, zipentry, VERIFY_WORKERS,
+                                                   deadline=deadline, max_size=max_size)
+
+            info['manifest'] = {}
+            if 'AndroidManifest.xml' in zipentry.central_directory.entries:
+                self.manifest = zipentry.read('AndroidManifest.xml', max_size=self.memory_budget)
+                info['manifest'] = manifest_tampering_indicators(io.BytesIO(self.manifest), deadline)
+
+        evasive = any(key in info['zip'] for key in ZIP_EVASION_KEYS) or any(
+            isinstance(value, dict) for value in info['zip'].values())
+        info['tampered'] = bool(evasive or info['manifest'])
+        info['strategy'] = 'apkinspector' if info['tampered'] else 'androguard'
+        info['status'] = 'ok'
+
+    def get_manifest_info(self):
+        """
+        Package, version, SDK levels, components and permissions decoded
+        with apkInspector's lenient AXML decoder (no resource resolution).
+        """
+        if self.manifest is None:
+            raise ValueError("No AndroidManifest.xml in the APK")
+        xml = get_manifest(io.BytesIO(self.manifest))
+        root = etree.fromstring(xml.encode('utf-8'), parser=etree.XMLParser(recover=True))
+        if root is None:
+            raise ValueError("Unable to decode AndroidManifest.xml")
+
+        def attr(element, name):
+            if element is None:
+                return None
+            return element.get(NS_ANDROID + name, element.get(name))
+
+        package = root.get('package') or ''
+
+        def names(path, components=True):
+            found = [attr(e, 'name') for e in root.iterfind(path) if attr(e, 'name')]
+            if not components:
+                return found
+            # Same as androguard: '.Main' / 'Main' are relative to the package
+            return [package + name if name.startswith('.') else name if '.' in name else f"{package}.{name}"
+                    for name in found]
+
+        uses_sdk = root.find('uses-sdk')
+        application = root.find('application')
+        label = attr(application, 'label')
+        return {
+            'package_name': package,
+            # Resource references (@0x7f...) cannot be resolved without resources.arsc
+            'app_name': label if label and not label.startswith('@') else None,
+            'version_name': attr(root, 'versionName'),
+            'version_code': attr(root, 'versionCode'),
+            'min_sdk': attr(uses_sdk, 'minSdkVersion'),
+            'target_sdk': attr(uses_sdk, 'targetSdkVersion'),
+            'activities': names('application/activity') + names('application/activity-alias'),
+            'services': names('application/service'),
+            'receivers': names('application/receiver'),
+            'providers': names('application/provider'),
+            'permissions': names('uses-permission', components=False),
+        }
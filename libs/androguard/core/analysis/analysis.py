@@ -2461,7 +2461,7 @@ class Analysis:
             for meth_analysis in cls.get_methods():
                 meth = meth_analysis.get_method()
                 if meth.permission_api_name in permmap:
-                    yield meth_analysis, permmap[meth.permission_api_name]
+                    yield meth_analysis, list(permmap[meth.permission_api_name])
 
     def get_permission_usage(
         self, permission: str, apilevel: Union[str, int, None] = None
@@ -6,7 +6,7 @@ from __future__ import annotations
 import os
 import sys
 import tempfile
-from typing import Union
+from typing import Mapping, Union
 
 from androguard import __version__
 from androguard.core.api_specific_resources import (
@@ -261,17 +261,20 @@ def color_range(
 
 def load_api_specific_resource_module(
     resource_name: str, api: Union[str, int, None] = None
-) -> dict:
+) -> Mapping:
     """
-    Load the module from the JSON files and return a dict, which might be empty
+    Load the module from the JSON files and return a mapping, which might be empty
     if the resource could not be loaded.
 
     If no api version is given, the default one from the CONF dict is used.
 
+    The JSON files are parsed once per process: the returned mapping is
+    shared between all callers and therefore read-only.
+
     :param resource_name: Name of the resource to load
     :param api: API version
     :raises InvalidResourceError: if resource not found
-    :returns: dict
+    :returns: read-only mapping
     """
     loader = dict(
         aosp_permissions=load_permissions,
@@ -1,7 +1,9 @@
 import json
 import os
 import re
-from typing import Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Union
 
 from loguru import logger
 
@@ -10,9 +12,42 @@ class APILevelNotFoundError(Exception):
     pass
 
 
+def _freeze(value):
+    """
+    Read-only copy of a parsed JSON value: objects become mappingproxy views
+    and arrays become tuples.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _load_json(path: str) -> Mapping:
+    """
+    Parse a resource JSON file once per process.
+
+    The result is shared by all callers, so it is returned read-only: a
+    caller modifying it would otherwise change it for every later APK.
+    """
+    with open(path, "r") as fp:
+        return _freeze(json.load(fp))
+
+
+@lru_cache(maxsize=None)
+def _available_permission_levels(root: str) -> tuple[int, ...]:
+    levels = filter(
+        lambda x: re.match(r'^permissions_\d+\.json$', x),
+        os.listdir(os.path.join(root, "aosp_permissions")),
+    )
+    return tuple(map(lambda x: int(x[:-5].split('_')[1]), levels))
+
+
 def load_permissions(
     apilevel: Union[str, int], permtype: str = 'permissions'
-) -> dict[str, dict[str, str]]:
+) -> Mapping[str, Mapping[str, str]]:
     """
     Load the Permissions for the given apilevel.
 
@@ -29,7 +64,7 @@ def load_permissions(
     :param apilevel:  integer value of the API level
     :param permtype: either load permissions (`'permissions'`) or
     permission groups (`'groups'`)
-    :return: a dictionary of {Permission Name: {Permission info}
+    :return: a read-only mapping of {Permission Name: {Permission info}
     """
 
     if permtype not in ['permissions', 'groups']:
@@ -43,11 +78,7 @@ def load_permissions(
         root, "aosp_permissions", "permissions_{}.json".format(apilevel)
     )
 
-    levels = filter(
-        lambda x: re.match(r'^permissions_\d+\.json$', x),
-        os.listdir(os.path.join(root, "aosp_permissions")),
-    )
-    levels = list(map(lambda x: int(x[:-5].split('_')[1]), levels))
+    levels = _available_permission_levels(root)
 
     if not levels:
         logger.error("No Permissions available, can not load!")
@@ -82,19 +113,18 @@ def load_permissions(
         )
         return load_permissions(lower_level, permtype)
 
-    with open(permissions_file, "r") as fp:
-        return json.load(fp)[permtype]
+    return _load_json(permissions_file)[permtype]
 
 
 def load_permission_mappings(
     apilevel: Union[str, int]
-) -> dict[str, list[str]]:
+) -> Mapping[str, tuple[str, ...]]:
     """
     Load the API/Permission mapping for the requested API level.
     If the requetsed level was not found, None is returned.
 
     :param apilevel: integer value of the API level, i.e. 24 for Android 7.0
-    :return: a dictionary of {MethodSignature: [List of Permissions]}
+    :return: a read-only mapping of {MethodSignature: (Permissions...)}
     """
     root = os.path.dirname(os.path.realpath(__file__))
     permissions_file = os.path.join(
@@ -104,5 +134,4 @@ def load_permission_mappings(
     if not os.path.isfile(permissions_file):
         return {}
 
-    with open(permissions_file, "r") as fp:
-        return json.load(fp)
+    return _load_json(permissions_file)
@@ -8,8 +8,10 @@ from __future__ import annotations
 import binascii
 import hashlib
 import io
+import mmap
 import os
 import re
+import threading
 import unicodedata
 import zipfile
 from hashlib import md5, sha1, sha224, sha256, sha384, sha512
@@ -19,6 +21,7 @@ from xml.dom.pulldom import SAX2DOM
 from zlib import crc32
 
 import lxml.sax
+from apkInspector.extract import STREAM_CHUNK_SIZE, BufferReader
 from apkInspector.headers import ZipEntry
 
 # Used for reading Certificates
@@ -340,12 +343,17 @@ class APK:
         self.xml = {}
         self.axml = {}
         self.arsc = {}
+        # resources.arsc is parsed on first use, possibly from several threads
+        self._arsc_lock = threading.Lock()
 
         self.package = ""
         self.androidversion = {}
-        self.permissions = []
-        self.uses_permissions = []
-        self.declared_permissions = {}
+        # Derived from the manifest on first access, see the properties below
+        self._permissions = None
+        self._uses_permissions = None
+        self._declared_permissions = None
+        self._permission_module = None
+        self._permission_module_min_sdk = None
         self.valid_apk = False
 
         self._is_signed_v2 = None
@@ -364,8 +372,10 @@ class APK:
             self.filename = "raw_apk_sha256:{}".format(self._sha256)
             self.zip = ZipEntry.parse(io.BytesIO(self.__raw), True)
         else:
-            self.zip = ZipEntry.parse(filename, False)
-            self.__raw = self.zip.zip.getvalue()
+            # Map the file instead of copying it: local headers are parsed on demand
+            # and the raw bytes are only read if get_raw() is called
+            self.zip = ZipEntry.parse(filename, False, use_mmap=True)
+            self.__raw = None
 
         if testzip:
             logger.info(
@@ -378,7 +388,7 @@ class APK:
             # A short benchmark showed, that testing the zip takes about 10 times longer!
             # e.g. normal zip loading (skip_analysis=True) takes about 0.01s, where
             # testzip takes 0.1s!
-            test_zip = zipfile.ZipFile(io.BytesIO(self.__raw), mode="r")
+            test_zip = zipfile.ZipFile(io.BytesIO(self.get_raw()), mode="r")
             ret = test_zip.testzip()
             if ret is not None:
                 # we could print the filename here, but there are zip which are so broken
@@ -443,19 +453,49 @@ class APK:
                 self.androidversion["Name"] = self.get_attribute_value(
                     "manifest", "versionName"
                 )
-                permission = list(
-                    self.get_all_attribute_value("uses-permission", "name")
+                self.valid_apk = True
+                logger.info("APK file was successfully validated!")
+
+    # The properties below are computed on first access and memoized, so
+    # callers only interested in e.g. the package name never pay for them.
+
+    @property
+    def permissions(self) -> list[str]:
+        if self._permissions is None:
+            self._permissions = []
+            if self.valid_apk:
+                self._permissions = list(
+                    set(self.get_all_attribute_value("uses-permission", "name"))
                 )
-                self.permissions = list(set(self.permissions + permission))
+        return self._permissions
+
+    @permissions.setter
+    def permissions(self, value):
+        self._permissions = value
 
+    @property
+    def uses_permissions(self) -> list[list]:
+        if self._uses_permissions is None:
+            self._uses_permissions = []
+            if self.valid_apk:
                 for uses_permission in self.find_tags("uses-permission"):
-                    self.uses_permissions.append(
+                    self._uses_permissions.append(
                         [
                             self.get_value_from_tag(uses_permission, "name"),
                             self._get_permission_maxsdk(uses_permission),
                         ]
                     )
+        return self._uses_permissions
 
+    @uses_permissions.setter
+    def uses_permissions(self, value):
+        self._uses_permissions = value
+
+    @property
+    def declared_permissions(self) -> dict[str, dict[str, str]]:
+        if self._declared_permissions is None:
+            self._declared_permissions = {}
+            if self.valid_apk:
                 # getting details of the declared permissions
                 for d_perm_item in self.find_tags('permission'):
                     d_perm_name = self._get_res_string_value(
@@ -490,19 +530,38 @@ class APK:
                         "permissionGroup": d_perm_permissionGroup,
                         "protectionLevel": d_perm_protectionLevel,
                     }
-                    self.declared_permissions[d_perm_name] = d_perm_details
+                    self._declared_permissions[d_perm_name] = d_perm_details
+        return self._declared_permissions
 
-                self.valid_apk = True
-                logger.info("APK file was successfully validated!")
+    @declared_permissions.setter
+    def declared_permissions(self, value):
+        self._declared_permissions = value
 
-        self.permission_module = androconf.load_api_specific_resource_module(
-            "aosp_permissions", self.get_target_sdk_version()
-        )
-        self.permission_module_min_sdk = (
-            androconf.load_api_specific_resource_module(
-                "aosp_permissions", self.get_min_sdk_version()
+    @property
+    def permission_module(self) -> dict:
+        if self._permission_module is None:
+            self._permission_module = androconf.load_api_specific_resource_module(
+                "aosp_permissions", self.get_target_sdk_version()
             )
-        )
+        return self._permission_module
+
+    @permission_module.setter
+    def permission_module(self, value):
+        self._permission_module = value
+
+    @property
+    def permission_module_min_sdk(self) -> dict:
+        if self._permission_module_min_sdk is None:
+            self._permission_module_min_sdk = (
+                androconf.load_api_specific_resource_module(
+                    "aosp_permissions", self.get_min_sdk_version()
+                )
+            )
+        return self._permission_module_min_sdk
+
+    @permission_module_min_sdk.setter
+    def permission_module_min_sdk(self, value):
+        self._permission_module_min_sdk = value
 
     def __getstate__(self):
         """
@@ -518,6 +577,7 @@ class APK:
         x['axml'] = str(x['axml'])
         x['xml'] = str(x['xml'])
         del x['zip']
+        del x['_arsc_lock']
 
         return x
 
@@ -531,7 +591,8 @@ class APK:
         """
         self.__dict__ = state
 
-        self.zip = zipfile.ZipFile(io.BytesIO(self.get_raw()), mode="r")
+        self._arsc_lock = threading.Lock()
+        self.zip = ZipEntry.parse(io.BytesIO(self.get_raw()), True)
 
     def _get_res_string_value(self, string):
         if not string.startswith('@string/'):
@@ -786,10 +847,12 @@ class APK:
         """
         return self.zip.namelist()
 
-    def _get_file_magic_name(self, buffer: bytes) -> str:
+    def _get_file_magic_name(self, buffer: bytes, filename: str = None) -> str:
         """
         Return the filetype guessed for a buffer
         :param buffer: bytes
+        :param filename: if `buffer` is only the beginning of this file, it is
+            read completely when the whole content is needed (nested APK check)
 
         :returns: guessed filetype, or "Unknown" if not resolved
         """
@@ -844,6 +907,8 @@ class APK:
         if not ftype:
             return default
         else:
+            if filename is not None and '(JAR)' in ftype:
+                buffer = self.get_file(filename)
             return self._patch_magic(buffer, ftype)
 
     @property
@@ -866,8 +931,9 @@ class APK:
         if self._files == {}:
             # Generate File Types / CRC List
             for i in self.get_files():
-                buffer = self._get_crc32(i)
-                self._files[i] = self._get_file_magic_name(buffer)
+                # The magic only needs the beginning of the file
+                buffer = self._get_crc32_head(i)
+                self._files[i] = self._get_file_magic_name(buffer, i)
 
         return self._files
 
@@ -888,6 +954,23 @@ class APK:
 
         return orig
 
+    def _check_crc32(self, filename, value):
+        """
+        Store the calculated CRC32 of a file and compare it with the declared one.
+        """
+        self.files_crc32[filename] = value
+        if value != self.zip.infolist()[filename].crc32_of_uncompressed_data:
+            logger.error(
+                "File '{}' has different CRC32 after unpacking! "
+                "Declared: {:08x}, Calculated: {:08x}".format(
+                    filename,
+                    self.zip.infolist()[
+                        filename
+                    ].crc32_of_uncompressed_data,
+                    value,
+                )
+            )
+
     def _get_crc32(self, filename):
         """
         Calculates and compares the CRC32 and returns the raw buffer.
@@ -899,23 +982,35 @@ class APK:
         """
         buffer = self.zip.read(filename)
         if filename not in self.files_crc32:
-            self.files_crc32[filename] = crc32(buffer)
-            if (
-                self.files_crc32[filename]
-                != self.zip.infolist()[filename].crc32_of_uncompressed_data
-            ):
-                logger.error(
-                    "File '{}' has different CRC32 after unpacking! "
-                    "Declared: {:08x}, Calculated: {:08x}".format(
-                        filename,
-                        self.zip.infolist()[
-                            filename
-                        ].crc32_of_uncompressed_data,
-                        self.files_crc32[filename],
-                    )
-                )
+            self._check_crc32(filename, crc32(buffer))
         return buffer
 
+    def _get_crc32_head(self, filename, size=1024):
+        """
+        Same as `_get_crc32`, but the file is streamed through the CRC32
+        and only its first `size` bytes are returned, so large files are
+        never held in memory at once.
+
+        :param filename: filename inside the zipfile
+        :param size: number of bytes to return
+        :rtype: bytes
+        """
+        if filename in self.files_crc32:
+            return self.zip.read_head(filename, size)
+
+        head = b''
+        value = 0
+        with self.zip.open(filename) as stream:
+            while True:
+                chunk = stream.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if len(head) < size:
+                    head += chunk[:size - len(head)]
+                value = crc32(chunk, value)
+        self._check_crc32(filename, value)
+        return head
+
     def get_files_crc32(self) -> dict[str, int]:
         """
         Calculates and returns a dictionary of filenames and CRC32
@@ -924,7 +1019,7 @@ class APK:
         """
         if self.files_crc32 == {}:
             for i in self.get_files():
-                self._get_crc32(i)
+                self._get_crc32_head(i, 0)
 
         return self.files_crc32
 
@@ -965,6 +1060,22 @@ class APK:
         except KeyError:
             raise FileNotPresent(filename)
 
+    def get_file_head(self, filename: str, size: int) -> bytes:
+        """
+        Return the first `size` bytes of the specified filename inside the
+        APK, without decompressing the rest of it. Useful to check a magic
+        or read a file header.
+
+        :param filename: the filename to get
+        :param size: the number of bytes to read
+        :raises FileNotPresent: if filename not found inside the apk
+        :returns: at most `size` bytes of the specified filename
+        """
+        try:
+            return self.zip.read_head(filename, size)
+        except KeyError:
+            raise FileNotPresent(filename)
+
     def get_dex(self) -> bytes:
         """
         Return the raw data of the classes dex file
@@ -1578,7 +1689,7 @@ class APK:
         l = {}
         for i in self.permissions:
             try:
-                l[i] = self.permission_module[i]
+                l[i] = dict(self.permission_module[i])
             except KeyError:
                 # if we have not found permission do nothing
                 continue
@@ -2209,13 +2320,16 @@ class APK:
         try:
             return self.arsc["resources.arsc"]
         except KeyError:
-            if "resources.arsc" not in self.zip.namelist():
-                # There is a rare case, that no resource file is supplied.
-                # Maybe it was added manually, thus we check here
-                return None
-            self.arsc["resources.arsc"] = ARSCParser(
-                self.zip.read("resources.arsc")
-            )
+            pass
+        with self._arsc_lock:
+            if "resources.arsc" not in self.arsc:
+                if "resources.arsc" not in self.zip.namelist():
+                    # There is a rare case, that no resource file is supplied.
+                    # Maybe it was added manually, thus we check here
+                    return None
+                self.arsc["resources.arsc"] = ARSCParser(
+                    self.zip.read("resources.arsc")
+                )
             return self.arsc["resources.arsc"]
 
     def is_signed(self) -> bool:
@@ -2314,7 +2428,12 @@ class APK:
         # * There should be again the size_of_block
         # * Now we can read the Key-Values
         # * IDs with an unknown value should be ignored.
-        f = io.BytesIO(self.get_raw())
+        if isinstance(self.zip.zip, mmap.mmap):
+            # Seekable like BytesIO, without reading the whole file, and
+            # without moving the position other readers of the mmap rely on
+            f = BufferReader(self.zip.zip)
+        else:
+            f = io.BytesIO(self.get_raw())
 
         size_central = None
         offset_central = None
@@ -2763,10 +2882,11 @@ class APK:
         """
         signature_expr = re.compile(r'\AMETA-INF/(?s:.)*\.(DSA|EC|RSA)\Z')
         signatures = []
+        files = self.zip.infolist()
 
         for i in self.get_files():
             if signature_expr.search(i):
-                if "{}.SF".format(i.rsplit(".", 1)[0]) in self.get_files():
+                if "{}.SF".format(i.rsplit(".", 1)[0]) in files:
                     signatures.append(i)
                 else:
                     logger.warning(
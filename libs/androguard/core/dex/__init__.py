@@ -11,6 +11,8 @@ import struct
 import sys
 import time
 import zlib
+from abc import ABC, abstractmethod
+from array import array
 from enum import IntEnum
 from struct import calcsize, pack, unpack
 from typing import IO, TYPE_CHECKING, BinaryIO, Iterator, Union
@@ -102,6 +104,10 @@ DBG_LINE_BASE = -4
 DBG_LINE_RANGE = 15
 
 
+# Number of strings checked at once by StringDataItem.get_all
+STRING_BATCH_SIZE = 512
+
+
 class InvalidInstruction(Exception):
     pass
 
@@ -292,6 +298,186 @@ def readsleb128(cm: ClassManager, buff: BinaryIO) -> int:
     return result
 
 
+def decode_string_data(
+    view: memoryview, offset: int, count: int, base: int = 0
+) -> tuple[list[tuple[int, int, bytes]], int]:
+    """
+    Decode `count` consecutive `string_data_item`
+
+    :param view: a bytes like object, usually the memoryview on the DEX file
+    :param offset: offset of the first item
+    :param count: number of items
+    :param base: added to the offsets of the items (see [get_buffer_view][androguard.core.dex.get_buffer_view])
+    :raises IndexError: if the buffer ends inside a length
+    :returns: the (offset, utf16_size, data) of each item, data without its
+        NULL terminator, and the offset following the last item
+    """
+    find = view.obj.find
+    size = len(view)
+
+    items = []
+    append = items.append
+    for _ in range(count):
+        start = offset
+        utf16_size = view[offset]
+        if utf16_size > 0x7F:
+            utf16_size, offset = decode_uleb128(view, offset)
+        else:
+            offset += 1
+
+        end = find(b'\x00', offset)
+        if end == -1:
+            end = size
+        append((base + start, utf16_size, bytes(view[offset:end])))
+        offset = end + 1
+
+    return items, offset
+
+
+def get_buffer_view(
+    cm: ClassManager, buff: BinaryIO
+) -> tuple[memoryview, int, int]:
+    """
+    Return what the bulk decoders need to parse the item at the current
+    position of `buff`: usually the memoryview on the whole DEX file, or the
+    rest of the stream if the `ClassManager` has none.
+
+    :returns: (view, offset, base), the item is at `offset` in `view` and
+        `base + offset` is the matching position in `buff`
+    """
+    view = cm.get_view()
+    if view is None:
+        base = buff.tell()
+        return memoryview(buff.read()), 0, base
+    return view, buff.tell(), 0
+
+
+def decode_uleb128(view: memoryview, offset: int) -> tuple[int, int]:
+    """
+    Decode an unsigned LEB128 from a buffer, like
+    [readuleb128][androguard.core.dex.readuleb128] but without a file object
+
+    :param view: a bytes like object, usually the memoryview on the DEX file
+    :param offset: offset of the first byte
+    :raises IndexError: if the buffer ends inside the number
+    :returns: the decoded value and the offset following it
+    """
+    result = view[offset]
+    offset += 1
+    if result > 0x7F:
+        cur = view[offset]
+        offset += 1
+        result = (result & 0x7F) | ((cur & 0x7F) << 7)
+        if cur > 0x7F:
+            cur = view[offset]
+            offset += 1
+            result |= (cur & 0x7F) << 14
+            if cur > 0x7F:
+                cur = view[offset]
+                offset += 1
+                result |= (cur & 0x7F) << 21
+                if cur > 0x7F:
+                    cur = view[offset]
+                    offset += 1
+                    if cur > 0x0F:
+                        logger.warning("possible error while decoding number")
+                    result |= cur << 28
+
+    return result, offset
+
+
+def decode_sleb128(view: memoryview, offset: int) -> tuple[int, int]:
+    """
+    Decode a signed LEB128 from a buffer, like
+    [readsleb128][androguard.core.dex.readsleb128] but without a file object
+
+    :param view: a bytes like object, usually the memoryview on the DEX file
+    :param offset: offset of the first byte
+    :raises IndexError: if the buffer ends inside the number
+    :returns: the decoded value and the offset following it
+    """
+    result = 0
+    shift = 0
+
+    for x in range(0, 5):
+        cur = view[offset]
+        offset += 1
+        result |= (cur & 0x7F) << shift
+        shift += 7
+
+        if not cur & 0x80:
+            bit_left = max(32 - shift, 0)
+            result = result << bit_left
+            if result > 0x7FFFFFFF:
+                result = (0x7FFFFFFF & result) - 0x80000000
+            result = result >> bit_left
+            break
+
+    return result, offset
+
+
+def decode_uleb128_run(
+    view: memoryview, offset: int, count: int
+) -> tuple[list[int], int]:
+    """
+    Decode `count` consecutive unsigned LEB128
+
+    Most values of a DEX file fit in one byte: these are read inline, only
+    the longer ones go through [decode_uleb128][androguard.core.dex.decode_uleb128].
+
+    :param view: a bytes like object, usually the memoryview on the DEX file
+    :param offset: offset of the first byte
+    :param count: number of values to decode
+    :raises IndexError: if the buffer ends before the last value
+    :returns: the decoded values and the offset following them
+    """
+    values = []
+    append = values.append
+    for _ in range(count):
+        value = view[offset]
+        if value > 0x7F:
+            value, offset = decode_uleb128(view, offset)
+        else:
+            offset += 1
+        append(value)
+    return values, offset
+
+
+def decode_class_data(
+    view: memoryview, offset: int
+) -> tuple[list[int], list[list[tuple]], int]:
+    """
+    Decode a whole `class_data_item` in one call
+
+    :param view: a bytes like object, usually the memoryview on the DEX file
+    :param offset: offset of the `class_data_item`
+    :raises IndexError: if the buffer ends inside the item
+    :returns: the four sizes (static fields, instance fields, direct methods,
+        virtual methods), the members of each of these lists as
+        (offset, idx_diff, access_flags) for fields and
+        (offset, idx_diff, access_flags, code_off) for methods, and the
+        offset following the item
+    """
+    sizes, offset = decode_uleb128_run(view, offset, 4)
+
+    members = []
+    for size, width in zip(sizes, (2, 2, 3, 3)):
+        elements = []
+        for _ in range(size):
+            element = [offset]
+            for _ in range(width):
+                value = view[offset]
+                if value > 0x7F:
+                    value, offset = decode_uleb128(view, offset)
+                else:
+                    offset += 1
+                element.append(value)
+            elements.append(tuple(element))
+        members.append(elements)
+
+    return sizes, members, offset
+
+
 def writeuleb128(cm: ClassManager, value: int) -> bytearray:
     """
     Convert an integer value to the corresponding unsigned LEB128.
@@ -1591,51 +1777,64 @@ class DebugInfoItem:
 
         self.offset = buff.tell()
 
-        self.line_start = readuleb128(cm, buff)
-        self.parameters_size = readuleb128(cm, buff)
+        view, off, base = get_buffer_view(cm, buff)
+
+        self.line_start, off = decode_uleb128(view, off)
+        self.parameters_size, off = decode_uleb128(view, off)
 
         # print "line", self.line_start, "params", self.parameters_size
 
-        self.parameter_names = []
-        for i in range(0, self.parameters_size):
-            self.parameter_names.append(readuleb128p1(cm, buff))
+        # uleb128p1
+        names, off = decode_uleb128_run(view, off, self.parameters_size)
+        self.parameter_names = [i - 1 for i in names]
 
         self.bytecodes = []
-        bcode = DBGBytecode(self.CM, get_byte(cm, buff))
+        bcode = DBGBytecode(self.CM, view[off])
+        off += 1
         self.bytecodes.append(bcode)
 
         while bcode.get_op_value() != DBG_END_SEQUENCE:
             bcode_value = bcode.get_op_value()
 
             if bcode_value == DBG_ADVANCE_PC:
-                bcode.add(readuleb128(cm, buff), "u")
+                value, off = decode_uleb128(view, off)
+                bcode.add(value, "u")
             elif bcode_value == DBG_ADVANCE_LINE:
-                bcode.add(readsleb128(cm, buff), "s")
+                value, off = decode_sleb128(view, off)
+                bcode.add(value, "s")
             elif bcode_value == DBG_START_LOCAL:
-                bcode.add(readuleb128(cm, buff), "u")
-                bcode.add(readuleb128p1(cm, buff), "u1")
-                bcode.add(readuleb128p1(cm, buff), "u1")
+                values, off = decode_uleb128_run(view, off, 3)
+                bcode.add(values[0], "u")
+                bcode.add(values[1] - 1, "u1")
+                bcode.add(values[2] - 1, "u1")
             elif bcode_value == DBG_START_LOCAL_EXTENDED:
-                bcode.add(readuleb128(cm, buff), "u")
-                bcode.add(readuleb128p1(cm, buff), "u1")
-                bcode.add(readuleb128p1(cm, buff), "u1")
-                bcode.add(readuleb128p1(cm, buff), "u1")
+                values, off = decode_uleb128_run(view, off, 4)
+                bcode.add(values[0], "u")
+                bcode.add(values[1] - 1, "u1")
+                bcode.add(values[2] - 1, "u1")
+                bcode.add(values[3] - 1, "u1")
             elif bcode_value == DBG_END_LOCAL:
-                bcode.add(readuleb128(cm, buff), "u")
+                value, off = decode_uleb128(view, off)
+                bcode.add(value, "u")
             elif bcode_value == DBG_RESTART_LOCAL:
-                bcode.add(readuleb128(cm, buff), "u")
+                value, off = decode_uleb128(view, off)
+                bcode.add(value, "u")
             elif bcode_value == DBG_SET_PROLOGUE_END:
                 pass
             elif bcode_value == DBG_SET_EPILOGUE_BEGIN:
                 pass
             elif bcode_value == DBG_SET_FILE:
-                bcode.add(readuleb128p1(cm, buff), "u1")
+                value, off = decode_uleb128(view, off)
+                bcode.add(value - 1, "u1")
             else:  # bcode_value >= DBG_Special_Opcodes_BEGIN and bcode_value <= DBG_Special_Opcodes_END:
                 pass
 
-            bcode = DBGBytecode(self.CM, get_byte(cm, buff))
+            bcode = DBGBytecode(self.CM, view[off])
+            off += 1
             self.bytecodes.append(bcode)
 
+        buff.seek(base + off)
+
     def get_parameters_size(self):
         return self.parameters_size
 
@@ -2132,18 +2331,27 @@ class StringDataItem:
     python you ca use [get][androguard.core.dex.StringDataItem.get] which escapes invalid characters.
     """
 
-    def __init__(self, buff: BinaryIO, cm: ClassManager) -> None:
+    def __init__(
+        self, buff: BinaryIO, cm: ClassManager, values: Union[tuple, None] = None
+    ) -> None:
         """
         :param buff: a string which represents a Buff object of the `string_data_item`
         :param cm: a `ClassManager` object
+        :param values: (offset, utf16_size, data) already decoded by
+            [decode_string_data][androguard.core.dex.decode_string_data], `buff` is not read then
         """
         self.CM = cm
 
-        self.offset = buff.tell()
+        if values is None:
+            view, off, base = get_buffer_view(cm, buff)
+            (values,), off = decode_string_data(view, off, 1, base)
+            buff.seek(base + off)
 
         # Content of string_data_item
-        self.utf16_size = readuleb128(cm, buff)
-        self.data = read_null_terminated_string(buff)
+        self.offset, self.utf16_size, self.data = values
+
+        # Decoded string, see get()
+        self.__value = None
 
     def get_utf16_size(self) -> int:
         """
@@ -2173,11 +2381,47 @@ class StringDataItem:
 
         :returns: string
         """
+        if self.__value is None:
+            self.__value = self._decode(self.data)
+        return self.__value
+
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        # data never contains a NULL byte, so plain ASCII is valid MUTF-8
+        if data.isascii():
+            return data.decode('ascii')
         try:
-            return mutf8.decode(self.data)
+            return mutf8.decode(data)
         except UnicodeDecodeError:
-            logger.error("Impossible to decode {}".format(self.data))
-            return "ANDROGUARD[INVALID_STRING] {}".format(self.data)
+            logger.error("Impossible to decode {}".format(data))
+            return "ANDROGUARD[INVALID_STRING] {}".format(data)
+
+    @staticmethod
+    def get_all(items: list[StringDataItem]) -> list[str]:
+        """
+        Decode a list of `StringDataItem`, same as calling
+        [get][androguard.core.dex.StringDataItem.get] on each of them.
+
+        The items are decoded by batches: the data of a batch are joined and
+        checked at once, and a batch of plain ASCII strings (most of the
+        string pool, which is sorted) is decoded by a single `bytes.decode`.
+        Only the other batches go through the MUTF-8 decoder, string by
+        string. The strings are cached in the items.
+
+        :returns: the list of decoded strings
+        """
+        pending = [i for i in items if i.__value is None]
+        for start in range(0, len(pending), STRING_BATCH_SIZE):
+            batch = pending[start : start + STRING_BATCH_SIZE]
+            joined = b'\x00'.join([i.data for i in batch])
+            if joined.isascii():
+                values = joined.decode('ascii').split('\x00')
+                for item, value in zip(batch, values):
+                    item.__value = value
+            else:
+                for item in batch:
+                    item.__value = StringDataItem._decode(item.data)
+        return [i.__value for i in items]
 
     def show(self) -> None:
         bytecode._PrintSubBanner("String Data Item")
@@ -2207,11 +2451,99 @@ class StringDataItem:
         return len(writeuleb128(self.CM, self.utf16_size)) + len(self.data) + 1
 
 
+class IdItemTable(ABC):
+    """
+    Base class of the id sections of a dex file (`string_ids`, `type_ids`,
+    `proto_ids`, `field_ids` and `method_ids`).
+
+    The fixed size items of the section are decoded at once into `array`
+    columns. The item objects are thin accessors which are only created when
+    an entry is accessed, and then kept so that there is a single object per
+    index (hooks and resolved values stay attached to it).
+    """
+
+    #: size in bytes of one item of the section
+    item_size = 0
+
+    def __init__(self, size: int, buff: BinaryIO, cm: ClassManager) -> None:
+        """
+        :param size: the number of items
+        :param buff: a Buff object positioned on the first item
+        :param cm: a `ClassManager` object
+        """
+        self.CM = cm
+        self.offset = buff.tell()
+        self.size = size
+
+        length = size * self.item_size
+        data = buff.read(length)
+        if len(data) != length:
+            raise struct.error("unpack requires a buffer of %d bytes" % length)
+        self._decode(data)
+
+        self._items = {}
+
+    @staticmethod
+    def _columns(typecode: str, data: bytes, count: int) -> list[array]:
+        """
+        Split `data` into `count` interleaved columns of `typecode` values
+        """
+        values = array(typecode, data)
+        if sys.byteorder == 'big':
+            # DEX files are little endian, see DalvikPacker
+            values.byteswap()
+        return [values[i::count] for i in range(count)]
+
+    @abstractmethod
+    def _decode(self, data: bytes) -> None:
+        """
+        Store the raw items of the section as columns
+        """
+
+    @abstractmethod
+    def _create(self, idx: int) -> object:
+        """
+        Build the item object at `idx` from the columns
+        """
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, idx: int) -> object:
+        idx = range(self.size)[idx]
+        item = self._items.get(idx)
+        if item is None:
+            item = self._create(idx)
+            self._items[idx] = item
+        return item
+
+    def __iter__(self) -> Iterator[object]:
+        for idx in range(self.size):
+            yield self[idx]
+
+    def set_off(self, off: int) -> None:
+        self.offset = off
+
+    def get_off(self) -> int:
+        return self.offset
+
+    def get_obj(self) -> list:
+        return list(self)
+
+    def get_raw(self) -> bytes:
+        return b''.join(i.get_raw() for i in self)
+
+    def get_length(self) -> int:
+        return self.size * self.item_size
+
+
 class StringIdItem:
     """
     This class can parse a `string_id_item` of a dex file
     """
 
+    __slots__ = ('CM', 'offset', 'string_data_off')
+
     def __init__(self, buff: BinaryIO, cm: ClassManager):
         """
         :param buff: a string which represents a Buff object of the str`ing_id_item
@@ -2222,6 +2554,16 @@ class StringIdItem:
 
         (self.string_data_off,) = cm.packer["I"].unpack(buff.read(4))
 
+    @classmethod
+    def from_table(
+        cls, cm: ClassManager, offset: int, string_data_off: int
+    ) -> StringIdItem:
+        self = cls.__new__(cls)
+        self.CM = cm
+        self.offset = offset
+        self.string_data_off = string_data_off
+        return self
+
     def get_string_data_off(self) -> int:
         """
         Return the offset from the start of the file to the string data for this item
@@ -2255,11 +2597,44 @@ class StringIdItem:
         return len(self.get_obj())
 
 
+class StringIdTable(IdItemTable):
+    """
+    This class can parse the list of `string_id_item` of a dex file
+    """
+
+    item_size = 4
+
+    def _decode(self, data: bytes) -> None:
+        (self.string_data_off,) = self._columns('I', data, 1)
+
+    def _create(self, idx: int) -> StringIdItem:
+        return StringIdItem.from_table(
+            self.CM, self.offset + idx * self.item_size, self.string_data_off[idx]
+        )
+
+    def get_string_data_off(self, idx: int) -> int:
+        """
+        Return the string data offset of the item `idx`, without creating its `StringIdItem`
+
+        :raises IndexError: if there is no such item
+        """
+        item = self._items.get(idx)
+        if item is not None:
+            return item.get_string_data_off()
+        return self.string_data_off[idx]
+
+    def show(self) -> None:
+        for i in self:
+            i.show()
+
+
 class TypeIdItem:
     """
     This class can parse a `type_id_item` of a dex file
     """
 
+    __slots__ = ('CM', 'offset', 'descriptor_idx', 'descriptor_idx_value')
+
     def __init__(self, buff: BinaryIO, cm: ClassManager):
         """
         :param buff: a string which represents a Buff object of the `type_id_item`
@@ -2271,6 +2646,17 @@ class TypeIdItem:
         (self.descriptor_idx,) = cm.packer["I"].unpack(buff.read(4))
         self.descriptor_idx_value = self.CM.get_string(self.descriptor_idx)
 
+    @classmethod
+    def from_table(
+        cls, cm: ClassManager, offset: int, descriptor_idx: int
+    ) -> TypeIdItem:
+        self = cls.__new__(cls)
+        self.CM = cm
+        self.offset = offset
+        self.descriptor_idx = descriptor_idx
+        self.descriptor_idx_value = None
+        return self
+
     def get_descriptor_idx(self) -> int:
         """
         Return the index into the string_ids list for the descriptor string of this type
@@ -2285,13 +2671,18 @@ class TypeIdItem:
 
         :returns: string
         """
+        if self.descriptor_idx_value is None:
+            self.descriptor_idx_value = self.CM.get_string(self.descriptor_idx)
         return self.descriptor_idx_value
 
+    def get_off(self) -> int:
+        return self.offset
+
     def show(self) -> None:
         bytecode._PrintSubBanner("Type Id Item")
         bytecode._PrintDefault(
             "descriptor_idx=%d descriptor_idx_value=%s\n"
-            % (self.descriptor_idx, self.descriptor_idx_value)
+            % (self.descriptor_idx, self.get_descriptor_idx_value())
         )
 
     def get_obj(self) -> bytes:
@@ -2304,21 +2695,20 @@ class TypeIdItem:
         return len(self.get_obj())
 
 
-class TypeHIdItem:
+class TypeHIdItem(IdItemTable):
     """
     This class can parse a list of `type_id_item` of a dex file
     """
 
-    def __init__(self, size: int, buff: BinaryIO, cm: ClassManager) -> None:
-        """
-        :param buff: a string which represents a Buff object of the list of `type_id_item`
-        :param cm: a `ClassManager` object
-        """
-        self.CM = cm
+    item_size = 4
 
-        self.offset = buff.tell()
+    def _decode(self, data: bytes) -> None:
+        (self.descriptor_idx,) = self._columns('I', data, 1)
 
-        self.type = [TypeIdItem(buff, cm) for i in range(0, size)]
+    def _create(self, idx: int) -> TypeIdItem:
+        return TypeIdItem.from_table(
+            self.CM, self.offset + idx * self.item_size, self.descriptor_idx[idx]
+        )
 
     def get_type(self) -> list[TypeIdItem]:
         """
@@ -2326,43 +2716,36 @@ class TypeHIdItem:
 
         :returns: a list of `TypeIdItem` objects
         """
-        return self.type
+        return list(self)
 
     def get(self, idx: int) -> int:
         try:
-            return self.type[idx].get_descriptor_idx()
+            return self.descriptor_idx[idx]
         except IndexError:
             return -1
 
-    def set_off(self, off: int) -> None:
-        self.offset = off
-
-    def get_off(self) -> int:
-        return self.offset
-
     def show(self) -> None:
         bytecode._PrintSubBanner("Type List Item")
-        for i in self.type:
+        for i in self:
             i.show()
 
-    def get_obj(self) -> list[TypeIdItem]:
-        return [i for i in self.type]
-
-    def get_raw(self) -> bytes:
-        return b''.join(i.get_raw() for i in self.type)
-
-    def get_length(self) -> int:
-        length = 0
-        for i in self.type:
-            length += i.get_length()
-        return length
-
 
 class ProtoIdItem:
     """
     This class can parse a `proto_id_item` of a dex file
     """
 
+    __slots__ = (
+        'CM',
+        'offset',
+        'shorty_idx',
+        'return_type_idx',
+        'parameters_off',
+        'shorty_idx_value',
+        'return_type_idx_value',
+        'parameters_off_value',
+    )
+
     def __init__(self, buff: BinaryIO, cm: ClassManager):
         """
         :param buff: a string which represents a Buff object of the `proto_id_item`
@@ -2379,6 +2762,26 @@ class ProtoIdItem:
         self.return_type_idx_value = self.CM.get_type(self.return_type_idx)
         self.parameters_off_value = None
 
+    @classmethod
+    def from_table(
+        cls,
+        cm: ClassManager,
+        offset: int,
+        shorty_idx: int,
+        return_type_idx: int,
+        parameters_off: int,
+    ) -> ProtoIdItem:
+        self = cls.__new__(cls)
+        self.CM = cm
+        self.offset = offset
+        self.shorty_idx = shorty_idx
+        self.return_type_idx = return_type_idx
+        self.parameters_off = parameters_off
+        self.shorty_idx_value = None
+        self.return_type_idx_value = None
+        self.parameters_off_value = None
+        return self
+
     def get_shorty_idx(self) -> int:
         """
         Return the index into the `string_ids` list for the short-form descriptor string of this prototype
@@ -2434,6 +2837,9 @@ class ProtoIdItem:
             self.parameters_off_value = '(' + ' '.join(params) + ')'
         return self.parameters_off_value
 
+    def get_off(self) -> int:
+        return self.offset
+
     def show(self) -> None:
         bytecode._PrintSubBanner("Proto Item")
         bytecode._PrintDefault(
@@ -2443,8 +2849,8 @@ class ProtoIdItem:
         bytecode._PrintDefault(
             "shorty_idx_value=%s return_type_idx_value=%s parameters_off_value=%s\n"
             % (
-                self.shorty_idx_value,
-                self.return_type_idx_value,
+                self.get_shorty_idx_value(),
+                self.get_return_type_idx_value(),
                 self.parameters_off_value,
             )
         )
@@ -2466,57 +2872,55 @@ class ProtoIdItem:
         return len(self.get_obj())
 
 
-class ProtoHIdItem:
+class ProtoHIdItem(IdItemTable):
     """
     This class can parse a list of `proto_id_item` of a dex file
     """
 
-    def __init__(self, size:int, buff: BinaryIO, cm:ClassManager) -> None:
-        """
-        :param buff: a string which represents a Buff object of the list of `proto_id_item`
-        :param cm: a `ClassManager` object
-        """
-        self.CM = cm
-
-        self.offset = buff.tell()
-
-        self.proto = [ProtoIdItem(buff, cm) for i in range(0, size)]
+    item_size = 12
 
-    def set_off(self, off: int) -> None:
-        self.offset = off
+    def _decode(self, data: bytes) -> None:
+        self.shorty_idx, self.return_type_idx, self.parameters_off = (
+            self._columns('I', data, 3)
+        )
 
-    def get_off(self) -> int:
-        return self.offset
+    def _create(self, idx: int) -> ProtoIdItem:
+        return ProtoIdItem.from_table(
+            self.CM,
+            self.offset + idx * self.item_size,
+            self.shorty_idx[idx],
+            self.return_type_idx[idx],
+            self.parameters_off[idx],
+        )
 
     def get(self, idx: int) -> ProtoIdItem:
         try:
-            return self.proto[idx]
+            return self[idx]
         except IndexError:
             return ProtoIdItemInvalid()
 
     def show(self) -> None:
         bytecode._PrintSubBanner("Proto List Item")
-        for i in self.proto:
+        for i in self:
             i.show()
 
-    def get_obj(self) -> list[ProtoIdItem]:
-        return [i for i in self.proto]
-
-    def get_raw(self) -> bytes:
-        return b''.join(i.get_raw() for i in self.proto)
-
-    def get_length(self) -> int:
-        length = 0
-        for i in self.proto:
-            length += i.get_length()
-        return length
-
 
 class FieldIdItem:
     """
     This class can parse a `field_id_item` of a dex file
     """
 
+    __slots__ = (
+        'CM',
+        'offset',
+        'class_idx',
+        'type_idx',
+        'name_idx',
+        'class_idx_value',
+        'type_idx_value',
+        'name_idx_value',
+    )
+
     def __init__(self, buff: BinaryIO, cm: ClassManager) -> None:
         """"
         :param buff: a string which represents a Buff object of the `field_id_item`
@@ -2531,6 +2935,27 @@ class FieldIdItem:
 
         self.reload()
 
+    @classmethod
+    def from_table(
+        cls,
+        cm: ClassManager,
+        offset: int,
+        class_idx: int,
+        type_idx: int,
+        name_idx: int,
+    ) -> FieldIdItem:
+        # The values are resolved on first use
+        self = cls.__new__(cls)
+        self.CM = cm
+        self.offset = offset
+        self.class_idx = class_idx
+        self.type_idx = type_idx
+        self.name_idx = name_idx
+        self.class_idx_value = None
+        self.type_idx_value = None
+        self.name_idx_value = None
+        return self
+
     def reload(self) -> None:
         self.class_idx_value = self.CM.get_type(self.class_idx)
         self.type_idx_value = self.CM.get_type(self.type_idx)
@@ -2603,6 +3028,9 @@ class FieldIdItem:
     def get_list(self) -> list[str]:
         return [self.get_class_name(), self.get_type(), self.get_name()]
 
+    def get_off(self) -> int:
+        return self.offset
+
     def show(self) -> None:
         bytecode._PrintSubBanner("Field Id Item")
         bytecode._PrintDefault(
@@ -2611,7 +3039,7 @@ class FieldIdItem:
         )
         bytecode._PrintDefault(
             "class_idx_value=%s type_idx_value=%s name_idx_value=%s\n"
-            % (self.class_idx_value, self.type_idx_value, self.name_idx_value)
+            % (self.get_class_name(), self.get_type(), self.get_name())
         )
 
     def get_obj(self) -> bytes:
@@ -2626,60 +3054,59 @@ class FieldIdItem:
         return len(self.get_obj())
 
 
-class FieldHIdItem:
+class FieldHIdItem(IdItemTable):
     """
     This class can parse a list of `field_id_item` of a dex file
     """
 
-    def __init__(self, size:int, buff: BinaryIO, cm:ClassManager) -> None:
-        """
-        :param buff: a string which represents a buff object of the list of `field_id_item`
-        :param cm: a `ClassManager` object
-        """
-        self.offset = buff.tell()
+    item_size = 8
 
-        self.field_id_items = [FieldIdItem(buff, cm) for i in range(0, size)]
+    def _decode(self, data: bytes) -> None:
+        self.class_idx, self.type_idx, _, _ = self._columns('H', data, 4)
+        _, self.name_idx = self._columns('I', data, 2)
 
-    def set_off(self, off: int) -> None:
-        self.offset = off
-
-    def get_off(self) -> int:
-        return self.offset
+    def _create(self, idx: int) -> FieldIdItem:
+        return FieldIdItem.from_table(
+            self.CM,
+            self.offset + idx * self.item_size,
+            self.class_idx[idx],
+            self.type_idx[idx],
+            self.name_idx[idx],
+        )
 
     def gets(self) -> list[FieldIdItem]:
-        return self.field_id_items
+        return list(self)
 
     def get(self, idx: int) -> Union[FieldIdItem, FieldIdItemInvalid]:
         try:
-            return self.field_id_items[idx]
+            return self[idx]
         except IndexError:
             return FieldIdItemInvalid()
 
     def show(self) -> None:
         nb = 0
-        for i in self.field_id_items:
+        for i in self:
             print(nb, end=' ')
             i.show()
             nb = nb + 1
 
-    def get_obj(self) -> list[FieldIdItem]:
-        return [i for i in self.field_id_items]
-
-    def get_raw(self) -> bytes:
-        return b''.join(i.get_raw() for i in self.field_id_items)
-
-    def get_length(self) -> int:
-        length = 0
-        for i in self.field_id_items:
-            length += i.get_length()
-        return length
-
 
 class MethodIdItem:
     """
     This class can parse a `method_id_item` of a dex file
     """
-    
+
+    __slots__ = (
+        'CM',
+        'offset',
+        'class_idx',
+        'proto_idx',
+        'name_idx',
+        'class_idx_value',
+        'proto_idx_value',
+        'name_idx_value',
+    )
+
     def __init__(self, buff: BinaryIO, cm:ClassManager) -> None:
         """
         :param buff: a string which represents a Buff object of the `method_id_item`
@@ -2694,6 +3121,27 @@ class MethodIdItem:
 
         self.reload()
 
+    @classmethod
+    def from_table(
+        cls,
+        cm: ClassManager,
+        offset: int,
+        class_idx: int,
+        proto_idx: int,
+        name_idx: int,
+    ) -> MethodIdItem:
+        # The values are resolved on first use
+        self = cls.__new__(cls)
+        self.CM = cm
+        self.offset = offset
+        self.class_idx = class_idx
+        self.proto_idx = proto_idx
+        self.name_idx = name_idx
+        self.class_idx_value = None
+        self.proto_idx_value = None
+        self.name_idx_value = None
+        return self
+
     def reload(self) -> None:
         self.class_idx_value = self.CM.get_type(self.class_idx)
         self.proto_idx_value = self.CM.get_proto(self.proto_idx)
@@ -2783,6 +3231,9 @@ class MethodIdItem:
             self.get_real_descriptor(),
         )
 
+    def get_off(self) -> int:
+        return self.offset
+
     def show(self) -> None:
         bytecode._PrintSubBanner("Method Id Item")
         bytecode._PrintDefault(
@@ -2791,7 +3242,7 @@ class MethodIdItem:
         )
         bytecode._PrintDefault(
             "class_idx_value=%s proto_idx_value=%s name_idx_value=%s\n"
-            % (self.class_idx_value, self.proto_idx_value, self.name_idx_value)
+            % (self.get_class_name(), self.get_proto(), self.get_name())
         )
 
     def get_obj(self) -> bytes:
@@ -2805,63 +3256,48 @@ class MethodIdItem:
     def get_length(self) -> int:
         return len(self.get_obj())
 
-
-class MethodHIdItem:
+class MethodHIdItem(IdItemTable):
     """
     This class can parse a list of `method_id_item` of a dex file
     """
 
+    item_size = 8
 
-    def __init__(self, size:int, buff: BinaryIO, cm:ClassManager) -> None:
-        """
-        :param buff: a string which represents a Buff object of the list of `method_id_item`
-        :param cm: a `ClassManager` object
-        """
-        self.CM = cm
-
-        self.offset = buff.tell()
+    def _decode(self, data: bytes) -> None:
+        self.class_idx, self.proto_idx, _, _ = self._columns('H', data, 4)
+        _, self.name_idx = self._columns('I', data, 2)
 
-        self.method_id_items = [MethodIdItem(buff, cm) for i in range(0, size)]
-
-    def set_off(self, off: int):
-        self.offset = off
-
-    def get_off(self) -> int:
-        return self.offset
+    def _create(self, idx: int) -> MethodIdItem:
+        return MethodIdItem.from_table(
+            self.CM,
+            self.offset + idx * self.item_size,
+            self.class_idx[idx],
+            self.proto_idx[idx],
+            self.name_idx[idx],
+        )
 
     def gets(self) -> list[MethodIdItem]:
-        return self.method_id_items
+        return list(self)
 
     def get(self, idx) -> Union[MethodIdItem, MethodIdItemInvalid]:
         try:
-            return self.method_id_items[idx]
+            return self[idx]
         except IndexError:
             return MethodIdItemInvalid()
 
     def reload(self) -> None:
-        for i in self.method_id_items:
+        # Items not created yet are resolved on first use anyway
+        for i in self._items.values():
             i.reload()
 
     def show(self) -> None:
         print("METHOD_ID_ITEM")
         nb = 0
-        for i in self.method_id_items:
+        for i in self:
             print(nb, end=' ')
             i.show()
             nb = nb + 1
 
-    def get_obj(self) -> list[MethodIdItem]:
-        return [i for i in self.method_id_items]
-
-    def get_raw(self) -> bytes:
-        return b''.join(i.get_raw() for i in self.method_id_items)
-
-    def get_length(self) -> int:
-        length = 0
-        for i in self.method_id_items:
-            length += i.get_length()
-        return length
-
 
 class ProtoIdItemInvalid:
     def get_params(self) -> str:
@@ -2927,16 +3363,23 @@ class EncodedField:
     This class can parse an `encoded_field` of a dex file
     """
 
-    def __init__(self, buff: BinaryIO, cm:ClassManager) -> None:
+    def __init__(
+        self, buff: BinaryIO, cm: ClassManager, values: Union[tuple, None] = None
+    ) -> None:
         """
         :param buff: a string which represents a buff object of the `encoded_field`
         :param cm: a `ClassManager` object
+        :param values: (offset, field_idx_diff, access_flags) already decoded by
+            [decode_class_data][androguard.core.dex.decode_class_data], `buff` is not read then
         """
         self.CM = cm
-        self.offset = buff.tell()
+        if values is None:
+            self.offset = buff.tell()
 
-        self.field_idx_diff = readuleb128(cm, buff)
-        self.access_flags = readuleb128(cm, buff)
+            self.field_idx_diff = readuleb128(cm, buff)
+            self.access_flags = readuleb128(cm, buff)
+        else:
+            self.offset, self.field_idx_diff, self.access_flags = values
 
         self.field_idx = 0
 
@@ -3109,21 +3552,33 @@ class EncodedMethod:
     This class can parse an `encoded_method` of a dex file
     """
 
-    def __init__(self, buff: BinaryIO, cm:ClassManager) -> None:
+    def __init__(
+        self, buff: BinaryIO, cm: ClassManager, values: Union[tuple, None] = None
+    ) -> None:
         """
         :param buff: a string which represents a buff object of the `encoded_method`
         :param cm: a `ClassManager` object
+        :param values: (offset, method_idx_diff, access_flags, code_off) already decoded by
+            [decode_class_data][androguard.core.dex.decode_class_data], `buff` is not read then
         """
         self.CM = cm
-        self.offset = buff.tell()
-
-        self.method_idx_diff = readuleb128(
-            cm, buff
-        )  #: method index diff in the corresponding section
-        self.access_flags = readuleb128(
-            cm, buff
-        )  #: access flags of the method
-        self.code_off = readuleb128(cm, buff)  #: offset of the code section
+        if values is None:
+            self.offset = buff.tell()
+
+            self.method_idx_diff = readuleb128(
+                cm, buff
+            )  #: method index diff in the corresponding section
+            self.access_flags = readuleb128(
+                cm, buff
+            )  #: access flags of the method
+            self.code_off = readuleb128(cm, buff)  #: offset of the code section
+        else:
+            (
+                self.offset,
+                self.method_idx_diff,
+                self.access_flags,
+                self.code_off,
+            ) = values
 
         self.method_idx = 0
 
@@ -3628,10 +4083,17 @@ class ClassDataItem:
 
         self.offset = buff.tell()
 
-        self.static_fields_size = readuleb128(cm, buff)
-        self.instance_fields_size = readuleb128(cm, buff)
-        self.direct_methods_size = readuleb128(cm, buff)
-        self.virtual_methods_size = readuleb128(cm, buff)
+        # The whole item is decoded at once
+        view, off, base = get_buffer_view(cm, buff)
+        sizes, members, off = decode_class_data(view, off)
+        buff.seek(base + off)
+
+        (
+            self.static_fields_size,
+            self.instance_fields_size,
+            self.direct_methods_size,
+            self.virtual_methods_size,
+        ) = sizes
 
         self.static_fields = []
         self.instance_fields = []
@@ -3639,7 +4101,12 @@ class ClassDataItem:
         self.virtual_methods = []
 
         self._load_elements(
-            self.static_fields_size, self.static_fields, EncodedField, buff, cm
+            self.static_fields_size,
+            self.static_fields,
+            EncodedField,
+            buff,
+            cm,
+            members[0],
         )
         self._load_elements(
             self.instance_fields_size,
@@ -3647,6 +4114,7 @@ class ClassDataItem:
             EncodedField,
             buff,
             cm,
+            members[1],
         )
         self._load_elements(
             self.direct_methods_size,
@@ -3654,6 +4122,7 @@ class ClassDataItem:
             EncodedMethod,
             buff,
             cm,
+            members[2],
         )
         self._load_elements(
             self.virtual_methods_size,
@@ -3661,6 +4130,7 @@ class ClassDataItem:
             EncodedMethod,
             buff,
             cm,
+            members[3],
         )
 
     def get_static_fields_size(self) -> int:
@@ -3759,10 +4229,10 @@ class ClassDataItem:
                 for i in range(0, len(values)):
                     self.static_fields[i].set_init_value(values[i])
 
-    def _load_elements(self, size, l, Type, buff, cm):
+    def _load_elements(self, size, l, Type, buff, cm, members=None):
         prev = 0
         for i in range(0, size):
-            el = Type(buff, cm)
+            el = Type(buff, cm, members[i] if members is not None else None)
             el.adjust_idx(prev)
 
             if isinstance(el, EncodedField):
@@ -4689,17 +5159,18 @@ class FillArrayData:
         self.CM = cm
 
         self.format_general_size = calcsize("2HI")
-        self.ident, self.element_width, self.size = cm.packer["2HI"].unpack(
-            buff[0:8]
-        )
+        self.ident, self.element_width, self.size = cm.packer["2HI"].unpack_from(buff)
 
         buf_len = self.size * self.element_width
         if buf_len % 2:
             buf_len += 1
 
-        self.data = buff[
-            self.format_general_size : self.format_general_size + buf_len
-        ]
+        # Copy: buff may be a view on the whole method bytecode
+        self.data = bytes(
+            buff[
+                self.format_general_size : self.format_general_size + buf_len
+            ]
+        )
 
     def add_note(self, msg: str) -> None:
         """
@@ -4835,18 +5306,18 @@ class SparseSwitch:
         self.CM = cm
 
         self.format_general_size = calcsize("2H")
-        self.ident, self.size = cm.packer["2H"].unpack(buff[0:4])
+        self.ident, self.size = cm.packer["2H"].unpack_from(buff)
 
         self.keys = []
         self.targets = []
 
         idx = self.format_general_size
         for i in range(0, self.size):
-            self.keys.append(cm.packer["l"].unpack(buff[idx : idx + 4])[0])
+            self.keys.append(cm.packer["l"].unpack_from(buff, idx)[0])
             idx += 4
 
         for i in range(0, self.size):
-            self.targets.append(cm.packer["l"].unpack(buff[idx : idx + 4])[0])
+            self.targets.append(cm.packer["l"].unpack_from(buff, idx)[0])
             idx += 4
 
     def add_note(self, msg: str) -> None:
@@ -4976,9 +5447,7 @@ class PackedSwitch:
 
         self.format_general_size = calcsize("2HI")
 
-        self.ident, self.size, self.first_key = cm.packer["2Hi"].unpack(
-            buff[0:8]
-        )
+        self.ident, self.size, self.first_key = cm.packer["2Hi"].unpack_from(buff)
 
         self.targets = []
 
@@ -4989,7 +5458,7 @@ class PackedSwitch:
             max_size = len(buff) - idx - 8
 
         for i in range(0, max_size):
-            self.targets.append(cm.packer["l"].unpack(buff[idx : idx + 4])[0])
+            self.targets.append(cm.packer["l"].unpack_from(buff, idx)[0])
             idx += 4
 
     def add_note(self, msg: str) -> None:
@@ -5115,7 +5584,7 @@ class Instruction35c(Instruction):
         super().__init__()
         self.cm = cm
 
-        i16a, self.BBBB, i16b = cm.packer["3H"].unpack(buff[: self.length])
+        i16a, self.BBBB, i16b = cm.packer["3H"].unpack_from(buff)
         self.OP = i16a & 0xFF
         self.G = (i16a >> 8) & 0xF
         self.A = (i16a >> 12) & 0xF
@@ -5232,7 +5701,7 @@ class Instruction10x(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, padding = cm.packer["BB"].unpack(buff[: self.length])
+        self.OP, padding = cm.packer["BB"].unpack_from(buff)
         if padding != 0:
             raise InvalidInstruction(
                 'High byte of opcode with format 10x must be zero!'
@@ -5253,9 +5722,7 @@ class Instruction21h(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA, self.__BBBB = cm.packer["BBh"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.__BBBB = cm.packer["BBh"].unpack_from(buff)
 
         if self.OP == 0x15:
             # OP 0x15: int16_t -> int32_t
@@ -5291,7 +5758,7 @@ class Instruction11n(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, i8 = cm.packer["Bb"].unpack(buff[: self.length])
+        self.OP, i8 = cm.packer["Bb"].unpack_from(buff)
         self.A = i8 & 0xF
         # Sign extension not required
         self.B = i8 >> 4
@@ -5321,9 +5788,7 @@ class Instruction21c(Instruction):
     def __init__(self, cm: ClassManager, buff: bytes) -> None:
         super().__init__()
         self.cm = cm
-        self.OP, self.AA, self.BBBB = cm.packer["BBH"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BBBB = cm.packer["BBH"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         kind = get_kind(self.cm, self.get_kind(), self.BBBB)
@@ -5363,9 +5828,7 @@ class Instruction21s(Instruction):
         self.cm = cm
 
         # BBBB is a signed int (16bit)
-        self.OP, self.AA, self.BBBB = self.cm.packer["BBh"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BBBB = self.cm.packer["BBh"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         return "v{}, {}".format(self.AA, self.BBBB)
@@ -5391,7 +5854,7 @@ class Instruction22c(Instruction):
         super().__init__()
         self.cm = cm
 
-        i16, self.CCCC = cm.packer["2H"].unpack(buff[: self.length])
+        i16, self.CCCC = cm.packer["2H"].unpack_from(buff)
         self.OP = i16 & 0xFF
         self.A = (i16 >> 8) & 0xF
         self.B = (i16 >> 12) & 0xF
@@ -5428,7 +5891,7 @@ class Instruction22cs(Instruction):
         super().__init__()
         self.cm = cm
 
-        i16, self.CCCC = cm.packer["2H"].unpack(buff[: self.length])
+        i16, self.CCCC = cm.packer["2H"].unpack_from(buff)
         self.OP = i16 & 0xFF
         self.A = (i16 >> 8) & 0xF
         self.B = (i16 >> 12) & 0xF
@@ -5465,9 +5928,7 @@ class Instruction31t(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA, self.BBBBBBBB = cm.packer["BBi"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BBBBBBBB = cm.packer["BBi"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         return "v{}, {:+08x}h".format(self.AA, self.BBBBBBBB)
@@ -5494,9 +5955,7 @@ class Instruction31c(Instruction):
     def __init__(self, cm: ClassManager, buff: bytes) -> None:
         super().__init__()
         self.cm = cm
-        self.OP, self.AA, self.BBBBBBBB = cm.packer["BBi"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BBBBBBBB = cm.packer["BBi"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         kind = get_kind(self.cm, self.get_kind(), self.BBBBBBBB)
@@ -5540,7 +5999,7 @@ class Instruction12x(Instruction):
         super().__init__()
         self.cm = cm
 
-        (i16,) = cm.packer["h"].unpack(buff[: self.length])
+        (i16,) = cm.packer["h"].unpack_from(buff)
         self.OP = i16 & 0xFF
         self.A = (i16 >> 8) & 0xF
         self.B = (i16 >> 12) & 0xF
@@ -5568,7 +6027,7 @@ class Instruction11x(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA = cm.packer["BB"].unpack(buff[: self.length])
+        self.OP, self.AA = cm.packer["BB"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         return "v{}".format(self.AA)
@@ -5592,9 +6051,7 @@ class Instruction51l(Instruction):
         self.cm = cm
 
         # arbitrary double-width (64-bit) constant
-        self.OP, self.AA, self.BBBBBBBBBBBBBBBB = cm.packer["BBq"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BBBBBBBBBBBBBBBB = cm.packer["BBq"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         return "v{}, {}".format(self.AA, self.BBBBBBBBBBBBBBBB)
@@ -5625,9 +6082,7 @@ class Instruction31i(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA, self.BBBBBBBB = cm.packer["BBi"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BBBBBBBB = cm.packer["BBi"].unpack_from(buff)
 
         # 0x14 // const vAA, #+BBBBBBBB: arbitrary 32-bit constant
         # 0x17 // const-wide/32 vAA, #+BBBBBBBB: signed int (32 bits)
@@ -5657,9 +6112,7 @@ class Instruction22x(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA, self.BBBB = cm.packer["BBH"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BBBB = cm.packer["BBH"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         return "v{}, v{}".format(self.AA, self.BBBB)
@@ -5682,9 +6135,7 @@ class Instruction23x(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA, self.BB, self.CC = cm.packer["BBBB"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BB, self.CC = cm.packer["BBBB"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         return "v{}, v{}, v{}".format(self.AA, self.BB, self.CC)
@@ -5713,9 +6164,7 @@ class Instruction20t(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, padding, self.AAAA = cm.packer["BBh"].unpack(
-            buff[: self.length]
-        )
+        self.OP, padding, self.AAAA = cm.packer["BBh"].unpack_from(buff)
         if padding != 0:
             raise InvalidInstruction(
                 'High byte of opcode with format 20t must be zero!'
@@ -5746,9 +6195,7 @@ class Instruction21t(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA, self.BBBB = cm.packer["BBh"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BBBB = cm.packer["BBh"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         return "v{}, {:+04x}h".format(self.AA, self.BBBB)
@@ -5774,7 +6221,7 @@ class Instruction10t(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA = cm.packer["Bb"].unpack(buff[: self.length])
+        self.OP, self.AA = cm.packer["Bb"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         # Offset is given in 16bit units
@@ -5801,7 +6248,7 @@ class Instruction22t(Instruction):
         super().__init__()
         self.cm = cm
 
-        i16, self.CCCC = cm.packer["Hh"].unpack(buff[: self.length])
+        i16, self.CCCC = cm.packer["Hh"].unpack_from(buff)
         self.OP = i16 & 0xFF
         self.A = (i16 >> 8) & 0xF
         self.B = (i16 >> 12) & 0xF
@@ -5836,7 +6283,7 @@ class Instruction22s(Instruction):
         super().__init__()
         self.cm = cm
 
-        i16, self.CCCC = cm.packer["Hh"].unpack(buff[: self.length])
+        i16, self.CCCC = cm.packer["Hh"].unpack_from(buff)
         self.OP = i16 & 0xFF
         self.A = (i16 >> 8) & 0xF
         self.B = (i16 >> 12) & 0xF
@@ -5871,9 +6318,7 @@ class Instruction22b(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA, self.BB, self.CC = cm.packer["BBBb"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BB, self.CC = cm.packer["BBBb"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         return "v{}, v{}, {}".format(self.AA, self.BB, self.CC)
@@ -5905,9 +6350,7 @@ class Instruction30t(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, padding, self.AAAAAAAA = cm.packer["BBi"].unpack(
-            buff[: self.length]
-        )
+        self.OP, padding, self.AAAAAAAA = cm.packer["BBi"].unpack_from(buff)
         if padding != 0:
             raise InvalidInstruction(
                 'High byte of opcode with format 30t must be zero!'
@@ -5937,9 +6380,7 @@ class Instruction3rc(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA, self.BBBB, self.CCCC = cm.packer["BBHH"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BBBB, self.CCCC = cm.packer["BBHH"].unpack_from(buff)
 
         self.NNNN = self.CCCC + self.AA - 1
 
@@ -5978,9 +6419,7 @@ class Instruction32x(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, padding, self.AAAA, self.BBBB = cm.packer["BBHH"].unpack(
-            buff[: self.length]
-        )
+        self.OP, padding, self.AAAA, self.BBBB = cm.packer["BBHH"].unpack_from(buff)
         if padding != 0:
             raise InvalidInstruction(
                 'High byte of opcode with format 32x must be zero!'
@@ -6007,9 +6446,7 @@ class Instruction20bc(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA, self.BBBB = cm.packer["BBH"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BBBB = cm.packer["BBH"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         return "{}, {}".format(self.AA, self.BBBB)
@@ -6032,7 +6469,7 @@ class Instruction35mi(Instruction):
         super().__init__()
         self.cm = cm
 
-        i16a, self.BBBB, i16b = cm.packer["3H"].unpack(buff[: self.length])
+        i16a, self.BBBB, i16b = cm.packer["3H"].unpack_from(buff)
         self.OP = i16a & 0xFF
         self.G = (i16a >> 8) & 0xF
         self.A = (i16a >> 12) & 0xF
@@ -6142,7 +6579,7 @@ class Instruction35ms(Instruction):
         super().__init__()
         self.cm = cm
 
-        i16a, self.BBBB, i16b = cm.packer["3H"].unpack(buff[: self.length])
+        i16a, self.BBBB, i16b = cm.packer["3H"].unpack_from(buff)
         self.OP = i16a & 0xFF
         self.G = (i16a >> 8) & 0xF
         self.A = (i16a >> 12) & 0xF
@@ -6254,9 +6691,7 @@ class Instruction3rmi(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA, self.BBBB, self.CCCC = cm.packer["BBHH"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BBBB, self.CCCC = cm.packer["BBHH"].unpack_from(buff)
 
         self.NNNN = self.CCCC + self.AA - 1
 
@@ -6306,9 +6741,7 @@ class Instruction3rms(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.AA, self.BBBB, self.CCCC = cm.packer["BBHH"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.AA, self.BBBB, self.CCCC = cm.packer["BBHH"].unpack_from(buff)
 
         self.NNNN = self.CCCC + self.AA - 1
 
@@ -6358,9 +6791,7 @@ class Instruction41c(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.BBBBBBBB, self.AAAA = cm.packer["HIH"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.BBBBBBBB, self.AAAA = cm.packer["HIH"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         kind = get_kind(self.cm, self.get_kind(), self.BBBBBBBB)
@@ -6393,9 +6824,7 @@ class Instruction40sc(Instruction):
         super().__init__()
         self.cm = cm
 
-        self.OP, self.BBBBBBBB, self.AAAA = cm.packer["HIH"].unpack(
-            buff[: self.length]
-        )
+        self.OP, self.BBBBBBBB, self.AAAA = cm.packer["HIH"].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         kind = get_kind(self.cm, self.get_kind(), self.BBBBBBBB)
@@ -6432,7 +6861,7 @@ class Instruction52c(Instruction):
         # Using 16bit for opcode, but its ODEX, so...
         self.OP, self.CCCCCCCC, self.AAAA, self.BBBB = cm.packer[
             "HI2H"
-        ].unpack(buff[: self.length])
+        ].unpack_from(buff)
 
     def get_output(self, idx: int = -1) -> str:
         kind = get_kind(self.cm, self.get_kind(), self.CCCCCCCC)
@@ -6470,7 +6899,7 @@ class Instruction5rc(Instruction):
 
         self.OP, self.BBBBBBBB, self.AAAA, self.CCCC = cm.packer[
             "HI2H"
-        ].unpack(buff[: self.length])
+        ].unpack_from(buff)
 
         self.NNNN = self.CCCC + self.AAAA - 1
 
@@ -6518,7 +6947,7 @@ class Instruction45cc(Instruction):
         # Note: the documentation says A|G|op|BBBB ... but we need to parse op|A|G because of LE
         self.OP, reg1, self.BBBB, reg2, self.HHHH = self.cm.packer[
             "BBHHH"
-        ].unpack(buff[: self.get_length()])
+        ].unpack_from(buff)
         # TODO need to check if registers are correct
         self.A = (reg1 & 0xF0) >> 4
         if self.A > 5:
@@ -6582,7 +7011,7 @@ class Instruction4rcc(Instruction):
 
         self.OP, self.AA, self.BBBB, self.CCCC, self.HHHH = self.cm.packer[
             'BBHHH'
-        ].unpack(buff[: self.get_length()])
+        ].unpack_from(buff)
         self.NNNN = self.AA + self.CCCC - 1
 
     def get_raw(self) -> bytes:
@@ -6974,7 +7403,7 @@ def get_instruction(
         # FIXME: there are other possible errors too...
         raise InvalidInstruction(
             "Invalid Instruction for '0x{:02x}': {}".format(
-                op_value, repr(buff)
+                op_value, repr(bytes(buff))
             )
         )
 
@@ -6996,7 +7425,7 @@ def get_optimized_instruction(
         # FIXME: there are other possible errors too...
         raise InvalidInstruction(
             "Invalid Instruction for '0x{:04x}': {}".format(
-                op_value, repr(buff)
+                op_value, repr(bytes(buff))
             )
         )
 
@@ -7010,7 +7439,7 @@ def get_instruction_payload(
         # FIXME: there are other possible errors too...
         raise InvalidInstruction(
             "Invalid Instruction for '0x{:04x}': {}".format(
-                op_value, repr(buff)
+                op_value, repr(bytes(buff))
             )
         )
 
@@ -7040,39 +7469,23 @@ class LinearSweepAlgorithm:
         :returns: iterator over `Instruction`s
         """
         is_odex = cm.get_odex_format()
+        max_idx = LinearSweepAlgorithm._get_max_idx(size, insn)
 
-        max_idx = size * calcsize('H')
-        if max_idx > len(insn):
-            logger.warning(
-                "Declared size of instructions is larger than the bytecode!"
-            )
-            max_idx = len(insn)
+        # Every instruction is decoded from a view on the method bytecode:
+        # slicing it does not copy the remaining bytes
+        view = memoryview(insn)
+        unpack_op = cm.packer['H'].unpack_from
 
         # Get instructions
         # TODO sometimes there are padding bytes after the last instruction, to ensure 16bit alignment.
         while idx < max_idx:
             # Get one 16bit unit
-            # TODO: possible optimization; instead of reading the first 16 bits twice,
-            #       just push this into the Instruction's constructor
-            (op_value,) = cm.packer['H'].unpack(insn[idx : idx + 2])
+            (op_value,) = unpack_op(view, idx)
 
             try:
-                if op_value > 0xFF and (op_value & 0xFF) in (0x00, 0xFF):
-                    # FIXME: in theory, it could happen that this is a normal opcode? I.e. a 0xff opcode with AA being non zero
-                    if op_value in DALVIK_OPCODES_PAYLOAD:
-                        # payload instructions, i.e. for arrays or switch
-                        obj = get_instruction_payload(op_value, cm, insn[idx:])
-                    elif is_odex and (op_value in DALVIK_OPCODES_OPTIMIZED):
-                        # optimized instructions, only of ODEX file
-                        obj = get_optimized_instruction(
-                            cm, op_value, insn[idx:]
-                        )
-                    else:
-                        raise InvalidInstruction(
-                            "Unknown Instruction '0x{:04x}'".format(op_value)
-                        )
-                else:
-                    obj = get_instruction(cm, op_value & 0xFF, insn[idx:])
+                obj = LinearSweepAlgorithm._decode(
+                    cm, op_value, view[idx:], is_odex
+                )
             except InvalidInstruction as e:
                 raise InvalidInstruction(
                     "Invalid instruction encountered! Stop parsing bytecode at idx %s. Message: %s",
@@ -7083,6 +7496,99 @@ class LinearSweepAlgorithm:
             yield obj
             idx += obj.get_length()
 
+    @staticmethod
+    def get_records(
+        cm: ClassManager, size: int, insn: bytearray, idx: int
+    ) -> list[tuple[int, tuple[int, ...], int]]:
+        """
+        Compact variant of `get_instructions`, for consumers which only scan
+        opcodes and operands and do not need `Instruction` objects.
+
+        The fixed size formats are not instantiated: their length is taken
+        from the format class and their operands are read as raw 16-bit code
+        units. Only the framing is checked, not the format specific fields
+        (e.g. the padding of a 10x). Payloads and optimized instructions have
+        a variable length and are still decoded by their class.
+
+        :param cm: a `ClassManager` object
+        :param size: the total size of the buffer in 16-bit units
+        :param insn: a raw buffer where are the instructions
+        :param idx: a start address in the buffer
+        :raises InvalidInstruction: if an instruction is invalid
+        :returns: list of (opcode, operands, length) records. opcode is the
+            16-bit ident for payloads and optimized instructions, operands are
+            the code units following the opcode unit and length is in bytes
+        """
+        is_odex = cm.get_odex_format()
+        max_idx = LinearSweepAlgorithm._get_max_idx(size, insn)
+
+        view = memoryview(insn)
+        packer = cm.packer
+        unpack_op = packer['H'].unpack_from
+        end = len(view)
+
+        records = []
+        while idx < max_idx:
+            (op_value,) = unpack_op(view, idx)
+            opcode = op_value & 0xFF
+
+            try:
+                if op_value > 0xFF and opcode in (0x00, 0xFF):
+                    opcode = op_value
+                    length = 0
+                else:
+                    length = DALVIK_OPCODES_FORMAT[opcode][0].length
+
+                if not length or idx + length > end:
+                    # Variable length, unused or truncated instruction: let
+                    # its class decode it or raise the usual error
+                    length = LinearSweepAlgorithm._decode(
+                        cm, op_value, view[idx:], is_odex
+                    ).get_length()
+            except InvalidInstruction as e:
+                raise InvalidInstruction(
+                    "Invalid instruction encountered! Stop parsing bytecode at idx %s. Message: %s",
+                    idx,
+                    e,
+                )
+
+            units = (length >> 1) - 1
+            if units > 0:
+                operands = packer['%dH' % units].unpack_from(view, idx + 2)
+            else:
+                operands = ()
+            records.append((opcode, operands, length))
+            idx += length
+
+        return records
+
+    @staticmethod
+    def _get_max_idx(size: int, insn: bytearray) -> int:
+        max_idx = size * calcsize('H')
+        if max_idx > len(insn):
+            logger.warning(
+                "Declared size of instructions is larger than the bytecode!"
+            )
+            max_idx = len(insn)
+        return max_idx
+
+    @staticmethod
+    def _decode(
+        cm: ClassManager, op_value: int, buff: memoryview, is_odex: bool
+    ) -> Instruction:
+        if op_value > 0xFF and (op_value & 0xFF) in (0x00, 0xFF):
+            # FIXME: in theory, it could happen that this is a normal opcode? I.e. a 0xff opcode with AA being non zero
+            if op_value in DALVIK_OPCODES_PAYLOAD:
+                # payload instructions, i.e. for arrays or switch
+                return get_instruction_payload(op_value, cm, buff)
+            elif is_odex and (op_value in DALVIK_OPCODES_OPTIMIZED):
+                # optimized instructions, only of ODEX file
+                return get_optimized_instruction(cm, op_value, buff)
+            raise InvalidInstruction(
+                "Unknown Instruction '0x{:04x}'".format(op_value)
+            )
+        return get_instruction(cm, op_value & 0xFF, buff)
+
 
 class DCode:
     """
@@ -7161,6 +7667,17 @@ class DCode:
         for i in self.cached_instructions:
             yield i
 
+    def get_records(self) -> list[tuple[int, tuple[int, ...], int]]:
+        """
+        Return the compact (opcode, operands, length) records of the bytecode,
+        see [LinearSweepAlgorithm.get_records][androguard.core.dex.LinearSweepAlgorithm.get_records]
+
+        :returns: a list of records, no `Instruction` is kept in cache
+        """
+        return LinearSweepAlgorithm.get_records(
+            self.CM, self.size, self.insn, self.idx
+        )
+
     def add_inote(
         self, msg: str, idx: int, off: Union[int, None] = None
     ) -> None:
@@ -7641,7 +8158,7 @@ class MapItem:
         if TypeMapItem.STRING_ID_ITEM == self.type:
             # Byte aligned
             buff.seek(self.offset)
-            self.item = [StringIdItem(buff, cm) for _ in range(self.size)]
+            self.item = StringIdTable(self.size, buff, cm)
 
         elif TypeMapItem.CODE_ITEM == self.type:
             # 4-byte aligned
@@ -7716,7 +8233,10 @@ class MapItem:
         elif TypeMapItem.STRING_DATA_ITEM == self.type:
             # Byte aligned
             buff.seek(self.offset)
-            self.item = [StringDataItem(buff, cm) for _ in range(self.size)]
+            view, off, base = get_buffer_view(cm, buff)
+            items, off = decode_string_data(view, off, self.size, base)
+            buff.seek(base + off)
+            self.item = [StringDataItem(buff, cm, values) for values in items]
 
         elif TypeMapItem.DEBUG_INFO_ITEM == self.type:
             # Byte aligned
@@ -7816,9 +8336,15 @@ class ClassManager:
 
         self.__packer = None
 
+        # memoryview on the DEX file, for the bulk decoders
+        self.__view = None
+
         self.__manage_item = {}
         self.__manage_item_off = []
 
+        # Lazy MapList with sections left to parse, None otherwise
+        self.__map_list = None
+
         self.__strings_off = {}
         self.__typelists_off = {}
         self.__classdata_off = {}
@@ -7843,6 +8369,28 @@ class ClassManager:
     def packer(self, p):
         self.__packer = p
 
+    def set_view(self, view: memoryview) -> None:
+        self.__view = view
+
+    def get_view(self) -> Union[memoryview, None]:
+        """
+        Return a memoryview on the DEX file, the offsets of the items are
+        offsets in this view (None if the `ClassManager` has no DEX buffer)
+        """
+        return self.__view
+
+    def set_map_list(self, map_list: Union[MapList, None]) -> None:
+        self.__map_list = map_list
+
+    def _require(self, ttype: TypeMapItem) -> None:
+        # Lazy mode: make sure the section has been parsed
+        if self.__map_list is not None:
+            self.__map_list.load_type(ttype)
+
+    def _require_all(self) -> None:
+        if self.__map_list is not None:
+            self.__map_list.load_all()
+
     def get_ascii_string(self, s: str) -> str:
         # TODO Remove method
         try:
@@ -7867,12 +8415,15 @@ class ClassManager:
         """
         Returns a object from as given offset inside the DEX file
         """
+        self._require_all()
         return self.__obj_offset[offset]
 
     def get_item_by_offset(self, offset: int) -> object:
+        self._require_all()
         return self.__item_offset[offset]
 
     def get_string_by_offset(self, offset: int) -> object:
+        self._require(TypeMapItem.STRING_DATA_ITEM)
         return self.__strings_off[offset]
 
     def set_decompiler(self, decompiler: DecompilerDAD) -> None:
@@ -7895,34 +8446,36 @@ class ClassManager:
         if item is None:
             pass
         elif isinstance(item, list):
-            for i in item:
-                goff = i.offset
-                self.__manage_item_off.append(goff)
-
-                self.__obj_offset[i.get_off()] = i
-
-                if type_item == TypeMapItem.STRING_DATA_ITEM:
-                    self.__strings_off[goff] = i
-                elif type_item == TypeMapItem.TYPE_LIST:
-                    self.__typelists_off[goff] = i
-                elif type_item == TypeMapItem.CLASS_DATA_ITEM:
-                    self.__classdata_off[goff] = i
+            offsets = [i.offset for i in item]
+            self.__manage_item_off.extend(offsets)
+
+            self.__obj_offset.update((i.get_off(), i) for i in item)
+
+            if type_item == TypeMapItem.STRING_DATA_ITEM:
+                self.__strings_off.update(zip(offsets, item))
+            elif type_item == TypeMapItem.TYPE_LIST:
+                self.__typelists_off.update(zip(offsets, item))
+            elif type_item == TypeMapItem.CLASS_DATA_ITEM:
+                self.__classdata_off.update(zip(offsets, item))
         else:
             self.__manage_item_off.append(c_item.get_offset())
 
     def get_code(self, idx: int) -> Union[DalvikCode, None]:
+        self._require(TypeMapItem.CODE_ITEM)
         try:
             return self.__manage_item[TypeMapItem.CODE_ITEM].get_code(idx)
         except KeyError:
             return None
 
     def get_class_data_item(self, off: int) -> ClassDataItem:
+        self._require(TypeMapItem.CLASS_DATA_ITEM)
         i = self.__classdata_off.get(off)
         if i is None:
             logger.warning("unknown class data item @ 0x%x" % off)
         return i
 
     def get_encoded_array_item(self, off: int) -> EncodedArrayItem:
+        self._require(TypeMapItem.ENCODED_ARRAY_ITEM)
         for i in self.__manage_item[TypeMapItem.ENCODED_ARRAY_ITEM]:
             if i.get_off() == off:
                 return i
@@ -7930,11 +8483,13 @@ class ClassManager:
     def get_annotations_directory_item(
         self, off: int
     ) -> AnnotationsDirectoryItem:
+        self._require(TypeMapItem.ANNOTATIONS_DIRECTORY_ITEM)
         for i in self.__manage_item[TypeMapItem.ANNOTATIONS_DIRECTORY_ITEM]:
             if i.get_off() == off:
                 return i
 
     def get_annotation_set_item(self, off: int) -> AnnotationSetItem:
+        self._require(TypeMapItem.ANNOTATION_SET_ITEM)
         for i in self.__manage_item[TypeMapItem.ANNOTATION_SET_ITEM]:
             if i.get_off() == off:
                 return i
@@ -7945,6 +8500,7 @@ class ClassManager:
                 return i
 
     def get_annotation_item(self, off: int) -> AnnotationItem:
+        self._require(TypeMapItem.ANNOTATION_ITEM)
         for i in self.__manage_item[TypeMapItem.ANNOTATION_ITEM]:
             if i.get_off() == off:
                 return i
@@ -7952,6 +8508,7 @@ class ClassManager:
     def get_hiddenapi_class_data_item(
         self, off: int
     ) -> HiddenApiClassDataItem:
+        self._require(TypeMapItem.HIDDENAPI_CLASS_DATA_ITEM)
         for i in self.__manage_item[TypeMapItem.HIDDENAPI_CLASS_DATA_ITEM]:
             if i.get_off() == off:
                 return i
@@ -7977,10 +8534,13 @@ class ClassManager:
 
         :param idx: the index in the string section
         """
+        if self.__map_list is not None:
+            self.__map_list.load_type(TypeMapItem.STRING_ID_ITEM)
+            self.__map_list.load_type(TypeMapItem.STRING_DATA_ITEM)
         try:
-            off = self.__manage_item[TypeMapItem.STRING_ID_ITEM][
-                idx
-            ].get_string_data_off()
+            off = self.__manage_item[
+                TypeMapItem.STRING_ID_ITEM
+            ].get_string_data_off(idx)
         except IndexError:
             logger.warning("unknown string item @ %d" % idx)
             return "AG:IS: invalid string"
@@ -7995,6 +8555,7 @@ class ClassManager:
         if off == 0:
             return []
 
+        self._require(TypeMapItem.TYPE_LIST)
         i = self.__typelists_off[off]
         return [type_.get_string() for type_ in i.get_list()]
 
@@ -8021,11 +8582,13 @@ class ClassManager:
 
         If the type IDX is not found, -1 is returned.
         """
+        self._require(TypeMapItem.TYPE_ID_ITEM)
         return self.__manage_item[TypeMapItem.TYPE_ID_ITEM].get(idx)
 
     def get_proto(self, idx: int) -> list:
         proto = self.__cached_proto.get(idx)
         if not proto:
+            self._require(TypeMapItem.PROTO_ID_ITEM)
             proto = self.__manage_item[TypeMapItem.PROTO_ID_ITEM].get(idx)
             self.__cached_proto[idx] = proto
 
@@ -8040,16 +8603,19 @@ class ClassManager:
         return field.get_list()
 
     def get_field_ref(self, idx: int) -> FieldIdItem:
+        self._require(TypeMapItem.FIELD_ID_ITEM)
         return self.__manage_item[TypeMapItem.FIELD_ID_ITEM].get(idx)
 
     def get_method(self, idx: int) -> list[str]:
         return self.get_method_ref(idx).get_list()
 
     def get_method_ref(self, idx: int) -> MethodIdItem:
+        self._require(TypeMapItem.METHOD_ID_ITEM)
         return self.__manage_item[TypeMapItem.METHOD_ID_ITEM].get(idx)
 
     def set_hook_class_name(self, class_def: ClassDefItem, value: str) -> None:
         python_export = True
+        self._require_all()
         _type = self.__manage_item[TypeMapItem.TYPE_ID_ITEM].get(
             class_def.get_class_idx()
         )
@@ -8078,6 +8644,7 @@ class ClassManager:
         self, encoded_method: EncodedMethod, value: str
     ) -> None:
         python_export = True
+        self._require_all()
 
         method = self.__manage_item[TypeMapItem.METHOD_ID_ITEM].get(
             encoded_method.get_method_idx()
@@ -8141,6 +8708,7 @@ class ClassManager:
         self, encoded_field: EncodedField, value: str
     ) -> None:
         python_export = True
+        self._require_all()
 
         field = self.__manage_item[TypeMapItem.FIELD_ID_ITEM].get(
             encoded_field.get_field_idx()
@@ -8173,14 +8741,15 @@ class ClassManager:
         self.hook_strings[idx] = value
 
     def get_next_offset_item(self, idx: int) -> int:
+        self._require_all()
         for i in self.__manage_item_off:
             if i > idx:
                 return i
         return idx
 
     def get_debug_off(self, off: int) -> DebugInfoItem:
-        self.buff.seek(off)
-        return DebugInfoItem(self.buff, self)
+        self.vm.raw.seek(off)
+        return DebugInfoItem(self.vm.raw, self)
 
 
 class MapList:
@@ -8188,9 +8757,15 @@ class MapList:
     This class can parse the "map_list" of the dex format
 
     https://source.android.com/devices/tech/dalvik/dex-format#map-list
+
+    In lazy mode only the map items themselves are read. A section is parsed
+    the first time it is accessed, after the sections it depends on
+    (see `TypeMapItem._get_dependencies`).
     """
 
-    def __init__(self, cm: ClassManager, off: int, buff: BinaryIO) -> None:
+    def __init__(
+        self, cm: ClassManager, off: int, buff: BinaryIO, lazy: bool = False
+    ) -> None:
         self.CM = cm
 
         buff.seek(off)
@@ -8213,15 +8788,57 @@ class MapList:
             self.map_item, key=lambda mi: load_order[mi.get_type()]
         )
 
-        for mi in ordered:
-            mi.parse()
+        # {TypeMapItem: [MapItem, ...]} sections not parsed yet
+        self.pending = {}
+        if lazy:
+            self.dependencies = TypeMapItem._get_dependencies()
+            for mi in ordered:
+                self.pending.setdefault(mi.get_type(), []).append(mi)
+            self.CM.set_map_list(self)
+        else:
+            for mi in ordered:
+                self._parse_item(mi)
+
+    def _parse_item(self, mi: MapItem) -> None:
+        mi.parse()
 
+        c_item = mi.get_item()
+        if c_item is None:
+            mi.set_item(self)
             c_item = mi.get_item()
-            if c_item is None:
-                mi.set_item(self)
-                c_item = mi.get_item()
 
-            self.CM.add_type_item(mi.get_type(), mi, c_item)
+        self.CM.add_type_item(mi.get_type(), mi, c_item)
+
+    def load_type(self, ttype: TypeMapItem) -> None:
+        """
+        Parse the section of the given type (and its dependencies) if this
+        was not done yet. Does nothing in eager mode.
+
+        :param ttype: a `TypeMapItem`
+        """
+        items = self.pending.pop(ttype, None)
+        if items is None:
+            return
+        for dependency in self.dependencies.get(ttype, ()):
+            self.load_type(dependency)
+
+        # May be called while another item is being parsed from the same buffer
+        buff = items[0].buff
+        idx = buff.tell()
+        for mi in items:
+            self._parse_item(mi)
+        buff.seek(idx)
+
+        if not self.pending:
+            self.CM.set_map_list(None)
+
+    def load_all(self) -> None:
+        """
+        Parse every section not parsed yet
+        """
+        load_order = TypeMapItem.determine_load_order()
+        for ttype in sorted(self.pending, key=load_order.get):
+            self.load_type(ttype)
 
     def get_off(self) -> int:
         return self.offset
@@ -8237,6 +8854,7 @@ class MapList:
 
         :returns: `None` or the item object
         """
+        self.load_type(ttype)
         for i in self.map_item:
             if i.get_type() == ttype:
                 return i.get_item()
@@ -8246,6 +8864,7 @@ class MapList:
         """
         Print with a pretty display the MapList object
         """
+        self.load_all()
         bytecode._Print("MAP_LIST SIZE", self.size)
         for i in self.map_item:
             if i.item != self:
@@ -8254,9 +8873,11 @@ class MapList:
                 i.show()
 
     def get_obj(self) -> list[object]:
+        self.load_all()
         return [x.get_obj() for x in self.map_item]
 
     def get_raw(self) -> bytes:
+        self.load_all()
         return self.CM.packer["I"].pack(self.size) + b''.join(
             x.get_raw() for x in self.map_item
         )
@@ -8310,18 +8931,33 @@ class DEX:
 
     :param buff: a string which represents the classes.dex file
     :param decompiler: associate a decompiler object to display the java source code
+    :param lazy: only read the header and the map list, each section is parsed
+                 the first time it is used (e.g. `get_strings` only parses the
+                 string data)
 
     Example:
 
         >>> d = DEX( read("classes.dex") )
     """
 
+    # Attributes bound to a map section, resolved on first access in lazy mode
+    _SECTION_ATTRIBUTES = {
+        'classes': TypeMapItem.CLASS_DEF_ITEM,
+        'methods': TypeMapItem.METHOD_ID_ITEM,
+        'fields': TypeMapItem.FIELD_ID_ITEM,
+        'codes': TypeMapItem.CODE_ITEM,
+        'strings': TypeMapItem.STRING_DATA_ITEM,
+        'debug': TypeMapItem.DEBUG_INFO_ITEM,
+        'hidden_api': TypeMapItem.HIDDENAPI_CLASS_DATA_ITEM,
+    }
+
     def __init__(
         self,
         buff,
         decompiler: Union[DecompilerDAD, None] = None,
         config=None,
         using_api: Union[int, None] = None,
+        lazy: bool = False,
     ) -> None:
         logger.debug("DEX {} {} {}".format(decompiler, config, using_api))
 
@@ -8335,11 +8971,13 @@ class DEX:
             self.api_version = CONF["DEFAULT_API"]
 
         self.raw = io.BufferedReader(io.BytesIO(buff))
+        self.lazy = lazy
 
         self._flush()
 
         self.CM = ClassManager(self)
         self.CM.set_decompiler(decompiler)
+        self.CM.set_view(memoryview(buff))
 
         self._preload(buff)
         self._load(buff)
@@ -8354,30 +8992,46 @@ class DEX:
             # TODO check if the header specifies items but does not have a map
             logger.warning("no map list! This DEX file is probably empty.")
         else:
-            self.map_list = MapList(self.CM, self.header.map_off, self.raw)
-
-            self.classes = self.map_list.get_item_type(
-                TypeMapItem.CLASS_DEF_ITEM
-            )
-            self.methods = self.map_list.get_item_type(
-                TypeMapItem.METHOD_ID_ITEM
-            )
-            self.fields = self.map_list.get_item_type(
-                TypeMapItem.FIELD_ID_ITEM
-            )
-            self.codes = self.map_list.get_item_type(TypeMapItem.CODE_ITEM)
-            self.strings = self.map_list.get_item_type(
-                TypeMapItem.STRING_DATA_ITEM
-            )
-            self.debug = self.map_list.get_item_type(
-                TypeMapItem.DEBUG_INFO_ITEM
-            )
-            self.hidden_api = self.map_list.get_item_type(
-                TypeMapItem.HIDDENAPI_CLASS_DATA_ITEM
+            self.map_list = MapList(
+                self.CM, self.header.map_off, self.raw, self.lazy
             )
+            # Lazy mode: the section attributes are resolved by __getattr__
+            if not self.lazy:
+                self.classes = self.map_list.get_item_type(
+                    TypeMapItem.CLASS_DEF_ITEM
+                )
+                self.methods = self.map_list.get_item_type(
+                    TypeMapItem.METHOD_ID_ITEM
+                )
+                self.fields = self.map_list.get_item_type(
+                    TypeMapItem.FIELD_ID_ITEM
+                )
+                self.codes = self.map_list.get_item_type(TypeMapItem.CODE_ITEM)
+                self.strings = self.map_list.get_item_type(
+                    TypeMapItem.STRING_DATA_ITEM
+                )
+                self.debug = self.map_list.get_item_type(
+                    TypeMapItem.DEBUG_INFO_ITEM
+                )
+                self.hidden_api = self.map_list.get_item_type(
+                    TypeMapItem.HIDDENAPI_CLASS_DATA_ITEM
+                )
 
         self._flush()
 
+    def __getattr__(self, name):
+        # Only reached in lazy mode, before the first access of a section attribute
+        ttype = DEX._SECTION_ATTRIBUTES.get(name)
+        if ttype is None or 'map_list' not in self.__dict__:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(
+                    type(self).__name__, name
+                )
+            )
+        value = self.map_list.get_item_type(ttype)
+        setattr(self, name, value)
+        return value
+
     def _flush(self) -> None:
         """
         Flush all caches
@@ -8947,10 +9601,14 @@ class DEX:
         The strings will have escaped surrogates, if only a single high or low surrogate is found.
         Complete surrogates are put together into the representing 32bit character.
 
+        The strings are decoded once per DEX, see [StringDataItem.get_all][androguard.core.dex.StringDataItem.get_all]
+
         :returns: a list with all strings used in the format (types, names ...)
         """
         return (
-            [i.get() for i in self.strings] if self.strings is not None else []
+            StringDataItem.get_all(self.strings)
+            if self.strings is not None
+            else []
         )
 
     def get_len_strings(self) -> int:
@@ -1,5 +1,6 @@
 import io
 import logging
+import re
 import struct
 import random
 
@@ -7,6 +8,8 @@ from .extract import extract_file_based_on_header_info
 from .headers import ZipEntry
 from .helpers import escape_xml_entities
 
+RESOURCE_MAP_SIGNATURE = re.compile(b'\x80\x01')
+
 logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d -> %(funcName)s : %(message)s'
@@ -280,15 +283,16 @@ class StringPoolType:
         string_offsets = cls.read_string_offsets(file, num_of_strings, string_pool_header.strings_start + 8)
         is_utf8 = bool(string_pool_header.flags & (1 << 8))
         string_list = cls.read_strings(file, string_offsets, string_pool_header.strings_start, is_utf8)
-        while True:  # read any null bytes remaining
-            cur_pos = file.tell()
-            if file.read(2) == b'\x80\x01':
-                file.seek(cur_pos)
-                break
-            file.seek(cur_pos)
-            file.read(1)
-            if file.getbuffer().nbytes < file.tell() + 8:
-                raise ValueError("Resource Map header was not detected.")
+        # skip any null bytes remaining, searched in the buffer instead of byte by byte
+        cur_pos = file.tell()
+        buffer = file.getbuffer()
+        found = RESOURCE_MAP_SIGNATURE.search(buffer, cur_pos)
+        position = found.start() if found else -1
+        nbytes = buffer.nbytes
+        buffer.release()
+        if position == -1 or (position > cur_pos and nbytes < position + 8):
+            raise ValueError("Resource Map header was not detected.")
+        file.seek(position)
         string_pool_end = file.tell()
         file.seek(string_pool_start)
         string_pool_data = file.read(string_pool_end - string_pool_start)
@@ -1,9 +1,41 @@
+import io
 import logging
 import zlib
 import os
 
+STREAM_CHUNK_SIZE = 64 * 1024
 
-def extract_file_based_on_header_info(apk_file, local_header_info, central_directory_info):
+
+class ExtractionLimitError(Exception):
+    """
+    Raised when an entry holds more data than the max_size allowed for its extraction.
+    """
+
+
+def _read_limited(apk_file, size, max_size):
+    if max_size is None or size <= max_size:
+        return apk_file.read(size)
+    # The declared size may be forged, only what is really left in the archive counts
+    data = apk_file.read(max_size + 1)
+    if len(data) > max_size:
+        raise ExtractionLimitError(f"Entry is over the extraction limit of {max_size} bytes")
+    return data
+
+
+def _inflate(compressed_data, max_size):
+    if max_size is None:
+        return zlib.decompress(compressed_data, -15)
+    # Same as zlib.decompress(), but stops as soon as the output goes over max_size
+    c_obj = zlib.decompressobj(-15)
+    extracted_data = c_obj.decompress(compressed_data, max_size + 1)
+    if len(extracted_data) > max_size:
+        raise ExtractionLimitError(f"Entry inflates to more than the extraction limit of {max_size} bytes")
+    if not c_obj.eof:
+        raise zlib.error("Error -5 while decompressing data: incomplete or truncated stream")
+    return extracted_data
+
+
+def extract_file_based_on_header_info(apk_file, local_header_info, central_directory_info, max_size: int = None):
     """
     Extracts a single file from the apk_file based on the information provided from the offset and the header_info.
     It takes into account that the compression method provided might not be STORED or DEFLATED! The returned
@@ -17,6 +49,9 @@ def extract_file_based_on_header_info(apk_file, local_header_info, central_direc
     :type local_header_info: dict
     :param central_directory_info: The central directory entry for that specific filename
     :type central_directory_info: dict
+    :param max_size: maximum number of bytes the entry may extract to, checked against the data actually inflated rather than the declared sizes
+    :type max_size: int(, optional)
+    :raises ExtractionLimitError: if the extracted data would be larger than max_size
     :return: Returns the actual extracted data for that file along with an indication of whether a static analysis evasion technique was used or not.
     :rtype: set(bytes, str)
     """
@@ -35,16 +70,16 @@ def extract_file_based_on_header_info(apk_file, local_header_info, central_direc
     offset = central_directory_info["relative_offset_of_local_file_header"]
     apk_file.seek(offset + local_header_size + filename_length + extra_field_length)
     if compression_method == 0:  # Stored (no compression)
-        uncompressed_data = apk_file.read(uncompressed_size)
+        uncompressed_data = _read_limited(apk_file, uncompressed_size, max_size)
         extracted_data = uncompressed_data
         indicator = 'STORED'
     elif compression_method == 8:
         compressed_data = apk_file.read(compressed_size)
         # -15 for windows size due to raw stream with no header or trailer
-        extracted_data = zlib.decompress(compressed_data, -15)
+        extracted_data = _inflate(compressed_data, max_size)
         indicator = 'DEFLATED'
     elif compressed_size == uncompressed_size:
-        compressed_data = apk_file.read(uncompressed_size)
+        compressed_data = _read_limited(apk_file, uncompressed_size, max_size)
         extracted_data = compressed_data
         indicator = 'STORED_TAMPERED'
     else:
@@ -52,19 +87,164 @@ def extract_file_based_on_header_info(apk_file, local_header_info, central_direc
         try:
             compressed_data = apk_file.read(compressed_size)
             c_obj = zlib.decompressobj(-15)
-            extracted_data = c_obj.decompress(compressed_data)
+            extracted_data = c_obj.decompress(compressed_data, 0 if max_size is None else max_size + 1)
+            if max_size is not None and len(extracted_data) > max_size:
+                raise ExtractionLimitError(f"Entry inflates to more than the extraction limit of {max_size} bytes")
             if not c_obj.eof or c_obj.unused_data or c_obj.unconsumed_tail:
                 raise ValueError("Invalid or non-pure deflate")
             indicator = 'DEFLATED_TAMPERED'
+        except ExtractionLimitError:
+            raise
         except Exception as e:
             logging.debug(e)
             apk_file.seek(cur_loc)
-            compressed_data = apk_file.read(uncompressed_size)
+            compressed_data = _read_limited(apk_file, uncompressed_size, max_size)
             extracted_data = compressed_data
             indicator = 'STORED_TAMPERED'
     return extracted_data, indicator
 
 
+
+class BufferReader:
+    """
+    Minimal seekable reader over a bytes-like object (bytes, mmap, memoryview) with its own position. Several
+    threads can extract from the same archive buffer, each through its own BufferReader, without sharing a file
+    position.
+    """
+    def __init__(self, buffer):
+        self._view = memoryview(buffer)
+        self._pos = 0
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self._pos
+        elif whence == 2:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def read(self, size=-1):
+        end = len(self._view) if size is None or size < 0 else self._pos + size
+        data = bytes(self._view[self._pos:end])
+        self._pos += len(data)
+        return data
+
+class EntryStream(io.RawIOBase):
+    """
+    Read-only file-like object over a single entry, decompressed on the fly in bounded chunks.
+    Meant for callers that only need the beginning of an entry (magic, headers) or want to process it
+    piece by piece, instead of extract_file_based_on_header_info() which inflates the whole entry.
+    STORED and DEFLATED entries are streamed; any other (tampered) compression method falls back to
+    extract_file_based_on_header_info() so the same heuristics apply.
+    """
+    def __init__(self, apk_file, local_header_info, central_directory_info, chunk_size: int = STREAM_CHUNK_SIZE):
+        """
+        :param apk_file: The APK file e.g. with open('test.apk', 'rb') as apk_file
+        :type apk_file: bytesIO
+        :param local_header_info: The local header dictionary info for that specific filename
+        :type local_header_info: dict
+        :param central_directory_info: The central directory entry for that specific filename
+        :type central_directory_info: dict
+        :param chunk_size: the maximum number of compressed bytes read from apk_file at once
+        :type chunk_size: int
+        """
+        super().__init__()
+        if local_header_info["compressed_size"] == 0 or local_header_info["uncompressed_size"] == 0:
+            compressed_size = central_directory_info["compressed_size"]
+            uncompressed_size = central_directory_info["uncompressed_size"]
+        else:
+            compressed_size = local_header_info["compressed_size"]
+            uncompressed_size = local_header_info["uncompressed_size"]
+        self._file = apk_file
+        self._chunk_size = chunk_size
+        self._offset = (central_directory_info["relative_offset_of_local_file_header"] + 30 +
+                        local_header_info["file_name_length"] + local_header_info["extra_field_length"])
+        self._decompressor = None
+        self._buffer = None
+        compression_method = local_header_info["compression_method"]
+        if compression_method == 0:
+            self._remaining = uncompressed_size
+        elif compression_method == 8:
+            self._remaining = compressed_size
+            self._decompressor = zlib.decompressobj(-15)
+        else:
+            self._buffer = io.BytesIO(
+                extract_file_based_on_header_info(apk_file, local_header_info, central_directory_info)[0])
+
+    def readable(self):
+        return True
+
+    def _read_raw(self, size):
+        size = min(size, self._remaining)
+        if size <= 0:
+            return b''
+        # The archive may be shared with other readers, always seek to our own position
+        self._file.seek(self._offset)
+        data = self._file.read(size)
+        self._offset += len(data)
+        self._remaining = self._remaining - len(data) if data else 0
+        return data
+
+    def read(self, size=-1):
+        """
+        :param size: maximum number of bytes to return, -1 for the rest of the entry
+        :return: up to size bytes, b'' at the end of the entry
+        :rtype: bytes
+        """
+        if size is None or size < 0:
+            return self.readall()
+        if size == 0:
+            # decompress() treats a max_length of 0 as "no limit"
+            return b''
+        if self._buffer is not None:
+            return self._buffer.read(size)
+        if self._decompressor is None:
+            return self._read_raw(size)
+
+        data = b''
+        while not data and not self._decompressor.eof:
+            compressed = self._decompressor.unconsumed_tail or self._read_raw(self._chunk_size)
+            if not compressed:
+                raise zlib.error("Error -5 while decompressing data: incomplete or truncated stream")
+            data = self._decompressor.decompress(compressed, size)
+        return data
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def readall(self):
+        chunks = []
+        while True:
+            data = self.read(self._chunk_size)
+            if not data:
+                return b''.join(chunks)
+            chunks.append(data)
+
+
+def read_head(stream, size):
+    """
+    Read the first size bytes (or fewer if the entry is shorter) of an EntryStream.
+
+    :param stream: the stream to read from
+    :type stream: EntryStream
+    :param size: the number of bytes wanted
+    :type size: int
+    :return: the bytes read
+    :rtype: bytes
+    """
+    head = b''
+    while len(head) < size:
+        data = stream.read(size - len(head))
+        if not data:
+            break
+        head += data
+    return head
+
 def extract_all_files_from_central_directory(apk_file, central_directory_entries, local_header_entries, output_dir):
     """
     Extracts all files from an APK based on the entries detected in the central_directory_entries.
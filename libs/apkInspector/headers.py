@@ -1,12 +1,18 @@
 import io
 import logging
+import mmap
 import os
 import struct
+import threading
 from typing import Dict
 
-from .extract import extract_file_based_on_header_info, extract_all_files_from_central_directory
+from .extract import extract_file_based_on_header_info, extract_all_files_from_central_directory, EntryStream, \
+    BufferReader, read_head
 from .helpers import pretty_print_header, save_to_json, save_data_to_file
 
+# Fixed part of a central directory file header (signature up to the local header offset), 46 bytes
+CENTRAL_DIRECTORY_RECORD = struct.Struct('<4s6H3I5H2I')
+
 
 class EndOfCentralDirectoryRecord:
     """
@@ -42,7 +48,9 @@ class EndOfCentralDirectoryRecord:
         chunk_size = 1024
         offset = 0
         signature_offset = -1
-        file_size = apk_file.seek(0, 2)
+        # mmap.seek() returns None before Python 3.13, so ask tell() for the size
+        apk_file.seek(0, 2)
+        file_size = apk_file.tell()
         while offset < file_size:
             position = max(0, file_size - offset - chunk_size)
             apk_file.seek(position)
@@ -215,32 +223,28 @@ class CentralDirectory:
         if apk_file.tell() != eocd.offset_of_start_of_central_directory:
             raise ValueError(f"Failed to find the offset for the central directory within the file!")
 
+        # One read for the whole directory, then one unpack per fixed-size record
+        base = apk_file.tell()
+        view = memoryview(apk_file.read())
         central_directory_entries = {}
-        while True:
-            c_offset = apk_file.tell()
-            signature = apk_file.read(4)
-            if signature != b'\x50\x4b\x01\x02':
-                break  # Reached the end of the central directory
-            version_made_by = struct.unpack('<H', apk_file.read(2))[0]
-            version_needed_to_extract = struct.unpack('<H', apk_file.read(2))[0]
-            general_purpose_bit_flag = struct.unpack('<H', apk_file.read(2))[0]
-            compression_method = struct.unpack('<H', apk_file.read(2))[0]
-            file_last_modification_time = struct.unpack('<H', apk_file.read(2))[0]
-            file_last_modification_date = struct.unpack('<H', apk_file.read(2))[0]
-            crc32_of_uncompressed_data = struct.unpack('<I', apk_file.read(4))[0]
-            compressed_size = struct.unpack('<I', apk_file.read(4))[0]
-            uncompressed_size = struct.unpack('<I', apk_file.read(4))[0]
-            file_name_length = struct.unpack('<H', apk_file.read(2))[0]
-            extra_field_length = struct.unpack('<H', apk_file.read(2))[0]
-            file_comment_length = struct.unpack('<H', apk_file.read(2))[0]
-            disk_number_where_file_starts = struct.unpack('<H', apk_file.read(2))[0]
-            internal_file_attributes = struct.unpack('<H', apk_file.read(2))[0]
-            external_file_attributes = struct.unpack('<I', apk_file.read(4))[0]
-            relative_offset_of_local_file_header = struct.unpack('<I', apk_file.read(4))[0]
-            filename = struct.unpack(f'<{file_name_length}s', apk_file.read(file_name_length))[0].decode('utf-8', 'ignore')
-            extra_field = struct.unpack(f'<{extra_field_length}s', apk_file.read(extra_field_length))[0].decode('utf-8', 'ignore')
-            file_comment = struct.unpack(f'<{file_comment_length}s', apk_file.read(file_comment_length))[0].decode('utf-8', 'ignore')
-            offset_in_central_directory = c_offset
+        pos = 0
+        while view[pos:pos + 4] == b'\x50\x4b\x01\x02':
+            (_signature, version_made_by, version_needed_to_extract, general_purpose_bit_flag, compression_method,
+             file_last_modification_time, file_last_modification_date, crc32_of_uncompressed_data,
+             compressed_size, uncompressed_size, file_name_length, extra_field_length, file_comment_length,
+             disk_number_where_file_starts, internal_file_attributes, external_file_attributes,
+             relative_offset_of_local_file_header) = CENTRAL_DIRECTORY_RECORD.unpack_from(view, pos)
+            name_start = pos + CENTRAL_DIRECTORY_RECORD.size
+            extra_start = name_start + file_name_length
+            comment_start = extra_start + extra_field_length
+            next_record = comment_start + file_comment_length
+            if next_record > len(view):
+                raise struct.error(f"Truncated central directory entry at offset {base + pos}")
+            filename = str(view[name_start:extra_start], 'utf-8', 'ignore')
+            extra_field = str(view[extra_start:comment_start], 'utf-8', 'ignore')
+            file_comment = str(view[comment_start:next_record], 'utf-8', 'ignore')
+            offset_in_central_directory = base + pos
+            pos = next_record
 
             central_directory_entry = CentralDirectoryEntry(
                 version_made_by, version_needed_to_extract, general_purpose_bit_flag, compression_method,
@@ -251,6 +255,7 @@ class CentralDirectory:
                 offset_in_central_directory
             )
             central_directory_entries[central_directory_entry.filename] = central_directory_entry
+        view.release()
 
         return cls(central_directory_entries)
 
@@ -378,6 +383,72 @@ class LocalHeaderRecord:
         return cls(**entry_dict)
 
 
+class LazyLocalHeaders(dict):
+    """
+    Dictionary of LocalHeaderRecord keyed by the central directory filename. A local header is only parsed the
+    first time it is accessed, so opening an APK does not touch every local header. Parsing is serialized, as it
+    seeks on the shared archive.
+    """
+    def __init__(self, apk_file, central_directory: CentralDirectory):
+        super().__init__()
+        self._apk_file = apk_file
+        self._entries = central_directory.entries
+        self._lock = threading.Lock()
+
+    def __missing__(self, filename):
+        with self._lock:
+            local_header_entry = LocalHeaderRecord.parse(self._apk_file, self._entries[filename])
+        if not local_header_entry:
+            raise KeyError(filename)
+        self[filename] = local_header_entry
+        return local_header_entry
+
+    def __contains__(self, filename):
+        if dict.__contains__(self, filename):
+            return True
+        if filename not in self._entries:
+            return False
+        try:
+            self[filename]
+        except KeyError:
+            return False
+        return True
+
+    def load_all(self):
+        """
+        Parse every remaining local header.
+        """
+        for filename in self._entries:
+            if not dict.__contains__(self, filename):
+                try:
+                    self[filename]
+                except KeyError:
+                    pass
+
+    def get(self, filename, default=None):
+        return self[filename] if filename in self else default
+
+    def __iter__(self):
+        self.load_all()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self.load_all()
+        return dict.__len__(self)
+
+    def keys(self):
+        self.load_all()
+        return dict.keys(self)
+
+    def values(self):
+        self.load_all()
+        return dict.values(self)
+
+    def items(self):
+        self.load_all()
+        return dict.items(self)
+
+
 class ZipEntry:
     """
     Is the actual APK represented as a composition of the previous classes, which are: the EndOfCentralDirectoryRecord, the CentralDirectory and a dictionary of values of LocalHeaderRecord.
@@ -388,9 +459,12 @@ class ZipEntry:
         self.eocd = eocd
         self.central_directory = central_directory
         self.local_headers = local_headers
+        self._view = None
+        self._namelist = None
+        self._lock = threading.Lock()
 
     @classmethod
-    def parse(cls, inc_apk, raw: bool = True):
+    def parse(cls, inc_apk, raw: bool = True, use_mmap: bool = False, lazy: bool = None):
         """
         Method to start processing an APK. The raw (bytes) APK may be passed or the path to it.
 
@@ -398,21 +472,34 @@ class ZipEntry:
         :type inc_apk: str or bytesIO
         :param raw: boolean flag to specify whether it is the raw apk in bytes or not
         :type raw: bool
+        :param use_mmap: memory-map the file (path only) instead of reading it into a BytesIO
+        :type use_mmap: bool(, optional)
+        :param lazy: parse each local header on first access instead of all of them upfront (defaults to use_mmap)
+        :type lazy: bool(, optional)
         :return: returns the instance of the class
         :rtype: ZipEntry
         """
+        if lazy is None:
+            lazy = use_mmap
         if raw:
             apk_file = inc_apk
+        elif use_mmap:
+            # The mapping stays valid after the file object is closed
+            with open(inc_apk, 'rb') as apk:
+                apk_file = mmap.mmap(apk.fileno(), 0, access=mmap.ACCESS_READ)
         else:
             with open(inc_apk, 'rb') as apk:
                 apk_file = io.BytesIO(apk.read())
         eocd = EndOfCentralDirectoryRecord.parse(apk_file)
         central_directory = CentralDirectory.parse(apk_file, eocd)
-        local_headers = {}
-        for entry in central_directory.entries:
-            local_header_entry = LocalHeaderRecord.parse(apk_file, central_directory.entries[entry])
-            if local_header_entry:
-                local_headers[local_header_entry.filename] = local_header_entry
+        if lazy:
+            local_headers = LazyLocalHeaders(apk_file, central_directory)
+        else:
+            local_headers = {}
+            for entry in central_directory.entries:
+                local_header_entry = LocalHeaderRecord.parse(apk_file, central_directory.entries[entry])
+                if local_header_entry:
+                    local_headers[local_header_entry.filename] = local_header_entry
         return cls(apk_file, eocd, central_directory, local_headers)
 
     @classmethod
@@ -479,7 +566,7 @@ class ZipEntry:
         else:
             raise KeyError(f"Key: {filename} was not found within the local headers list!")
 
-    def read(self, name, save: bool = False):
+    def read(self, name, save: bool = False, max_size: int = None):
         """
         Method to utilize the extract module and extract a single entry from the APK based on the filename.
 
@@ -487,15 +574,114 @@ class ZipEntry:
         :type name: str
         :param save: boolean to define whether the extracted file should be saved as well or not
         :type save: bool(, optional)
+        :param max_size: maximum number of bytes the entry may extract to, see extract_file_based_on_header_info()
+        :type max_size: int(, optional)
         :return: returns the raw bytes of the filename that was extracted
         :rtype: bytes
         """
-        extracted_file = extract_file_based_on_header_info(self.zip, self.get_local_header_dict(name),
-                                                           self.get_central_directory_entry_dict(name))[0]
+        local_header = self.get_local_header_dict(name)
+        central_directory_entry = self.get_central_directory_entry_dict(name)
+        view = self._get_view()
+        if view is not None:
+            extracted_file = extract_file_based_on_header_info(BufferReader(view), local_header,
+                                                               central_directory_entry, max_size)[0]
+        else:
+            with self._lock:
+                extracted_file = extract_file_based_on_header_info(self.zip, local_header, central_directory_entry,
+                                                                   max_size)[0]
         if save:
             save_data_to_file(f"EXTRACTED_{name}", extracted_file)
         return extracted_file
 
+    def open(self, name):
+        """
+        Method to stream a single entry instead of extracting it at once. Streams over an in-memory or mapped
+        archive have their own position and may be read from several threads; streams over a file object may not.
+
+        :param name: the name of the file to be read
+        :type name: str
+        :return: a file-like object decompressing the entry on the fly
+        :rtype: EntryStream
+        """
+        view = self._get_view()
+        return EntryStream(self.zip if view is None else BufferReader(view), self.get_local_header_dict(name),
+                           self.get_central_directory_entry_dict(name))
+
+    def read_head(self, name, size):
+        """
+        Method to read only the beginning of an entry, e.g. to check its magic or parse a header, without
+        decompressing the rest of it.
+
+        :param name: the name of the file to be read
+        :type name: str
+        :param size: the number of bytes wanted
+        :type size: int
+        :return: returns the first size bytes of the entry (fewer if the entry is shorter)
+        :rtype: bytes
+        """
+        with self.open(name) as stream:
+            return read_head(stream, size)
+
+    def _get_view(self):
+        """
+        :return: a memoryview over the whole archive, or None if the backing object does not expose a buffer
+        """
+        if self._view is None:
+            # Concurrent readers must share one view, close() only releases this one
+            with self._lock:
+                if self._view is None:
+                    if isinstance(self.zip, io.BytesIO):
+                        self._view = self.zip.getbuffer()
+                    elif isinstance(self.zip, (mmap.mmap, bytes, bytearray, memoryview)):
+                        self._view = memoryview(self.zip)
+        return self._view
+
+    def read_view(self, name):
+        """
+        Same as read(), but a STORED entry is returned as a zero-copy memoryview slice of the archive. Other
+        entries are decompressed and returned as bytes.
+
+        :param name: the name of the file to be read
+        :type name: str
+        :return: returns the content of the entry
+        :rtype: memoryview or bytes
+        """
+        if name not in self.local_headers:
+            raise KeyError(f"Key: {name} was not found within the local headers list!")
+        local_header = self.local_headers[name]
+        central_directory_entry = self.central_directory.entries[name]
+        view = self._get_view()
+        if view is None or local_header.compression_method != 0:
+            return self.read(name)
+
+        if local_header.compressed_size == 0 or local_header.uncompressed_size == 0:
+            size = central_directory_entry.uncompressed_size
+        else:
+            size = local_header.uncompressed_size
+        start = (central_directory_entry.relative_offset_of_local_file_header + 30 +
+                 local_header.file_name_length + local_header.extra_field_length)
+        return view[start:start + size]
+
+    def close(self):
+        """
+        Release the memory map (if any). Views returned by read_view() must not be used afterwards.
+        """
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if isinstance(self.zip, mmap.mmap):
+            try:
+                self.zip.close()
+            except BufferError:
+                # Slices from read_view() are still alive, the map is released with them
+                logging.debug("ZipEntry.close(): memory map still has exported views")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def infolist(self) -> Dict[str, CentralDirectoryEntry]:
         """
         List of information about the entries in the central directory.
@@ -507,12 +693,15 @@ class ZipEntry:
 
     def namelist(self):
         """
-        List of the filenames included in the central directory.
+        List of the filenames included in the central directory. Computed once and cached, callers should not
+        modify it.
 
         :return: returns the list of the filenames
         :rtype: list
         """
-        return [vl for vl in self.central_directory.to_dict()]
+        if self._namelist is None:
+            self._namelist = list(self.central_directory.entries)
+        return self._namelist
 
     def extract_all(self, extract_path, apk_name):
         """
@@ -1,9 +1,27 @@
 import io
 import logging
+import mmap
 import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
-from .extract import extract_file_based_on_header_info
+from .extract import extract_file_based_on_header_info, BufferReader
 from .headers import ZipEntry
+
+EOCD_SIGNATURE = b'\x50\x4b\x05\x06'
+EOCD_SCAN_CHUNK = 1024 * 1024
+
+# Fields present in both the local header and the central directory entry, compared as one tuple
+HEADER_FIELDS = ('compressed_size', 'compression_method', 'crc32_of_uncompressed_data', 'extra_field',
+                 'extra_field_length', 'file_last_modification_date', 'file_last_modification_time',
+                 'file_name_length', 'filename', 'general_purpose_bit_flag', 'uncompressed_size',
+                 'version_needed_to_extract')
+LENIENT_FIELDS = ('extra_field', 'extra_field_length', 'crc32_of_uncompressed_data', 'compressed_size',
+                  'uncompressed_size')
+header_fields = attrgetter(*HEADER_FIELDS)
+# Entries / elements processed between two deadline checks
+DEADLINE_CHECK_INTERVAL = 256
 from .axml import ResChunkHeader, StringPoolType, XmlResourceMapType, XmlStartElement, ManifestStruct, ResXMLHeader, \
     read_remaining
 
@@ -17,12 +35,58 @@ def count_eocd(apk_file):
     :return: The count of how many times the end of central directory record was found
     :rtype: int
     """
+    if isinstance(apk_file, mmap.mmap):
+        # Search the mapping in place
+        count = 0
+        position = apk_file.find(EOCD_SIGNATURE)
+        while position != -1:
+            count += 1
+            position = apk_file.find(EOCD_SIGNATURE, position + len(EOCD_SIGNATURE))
+        return count
+    # The signature cannot overlap itself, so carrying the last 3 bytes over finds every occurrence exactly once
     apk_file.seek(0)
-    content = apk_file.read()
-    return content.count(b'\x50\x4b\x05\x06')
+    count = 0
+    tail = b''
+    while True:
+        chunk = apk_file.read(EOCD_SCAN_CHUNK)
+        if not chunk:
+            return count
+        data = tail + chunk
+        count += data.count(EOCD_SIGNATURE)
+        tail = data[-(len(EOCD_SIGNATURE) - 1):]
+
+
+def check_deadline(deadline):
+    """
+    :param deadline: time.monotonic() value after which the check must stop, None for no limit
+    :raises TimeoutError: if the deadline has passed
+    """
+    if deadline is not None and time.monotonic() > deadline:
+        raise TimeoutError("Tampering check exceeded its deadline")
+
 
+def _actual_compression_method(buffer, apk_file, local_header, central_directory_entry, deadline=None,
+                               max_size=None):
+    """
+    Run the extraction of an entry and return only the compression method actually used. When the archive is
+    backed by a buffer, every call gets its own reader, so this can run in parallel threads.
+    """
+    check_deadline(deadline)
+    reader = BufferReader(buffer) if buffer is not None else apk_file
+    return extract_file_based_on_header_info(reader, local_header.to_dict(), central_directory_entry.to_dict(),
+                                             max_size)[1]
+
+
+def _archive_buffer(apk_file):
+    if isinstance(apk_file, io.BytesIO):
+        return apk_file.getbuffer()
+    if isinstance(apk_file, (mmap.mmap, bytes, bytearray, memoryview)):
+        return apk_file
+    return None
 
-def zip_tampering_indicators(apk_file, strict: bool):
+
+def zip_tampering_indicators(apk_file, strict: bool, zipentry: ZipEntry = None, workers: int = 4,
+                             verify_extraction: bool = True, deadline: float = None, max_size: int = None):
     """
     Method to check the for indicators of tampering in the ZIP structure of the APK. These tamperings in the ZIP
     structure, serve as a method of evasion against static analysis tools.
@@ -31,6 +95,16 @@ def zip_tampering_indicators(apk_file, strict: bool):
     :type apk_file: bytesIO
     :param strict: Whether to be checking strictly or not. Utilizing the application set that was used also for the tests here https://github.com/erev0s/apkInspector/tree/main/tests/top_apps, we tested what kind of indicators would be returned. It turns out that in some cases the local header and the central directory entry for the same file do not have the same values for some keys. So the strict checking was added, to be able to exclude these rare but possible occasions.
     :type strict: bool
+    :param zipentry: an already parsed ZipEntry of apk_file, to avoid parsing it again
+    :type zipentry: ZipEntry(, optional)
+    :param workers: number of threads verifying the extraction of entries with an unexpected compression method
+    :type workers: int(, optional)
+    :param verify_extraction: extract the entries with an unexpected compression method to report the one actually used
+    :type verify_extraction: bool(, optional)
+    :param deadline: time.monotonic() value after which the check stops with a TimeoutError
+    :type deadline: float(, optional)
+    :param max_size: maximum number of bytes each verified entry may extract to (ExtractionLimitError otherwise)
+    :type max_size: int(, optional)
     :return: Returns a dictionary with the detected indicators.
     :rtype: dict
     """
@@ -40,33 +114,58 @@ def zip_tampering_indicators(apk_file, strict: bool):
         count = count_eocd(apk_file)
         if count > 1:
             zip_tampering_indicators_dict['eocd_count'] = count
-    zipentry_dict = ZipEntry.parse(apk_file).to_dict()
-    empty_keys = any(k == "" or k is None for k in zipentry_dict["central_directory"].keys())
+    if zipentry is None:
+        zipentry = ZipEntry.parse(apk_file)
+    central_directory = zipentry.central_directory.entries
+    # Keyed by the name stored in the local header itself (a lazy ZipEntry keys them by the central directory name)
+    local_headers = {}
+    for count, local_header in enumerate(zipentry.local_headers.values()):
+        if count % DEADLINE_CHECK_INTERVAL == 0:
+            check_deadline(deadline)
+        local_headers[local_header.filename] = local_header
+    empty_keys = any(k == "" or k is None for k in central_directory.keys())
     if empty_keys:
         zip_tampering_indicators_dict['empty_keys'] = empty_keys
-    unique_keys = list(zipentry_dict["central_directory"].keys() ^ zipentry_dict["local_headers"].keys())
-    common_keys = list(set(zipentry_dict["central_directory"].keys()) & set(zipentry_dict["local_headers"].keys()))
+    unique_keys = list(central_directory.keys() ^ local_headers.keys())
     if unique_keys:
         zip_tampering_indicators_dict['unique_entries'] = unique_keys
-    for key in common_keys:
-        cd_entry = zipentry_dict["central_directory"][key]
-        lh_entry = zipentry_dict["local_headers"][key]
+
+    suspicious = []
+    for count, (key, cd_entry) in enumerate(central_directory.items()):
+        if count % DEADLINE_CHECK_INTERVAL == 0:
+            check_deadline(deadline)
+        lh_entry = local_headers.get(key)
+        if lh_entry is None:
+            continue
         temp = {}
-        if cd_entry['compression_method'] not in [0, 8]:
-            temp['central compression method'] = cd_entry['compression_method']
-        if lh_entry['compression_method'] not in [0, 8]:
-            temp['local compression method'] = lh_entry['compression_method']
-        if cd_entry['compression_method'] not in [0, 8] or lh_entry['compression_method'] not in [0, 8]:
-            indicator = \
-                extract_file_based_on_header_info(apk_file, lh_entry, cd_entry)[
-                    1]
-            temp['actual compression method'] = indicator
-        df_keys = local_and_central_header_discrepancies(cd_entry, lh_entry, strict)
-        if df_keys:
-            temp['differing headers'] = df_keys
+        if cd_entry.compression_method not in (0, 8):
+            temp['central compression method'] = cd_entry.compression_method
+        if lh_entry.compression_method not in (0, 8):
+            temp['local compression method'] = lh_entry.compression_method
+        if temp:
+            suspicious.append((key, lh_entry, cd_entry))
+        cd_fields = header_fields(cd_entry)
+        lh_fields = header_fields(lh_entry)
+        if cd_fields != lh_fields:
+            df_keys = [field for field, cd_value, lh_value in zip(HEADER_FIELDS, cd_fields, lh_fields)
+                       if cd_value != lh_value and (strict or field not in LENIENT_FIELDS)]
+            if df_keys:
+                temp['differing headers'] = df_keys
         if not temp:
             continue
         zip_tampering_indicators_dict[key] = temp
+
+    if suspicious and verify_extraction:
+        buffer = _archive_buffer(zipentry.zip)
+        args = [(buffer, zipentry.zip, lh_entry, cd_entry, deadline, max_size)
+                for _key, lh_entry, cd_entry in suspicious]
+        if buffer is not None and len(suspicious) > 1 and workers > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(suspicious))) as executor:
+                indicators = list(executor.map(lambda a: _actual_compression_method(*a), args))
+        else:
+            indicators = [_actual_compression_method(*a) for a in args]
+        for (key, _lh_entry, _cd_entry), indicator in zip(suspicious, indicators):
+            zip_tampering_indicators_dict[key]['actual compression method'] = indicator
     return zip_tampering_indicators_dict
 
 
@@ -96,7 +195,7 @@ def local_and_central_header_discrepancies(dict1, dict2, strict: bool):
     return keys
 
 
-def process_elements_indicators(file):
+def process_elements_indicators(file, deadline: float = None):
     """
     It starts processing the remaining chunks **after** the resource map chunk.
     It also returns whether dummy data have been found between the elements, so it can be reported that the apk employed
@@ -106,6 +205,8 @@ def process_elements_indicators(file):
 
     :param file: the axml that will be processed
     :type file: BytesIO
+    :param deadline: time.monotonic() value after which the processing stops with a TimeoutError
+    :type deadline: float(, optional)
     :return: Returns all the elements found as their corresponding classes and whether dummy data were found in between.
     :rtype: set(list, set(bool, bool))
     """
@@ -114,7 +215,12 @@ def process_elements_indicators(file):
     wrong_end_namespace_size = False
     unknown_chunk_type = False
     min_size = 8
+    steps = 0
     while True:
+        # Dummy data is skipped one byte at a time, so count every step
+        steps += 1
+        if steps % DEADLINE_CHECK_INTERVAL == 0:
+            check_deadline(deadline)
         cur_pos = file.tell()
         if file.getbuffer().nbytes < cur_pos + min_size:
             # we reached the end of the file
@@ -143,12 +249,14 @@ def process_elements_indicators(file):
     return elements, (dummy_data_between_elements, wrong_end_namespace_size, unknown_chunk_type)
 
 
-def manifest_tampering_indicators(manifest):
+def manifest_tampering_indicators(manifest, deadline: float = None):
     """
     Method to check for indicators of tampering in the AndroidManifest.xml
 
     :param manifest: The AndroidManifest file to check
     :type manifest: bytesIO
+    :param deadline: time.monotonic() value after which the check stops with a TimeoutError
+    :type deadline: float(, optional)
     :return: Returns a dictionary with the indicators of tampering for the AndroidManifest
     :rtype: dict
     """
@@ -161,7 +269,8 @@ def manifest_tampering_indicators(manifest):
         manifest_tampering_indicators_dict['string_pool'] = {'string_count': string_pool.str_header.string_count,
                                                              'real_string_count': len(string_pool.string_offsets)}
     XmlResourceMapType.parse(manifest)
-    elements, dummy = process_elements_indicators(manifest)
+    check_deadline(deadline)
+    elements, dummy = process_elements_indicators(manifest, deadline)
     for element in elements:
         if isinstance(element, XmlStartElement):
             for attr in element.attributes:
@@ -181,7 +290,7 @@ def manifest_tampering_indicators(manifest):
     return manifest_tampering_indicators_dict
 
 
-def apk_tampering_check(apk_file, strict: bool):
+def apk_tampering_check(apk_file, strict: bool, zipentry: ZipEntry = None):
     """
     Method to combine the check for tampering in the zip structure and in the AndroidManifest and return the results.
 
@@ -189,11 +298,14 @@ def apk_tampering_check(apk_file, strict: bool):
     :type apk_file: bytesIO
     :param strict: A boolean to strictly check all fields or not. Suggested value: False
     :type strict: bool
+    :param zipentry: an already parsed ZipEntry of apk_file, to avoid parsing it again
+    :type zipentry: ZipEntry(, optional)
     :return: Returns a combined dictionary with the results from the zip_tampering_indicators and the manifest_tampering_indicators
     :rtype: dict
     """
-    zip_tampering_indicators_dict = zip_tampering_indicators(apk_file, strict)
-    zipentry = ZipEntry.parse(apk_file)
+    if zipentry is None:
+        zipentry = ZipEntry.parse(apk_file)
+    zip_tampering_indicators_dict = zip_tampering_indicators(apk_file, strict, zipentry)
     cd_h_of_file = zipentry.get_central_directory_entry_dict("AndroidManifest.xml")
     local_header_of_file = zipentry.get_local_header_dict("AndroidManifest.xml")
     manifest = io.BytesIO(extract_file_based_on_header_info(apk_file, local_header_of_file, cd_h_of_file)[0])
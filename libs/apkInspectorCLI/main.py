@@ -131,7 +131,7 @@ def main():
                         xml_file.write(manifest)
                     print("AndroidManifest was saved as: decoded_AndroidManifest.xml")
                 elif args.analyze:
-                    tamperings = apk_tampering_check(zipentry.zip, False)
+                    tamperings = apk_tampering_check(zipentry.zip, False, zipentry)
                     if tamperings['zip tampering']:
                         print(
                             f"\nThe zip structure was tampered with using the following patterns:\n")
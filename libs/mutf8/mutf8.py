@@ -6,6 +6,20 @@ def decode_modified_utf8(s: bytes) -> str:
     :param s: bytestring to be converted.
     :returns: A unicode representation of the original string.
     """
+    s = bytes(s)
+    if b'\x00' not in s:
+        # Plain ASCII, and strict UTF-8 without 4-byte sequences once C0 80
+        # is turned into a NULL byte, decode to the same code points as the
+        # loop below. Surrogates (ED A0..ED BF), which the loop pairs, are
+        # rejected by strict UTF-8 and left to the loop.
+        if s.isascii():
+            return s.decode('ascii')
+        if max(s) < 0xF0:
+            try:
+                return s.replace(b'\xc0\x80', b'\x00').decode('utf-8')
+            except UnicodeDecodeError:
+                pass
+
     s_out = []
     s_len = len(s)
     s_ix = 0
@@ -79,11 +93,11 @@ def decode_modified_utf8(s: bytes) -> str:
                     # Definite six-byte codepoint.
                     s_out.append(
                         chr(
-                            0x10000 |
-                            (b2 & 0x0F) << 0x10 |
-                            (b3 & 0x3F) << 0x0A |
-                            (b5 & 0x0F) << 0x06 |
-                            (b6 & 0x3F)
+                            0x10000 +
+                            ((b2 & 0x0F) << 0x10 |
+                             (b3 & 0x3F) << 0x0A |
+                             (b5 & 0x0F) << 0x06 |
+                             (b6 & 0x3F))
                         )
                     )
                     s_ix += 5
@@ -137,7 +151,7 @@ def encode_modified_utf8(u: str) -> bytes:
             # Six-byte codepoint.
             final_string.extend([
                 0xED,
-                0xA0 | ((c >> 0x10) & 0x0F),
+                0xA0 | (((c >> 0x10) - 1) & 0x0F),
                 0x80 | ((c >> 0x0A) & 0x3f),
                 0xED,
                 0xb0 | ((c >> 0x06) & 0x0f),
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+# Same layout as ApkDetecter.py / ApkDetecterCLI.py: project root and the vendored libs
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBS_DIR = os.path.join(ROOT_DIR, 'libs')
+for path in (LIBS_DIR, ROOT_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
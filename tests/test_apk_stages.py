@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import random
+import struct
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from androguard.core.apk import APK
+
+from CheckProtect import CheckProtect
+from core.ApkAnalyzer import ApkAnalyzer
+
+ICON = b'\x89PNG\r\n\x1a\n' + bytes(range(256)) * 64
+
+
+def _empty_arsc():
+    # ResTable with an empty global string pool and no package
+    pool = struct.pack('<HHIIIIII', 1, 28, 28, 0, 0, 0, 0, 0)
+    return struct.pack('<HHII', 2, 12, 12 + len(pool), 0) + pool
+
+
+def _write_apk(path):
+    rng = random.Random(0)
+    entries = {
+        'res/mipmap-xxhdpi-v4/ic_launcher.png': ICON,
+        'lib/armeabi-v7a/libjiagu.so': b'\x7fELF' + bytes(1024),
+        'resources.arsc': _empty_arsc(),
+    }
+    for i in range(64):
+        entries[f'assets/blob{i}.bin'] = bytes(rng.randrange(16) for _ in range(rng.randint(0, 20000)))
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    return str(path), entries
+
+
+def test_stages_run_concurrently_on_one_apk(tmp_path):
+    path, entries = _write_apk(tmp_path / 'sample.apk')
+    expected_protect = CheckProtect(APK(path)).check_protectflag()
+
+    for _ in range(10):
+        analyzer = ApkAnalyzer(path)
+        analyzer.apk = APK(path)
+        analyzer._run_stages()
+        assert analyzer.icon_data == ICON
+        assert analyzer.cert_info == {}
+        assert analyzer.protect_info == expected_protect
+
+
+def test_shared_apk_reads_from_threads(tmp_path):
+    path, entries = _write_apk(tmp_path / 'sample.apk')
+    apk = APK(path)
+    names = list(entries) * 8
+    random.Random(1).shuffle(names)
+    start = threading.Barrier(8)
+
+    def read(name):
+        try:
+            start.wait(timeout=1)
+        except threading.BrokenBarrierError:
+            pass
+        return name, apk.get_file(name), apk.get_android_resources()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(read, names))
+    parsers = {id(parser) for _, _, parser in results}
+    assert len(parsers) == 1
+    for name, data, _ in results:
+        assert data == entries[name]
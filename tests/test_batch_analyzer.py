@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+import os
+import plistlib
+import zipfile
+
+import pytest
+
+import core.BatchAnalyzer as batch_module
+from core.BatchAnalyzer import BatchAnalyzer, analyze_sample
+
+
+def _fake_analyze(file_path, quick=False, tamper_budget=None, deep_scan=None):
+    if 'crash' in file_path:
+        # Same as a worker killed by the OOM killer
+        os._exit(1)
+    return {'file': file_path, 'type': 'apk', 'ok': True, 'error': None,
+            'worker': os.getpid(), 'size': 1, 'elapsed': 0.0}
+
+
+def test_error_records(tmp_path):
+    unsupported = tmp_path / 'sample.txt'
+    unsupported.write_bytes(b'not a sample')
+    missing = str(tmp_path / 'missing.apk')
+
+    records = []
+    stats = BatchAnalyzer(workers=1).run([str(unsupported), missing], records.append)
+
+    by_file = {record['file']: record for record in records}
+    assert set(by_file) == {str(unsupported), missing}
+    assert by_file[str(unsupported)]['error'] == "Unsupported file type"
+    assert by_file[missing]['error'].startswith('FileNotFoundError')
+    assert not any(record['ok'] for record in records)
+    assert stats.files == 2 and stats.failures == 2
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason="workers must inherit the patched analyze_sample")
+def test_broken_pool_keeps_going(monkeypatch):
+    monkeypatch.setattr(batch_module, 'analyze_sample', _fake_analyze)
+    paths = [f'/samples/{i}.apk' for i in range(12)] + ['/samples/crash.apk']
+    paths += [f'/samples/{i}.apk' for i in range(12, 24)]
+
+    records = []
+    stats = BatchAnalyzer(workers=2, max_pending=4).run(paths, records.append)
+
+    # One record per sample, the crashing one and its in-flight neighbours as failures
+    assert sorted(record['file'] for record in records) == sorted(paths)
+    failed = [record for record in records if not record['ok']]
+    assert '/samples/crash.apk' in {record['file'] for record in failed}
+    assert all('BrokenProcessPool' in record['error'] for record in failed)
+    assert len(failed) <= 4
+    assert stats.files == len(paths)
+    # Samples submitted after the crash ran in a new pool
+    assert all(record['ok'] for record in records if record['file'] == '/samples/23.apk')
+
+
+def _write_ipa(path, binary):
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('Payload/Foo.app/', b'')
+        archive.writestr('Payload/Foo.app/Info.plist', plistlib.dumps({'CFBundleExecutable': 'Foo'}))
+        archive.writestr('Payload/Foo.app/Foo', binary)
+    return str(path)
+
+
+def test_deep_scan_options(tmp_path):
+    ipa = _write_ipa(tmp_path / 'foo.ipa', b'\x00\x00https://example.org/x\x00\x00callSecretWord\x00\x00')
+    record = analyze_sample(ipa, deep_scan={})
+    assert record['ok'], record['error']
+    assert record['deep_scan']['urls'] == ['https://example.org/x']
+    assert record['deep_scan']['sensitive_strings'] == []
+
+    record = analyze_sample(ipa, deep_scan={'extra_keywords': ['secretword']})
+    assert record['deep_scan']['sensitive_strings'] == ['callSecretWord']
+    assert 'deep_scan' not in analyze_sample(ipa)
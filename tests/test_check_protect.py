@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import random
+
+from CheckProtect import SignatureIndex, CheckProtect, get_signature_index
+
+MATCH_MODES = ('exact', 'startswith', 'endswith', 'contains')
+
+
+def _naive_match(signatures, files):
+    """
+    Reference implementation: every condition tested against every file
+    """
+    def condition_met(cond):
+        mode = cond.get('match', 'exact')
+        pattern = cond.get('pattern', '')
+        for path in files:
+            item = path.rsplit('/', 1)[-1] if cond.get('type', 'file') == 'file' else path
+            if mode == 'exact' and item == pattern or mode == 'startswith' and item.startswith(pattern) or \
+                    mode == 'endswith' and item.endswith(pattern) or mode == 'contains' and pattern in item:
+                return True
+        return False
+
+    detected = set()
+    for signature in signatures:
+        for rule in signature['rules']:
+            conditions = rule['conditions'] if rule.get('type') == 'combined' else [rule]
+            if all(condition_met(cond) for cond in conditions):
+                detected.add(signature['name'])
+                break
+    return detected
+
+
+def _random_text(rng, size):
+    # Tiny alphabet, so patterns overlap and contain each other
+    return ''.join(rng.choice('ab/.') for _ in range(size))
+
+
+def _random_condition(rng):
+    return {'type': rng.choice(('file', 'path')), 'match': rng.choice(MATCH_MODES),
+            'pattern': _random_text(rng, rng.randrange(0, 4))}
+
+
+def test_index_matches_naive_evaluation():
+    rng = random.Random(9)
+    for _ in range(300):
+        signatures = []
+        for i in range(rng.randrange(1, 8)):
+            rules = []
+            for _ in range(rng.randrange(1, 3)):
+                if rng.random() < 0.3:
+                    rules.append({'type': 'combined',
+                                  'conditions': [_random_condition(rng) for _ in range(rng.randrange(1, 3))]})
+                else:
+                    rules.append(_random_condition(rng))
+            signatures.append({'name': f'sig{i}', 'rules': rules})
+        files = [_random_text(rng, rng.randrange(0, 8)) for _ in range(rng.randrange(0, 6))]
+
+        assert SignatureIndex(signatures).match(files) == _naive_match(signatures, files), (signatures, files)
+
+
+def test_overlapping_contains_patterns():
+    signatures = [{'name': name, 'rules': [{'type': 'path', 'match': 'contains', 'pattern': pattern}]}
+                  for name, pattern in (('long', 'libjiagu'), ('inner', 'jiagu'), ('overlap', 'guard'))]
+    # 'guard' starts inside the 'libjiagu' match
+    assert SignatureIndex(signatures).match(['lib/libjiaguard.so']) == {'long', 'inner', 'overlap'}
+
+
+def test_bundled_signatures():
+    class FakeApk:
+        def get_files(self):
+            return ['classes.dex', 'lib/arm64-v8a/libjiagu.so', 'res/mipmap-xxhdpi/ic_launcher.png']
+
+    index = get_signature_index()
+    assert index.match([]) == set()
+    assert CheckProtect(FakeApk()).get_protectors() == sorted(_naive_match(index.signatures, FakeApk().get_files()))
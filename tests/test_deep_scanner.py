@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import struct
+
+import pytest
+from androguard.core import mutf8
+
+from core.DeepScanner import DeepScanner, scan_dex_strings
+from core.DexReader import DEX_HEADER, ENDIAN_CONSTANT, _decode_mutf8
+from core.PatternMatcher import PatternMatcher
+
+
+def build_dex(strings, types, methods):
+    """
+    Minimal DEX with only the string_ids, type_ids and method_ids tables
+
+    :param types: string index of each type
+    :param methods: (class_idx, proto_idx, name_idx) of each method
+    """
+    string_ids_off = DEX_HEADER.size
+    type_ids_off = string_ids_off + 4 * len(strings)
+    method_ids_off = type_ids_off + 4 * len(types)
+    data_off = method_ids_off + 8 * len(methods)
+
+    string_data = bytearray()
+    string_offsets = []
+    for s in strings:
+        string_offsets.append(data_off + len(string_data))
+        # ASCII only: the utf16 size is the byte length
+        string_data += bytes([len(s)]) + s.encode('ascii') + b'\x00'
+
+    fields = [0] * 20
+    fields[0] = data_off + len(string_data)  # file_size
+    fields[1] = DEX_HEADER.size  # header_size
+    fields[2] = ENDIAN_CONSTANT
+    fields[6:10] = [len(strings), string_ids_off, len(types), type_ids_off]
+    fields[14:16] = [len(methods), method_ids_off]
+    header = DEX_HEADER.pack(b'dex\n035\x00', 0, b'\x00' * 20, *fields)
+    return (header + struct.pack(f'<{len(strings)}I', *string_offsets) +
+            struct.pack(f'<{len(types)}I', *types) +
+            b''.join(struct.pack('<HHI', *method) for method in methods) + bytes(string_data))
+
+
+def _matcher():
+    scanner = DeepScanner()
+    return PatternMatcher(scanner.patterns['url'].pattern, scanner.patterns['ip'].pattern,
+                          scanner.suspicious_keywords, scanner._build_api_terms())
+
+
+def test_malformed_method_ids_keep_strings():
+    strings = ['Landroid/os/Debug;', 'http://c2.example.com/gate', 'isDebuggerConnected']
+    valid = build_dex(strings, [0], [(0, 0, 2)])
+    # class_idx past the type_ids table
+    malformed = build_dex(strings, [0], [(0, 0, 2), (7, 0, 2)])
+
+    expected = scan_dex_strings(valid, _matcher())
+    found = scan_dex_strings(malformed, _matcher())
+
+    assert 'http://c2.example.com/gate' in found['urls']
+    # Method references read before the bad entry are kept as well
+    assert found == expected
+
+
+@pytest.mark.parametrize('raw', [
+    b'plain', 'caf\u00e9 \u4e2d\u6587'.encode('utf-8'), b'a\xc0\x80b',
+    # U+1F600 as a surrogate pair, the only way MUTF-8 stores it
+    b'\xed\xa0\xbd\xed\xb8\x80',
+])
+def test_decode_mutf8_matches_androguard(raw):
+    assert _decode_mutf8(raw) == mutf8.decode(raw)
+
+
+@pytest.mark.parametrize('raw', [b'a\xf0\x9f\x98\x80b', b'a\xf4\x8f\xbf\xbfb', b'a\xf5\x80b'])
+def test_decode_mutf8_rejects_four_byte_sequences(raw):
+    # Valid (or not) UTF-8 but never MUTF-8: no supplementary character comes out
+    assert _decode_mutf8(raw) == 'a' + '\ufffd' * (len(raw) - 2) + 'b'
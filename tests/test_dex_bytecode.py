@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import random
+import struct
+
+import pytest
+
+from androguard.core.dex import (DALVIK_OPCODES_FORMAT, DalvikPacker, InvalidInstruction,
+                                 LinearSweepAlgorithm)
+
+
+class _ClassManager:
+    """
+    The bytecode decoders only need the packer and the ODEX flag
+    """
+    packer = DalvikPacker(0x12345678)
+
+    def get_odex_format(self):
+        return False
+
+
+CM = _ClassManager()
+FIXED_OPCODES = sorted(op for op, (cls, _) in DALVIK_OPCODES_FORMAT.items() if cls.length)
+
+
+def _decodes(code):
+    try:
+        list(LinearSweepAlgorithm.get_instructions(CM, len(code) // 2, bytearray(code), 0))
+        return True
+    except InvalidInstruction:
+        return False
+
+
+def _random_instruction(rng):
+    op = rng.choice(FIXED_OPCODES)
+    length = DALVIK_OPCODES_FORMAT[op][0].length
+    code = bytes([op, rng.randrange(256)]) + bytes(rng.randrange(256) for _ in range(length - 2))
+    # Random fields are not valid for every format (e.g. register counts)
+    return code if _decodes(code) else bytes([op, 0]) + bytes(length - 2)
+
+
+def _random_payload(rng):
+    kind = rng.randrange(3)
+    if kind == 0:
+        targets = [rng.randrange(-1000, 1000) for _ in range(rng.randrange(1, 5))]
+        return struct.pack(f'<HHi{len(targets)}i', 0x0100, len(targets), rng.randrange(-50, 50), *targets)
+    if kind == 1:
+        size = rng.randrange(1, 5)
+        keys = sorted(rng.sample(range(-1000, 1000), size))
+        targets = [rng.randrange(-1000, 1000) for _ in range(size)]
+        return struct.pack(f'<HH{size}i{size}i', 0x0200, size, *keys, *targets)
+    width = rng.choice((1, 2, 4, 8))
+    count = rng.randrange(0, 6)
+    data = bytes(rng.randrange(256) for _ in range(width * count))
+    if len(data) % 2:
+        data += b'\x00'
+    return struct.pack('<HHI', 0x0300, width, count) + data
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_records_match_instructions(seed):
+    rng = random.Random(seed)
+    code = b''.join(_random_payload(rng) if rng.random() < 0.1 else _random_instruction(rng)
+                    for _ in range(200))
+    size = len(code) // 2
+
+    instructions = list(LinearSweepAlgorithm.get_instructions(CM, size, bytearray(code), 0))
+    records = LinearSweepAlgorithm.get_records(CM, size, bytearray(code), 0)
+
+    assert [(opcode, length) for opcode, _operands, length in records] == \
+        [(ins.get_op_value(), ins.get_length()) for ins in instructions]
+    offset = 0
+    for _opcode, operands, length in records:
+        units = length // 2 - 1
+        assert operands == struct.unpack_from(f'<{units}H', code, offset + 2)
+        offset += length
+    assert offset == len(code)
+
+
+def test_records_reject_unknown_payload():
+    with pytest.raises(InvalidInstruction):
+        LinearSweepAlgorithm.get_records(CM, 2, bytearray(struct.pack('<HH', 0x0400, 0)), 0)
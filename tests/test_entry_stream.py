@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import io
+import random
+import struct
+import zipfile
+import zlib
+
+import pytest
+
+from apkInspector.headers import ZipEntry
+
+
+def _archive(data, compression=zipfile.ZIP_DEFLATED):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression) as archive:
+        archive.writestr('a.txt', data)
+    return buffer.getvalue()
+
+
+DATA = bytes(random.Random(0).choice(b'abcdef\n') for _ in range(100000))
+
+
+@pytest.mark.parametrize('compression', [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+def test_read_sizes(compression):
+    with ZipEntry.parse(io.BytesIO(_archive(DATA, compression))) as zipentry:
+        with zipentry.open('a.txt') as stream:
+            assert stream.read(0) == b''
+            assert stream.read(10) == DATA[:10]
+            assert stream.read(0) == b''
+            assert stream.read() == DATA[10:]
+            assert stream.read(10) == b''
+        assert zipentry.read_head('a.txt', 1000) == DATA[:1000]
+
+
+@pytest.mark.parametrize('compression', [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+def test_readinto_small_buffer(compression):
+    with ZipEntry.parse(io.BytesIO(_archive(DATA, compression))) as zipentry:
+        with zipentry.open('a.txt') as stream:
+            assert stream.readinto(bytearray()) == 0
+            out = bytearray()
+            buffer = bytearray(7)
+            while True:
+                n = stream.readinto(buffer)
+                if not n:
+                    break
+                assert n <= len(buffer)
+                out += buffer[:n]
+    assert bytes(out) == DATA
+
+
+def test_truncated_deflate_stream():
+    data = bytearray(_archive(DATA))
+    local_header = data.find(b'PK\x03\x04')
+    central_entry = data.find(b'PK\x01\x02')
+    # Declare only half of the compressed stream
+    compressed_size = struct.unpack_from('<I', data, local_header + 18)[0]
+    struct.pack_into('<I', data, local_header + 18, compressed_size // 2)
+    struct.pack_into('<I', data, central_entry + 20, compressed_size // 2)
+    with ZipEntry.parse(io.BytesIO(data)) as zipentry:
+        with zipentry.open('a.txt') as stream:
+            with pytest.raises(zlib.error):
+                stream.read()
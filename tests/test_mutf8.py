@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import random
+
+import pytest
+
+from mutf8.mutf8 import decode_modified_utf8
+
+ALPHABET = ['a', 'Z', '/', ';', '\x00', '\x7f', '\x80', 'é', '߿', 'ࠀ', '中', '\uffff',
+            '\U00010000', '😀', '\U0010ffff']
+
+
+def _encode(text):
+    """
+    Reference MUTF-8 encoder: every UTF-16 code unit encoded on its own, NUL as C0 80
+    """
+    units = text.encode('utf-16-le', 'surrogatepass')
+    out = []
+    for i in range(0, len(units), 2):
+        unit = chr(int.from_bytes(units[i:i + 2], 'little'))
+        out.append(b'\xc0\x80' if unit == '\x00' else unit.encode('utf-8', 'surrogatepass'))
+    return b''.join(out)
+
+
+def test_round_trip():
+    rng = random.Random(25)
+    for _ in range(5000):
+        text = ''.join(rng.choice(ALPHABET) for _ in range(rng.randrange(0, 12)))
+        assert decode_modified_utf8(_encode(text)) == text
+
+
+@pytest.mark.parametrize('data, expected', [
+    (b'', ''),
+    (b'Landroid/app/Activity;', 'Landroid/app/Activity;'),
+    # Encoded NUL, the only MUTF-8 sequence the UTF-8 fast path handles
+    (b'a\xc0\x80b', 'a\x00b'),
+    (b'caf\xc3\xa9 \xe4\xb8\xad', 'café 中'),
+    # Surrogate pair: rejected by strict UTF-8, paired by the MUTF-8 decoder
+    (b'\xed\xa0\xbd\xed\xb8\x80', '😀'),
+    # Overlong forms are accepted by the MUTF-8 decoder, unlike UTF-8
+    (b'\xc1\x81', 'A'),
+    (b'\xe0\x80\x80', '\x00'),
+])
+def test_decode(data, expected):
+    assert decode_modified_utf8(data) == expected
+    assert decode_modified_utf8(bytearray(data)) == expected
+    assert decode_modified_utf8(memoryview(data)) == expected
+
+
+@pytest.mark.parametrize('data', [b'a\x00b', b'\xc3', b'\xed\xa0\xbd'])
+def test_decode_errors(data):
+    with pytest.raises(UnicodeDecodeError):
+        decode_modified_utf8(data)
+
+
+@pytest.mark.parametrize('data', [b'\xf0\x9f\x98\x80', b'\xff'])
+def test_four_byte_utf8_is_not_mutf8(data):
+    # Not taken by the UTF-8 fast path, the MUTF-8 decoder rejects them
+    with pytest.raises(RuntimeError):
+        decode_modified_utf8(data)
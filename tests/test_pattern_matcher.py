@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import random
+import re
+
+import pytest
+
+from core.PatternMatcher import PatternMatcher, build_trie_regex
+
+
+def random_words(rng, count):
+    # A tiny alphabet gives many shared prefixes and words contained in others
+    return [''.join(rng.choice('abc.') for _ in range(rng.randint(1, 5))) for _ in range(count)]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_trie_matches_any_substring(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        words = random_words(rng, rng.randint(1, 30))
+        trie_re = re.compile(build_trie_regex(words))
+        for text in random_words(rng, 20):
+            text = text * rng.randint(1, 3)
+            m = trie_re.search(text)
+            assert bool(m) == any(w in text for w in words)
+            if m:
+                assert m.group() in words
+
+
+def test_trie_prefers_longer_keyword():
+    assert re.compile(build_trie_regex(['ho', 'hook', 'host'])).search('xhooks').group() == 'hook'
+    assert build_trie_regex(['hook', 'host', 'root']) == '(?:ho(?:ok|st)|root)'
+
+
+def test_classify_keywords_match_naive():
+    rng = random.Random(0)
+    keywords = random_words(rng, 200) + ['Frida', '']
+    matcher = PatternMatcher(r'https?://\S+', r'\d+\.\d+\.\d+\.\d+', keywords, {})
+    lowered = [kw.lower() for kw in keywords if kw]
+    for text in random_words(rng, 500) + ['libFRIDA-agent.so']:
+        hits = [hit for hit in matcher.classify(text) if hit[0] == 'sensitive_strings']
+        assert bool(hits) == any(kw in text.lower() for kw in lowered)
+        if hits:
+            assert hits[0][2][len('keyword:'):] in lowered
+
+
+def test_classify_rules():
+    matcher = PatternMatcher(r'https?://\S+', r'\d+\.\d+\.\d+\.\d+', ['root'],
+                             {'getDeviceId': [('privacy', 'TelephonyManager.getDeviceId')]})
+    assert matcher.classify('https://root.example') == [
+        ('urls', 'https://root.example', 'url'),
+        ('sensitive_strings', 'https://root.example', 'keyword:root'),
+    ]
+    assert matcher.classify('10.0.0.1') == [('ips', '10.0.0.1', 'ip')]
+    assert matcher.classify('0.0.0.0') == []
+    assert matcher.classify('getDeviceId') == [('privacy', 'TelephonyManager.getDeviceId', 'api:getDeviceId')]
+    assert matcher.match_api('getdeviceid') == []
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import os
+import sqlite3
+from datetime import datetime
+
+import core.ResultCache as cache_module
+from core.ResultCache import ResultCache
+
+SHA_A = 'a' * 64
+SHA_B = 'b' * 64
+SHA_C = 'c' * 64
+
+
+def _payload():
+    # Incompressible, so every entry takes about the same room
+    return {'blob': os.urandom(3000).hex()}
+
+
+def test_round_trip(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache.sqlite3'))
+    when = datetime(2024, 5, 1, 12, 30)
+    cache.put(SHA_A, {'info': {'created': when, 'raw': b'\x00\x01', 'name': 'app'}}, icon=b'PNG')
+
+    cached = cache.get(SHA_A.upper())
+    assert cached['info'] == {'created': when, 'raw': b'\x00\x01', 'name': 'app'}
+    assert cached['icon_data'] == b'PNG'
+    assert cache.get(SHA_A, kind='deep_scan') is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache.sqlite3'), max_bytes=9000)
+    cache.put(SHA_A, _payload())
+    cache.put(SHA_B, _payload())
+    # Touch A, so B is now the least recently used
+    assert cache.get(SHA_A) is not None
+    cache.put(SHA_C, _payload())
+
+    assert cache.get(SHA_B) is None
+    assert cache.get(SHA_A) is not None
+    assert cache.get(SHA_C) is not None
+
+
+def test_payload_version_invalidates(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path / 'cache.sqlite3'))
+    cache.put(SHA_A, {'info': {}})
+    cache.put(SHA_A, {'strings': []}, kind='deep_scan')
+
+    monkeypatch.setitem(cache_module.PAYLOAD_VERSIONS, 'deep_scan', cache_module.PAYLOAD_VERSIONS['deep_scan'] + 1)
+    assert cache.get(SHA_A, kind='deep_scan') is None
+    assert cache.get(SHA_A) is not None
+
+
+def test_corrupted_entry_stays_off_stdout(tmp_path, capsys):
+    path = str(tmp_path / 'cache.sqlite3')
+    cache = ResultCache(path)
+    cache.put(SHA_A, {'info': {}})
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE results SET payload = ?", (b'not zlib',))
+
+    assert cache.get(SHA_A) is None
+    # Batch mode writes JSON Lines to stdout
+    assert capsys.readouterr().out == ''
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 0
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+import hashlib
+
+import pytest
+
+from core.SampleHasher import SampleHasher
+
+
+@pytest.mark.parametrize('size', [0, 1, 4096, 3 * 4096 + 5])
+def test_digests(tmp_path, size):
+    data = bytes(i * 7 % 251 for i in range(size))
+    path = tmp_path / 'sample.bin'
+    path.write_bytes(data)
+    progress = []
+    hasher = SampleHasher(str(path), chunk_size=4096)
+    hasher.set_progress_callback(lambda value, message: progress.append(value))
+    assert hasher.run(0, 10) == {name: hashlib.new(name, data).hexdigest().upper()
+                                 for name in SampleHasher.ALGORITHMS}
+    assert progress == sorted(set(progress))
+    if size:
+        assert progress[-1] == 10
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import io
+import random
+
+import pytest
+
+from core.StringExtractor import extract_ascii, extract_strings, extract_utf16le, iter_stream_strings
+
+PRINTABLE = set(range(0x20, 0x7f)) | {0x09, 0x0a, 0x0d}
+
+
+def naive_ascii(data, min_length):
+    """Byte by byte reference for extract_ascii()"""
+    strings = []
+    run = bytearray()
+    for b in bytes(data) + b'\x00':
+        if b in PRINTABLE:
+            run.append(b)
+            continue
+        if len(run) >= min_length:
+            strings.append(run.decode('ascii'))
+        run = bytearray()
+    return strings
+
+
+def naive_utf16le(data, min_length):
+    """Reference for extract_utf16le(): leftmost runs of printable chars followed by a zero byte"""
+    data = bytes(data)
+    strings = []
+    pos = 0
+    while pos + 1 < len(data):
+        end = pos
+        while end + 1 < len(data) and data[end] in PRINTABLE and data[end + 1] == 0:
+            end += 2
+        if (end - pos) // 2 >= min_length:
+            strings.append(data[pos:end].decode('utf-16-le'))
+            pos = end
+        else:
+            pos += 1
+    return strings
+
+
+def random_blob(rng, size):
+    """Mix of noise, ASCII runs and UTF-16LE runs of all lengths around the threshold"""
+    out = bytearray()
+    while len(out) < size:
+        kind = rng.random()
+        word = bytes(rng.choice(b'abcXYZ019 ._/\t') for _ in range(rng.randint(0, 9)))
+        if kind < 0.4:
+            out += word
+        elif kind < 0.7:
+            out += word.decode('ascii').encode('utf-16-le')
+        else:
+            out += bytes(rng.randrange(256) for _ in range(rng.randint(1, 4)))
+    return bytes(out)
+
+
+@pytest.mark.parametrize('min_length', [1, 4, 6])
+def test_regex_matches_reference(min_length):
+    rng = random.Random(min_length)
+    for _ in range(50):
+        data = random_blob(rng, rng.randint(0, 300))
+        assert list(extract_ascii(data, min_length)) == naive_ascii(data, min_length)
+        assert list(extract_utf16le(data, min_length)) == naive_utf16le(data, min_length)
+
+
+def test_memoryview_input():
+    data = b'\x00hello world\x00' + 'wide string'.encode('utf-16-le')
+    assert list(extract_strings(memoryview(data))) == list(extract_strings(data))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 1 << 20])
+@pytest.mark.parametrize('min_length', [1, 4])
+def test_stream_matches_whole_buffer(chunk_size, min_length):
+    rng = random.Random(chunk_size * 10 + min_length)
+    for _ in range(20):
+        data = random_blob(rng, rng.randint(0, 400))
+        # ASCII alone keeps the whole-buffer order
+        streamed = list(iter_stream_strings(io.BytesIO(data), min_length, utf16=False, chunk_size=chunk_size))
+        assert streamed == list(extract_strings(data, min_length, utf16=False))
+        # With UTF-16 the two scanners interleave per chunk
+        streamed = list(iter_stream_strings(io.BytesIO(data), min_length, chunk_size=chunk_size))
+        assert sorted(streamed) == sorted(extract_strings(data, min_length))
+
+
+def test_stream_progress():
+    data = b'x' * 1000
+    seen = []
+    list(iter_stream_strings(io.BytesIO(data), chunk_size=300, progress_callback=seen.append))
+    assert seen == [300, 600, 900, 1000]
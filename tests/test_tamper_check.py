@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import io
+import struct
+import zipfile
+
+from core.TamperCheck import TamperCheck
+
+
+def _write_apk(path, entries, forged_method=None):
+    """
+    :param forged_method: compression method written in both headers of the first entry, with its
+                          declared uncompressed size forged down to 10 bytes
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries:
+            archive.writestr(name, data)
+    data = bytearray(buffer.getvalue())
+    if forged_method is not None:
+        local_header = data.find(b'PK\x03\x04')
+        central_entry = data.find(b'PK\x01\x02')
+        struct.pack_into('<H', data, local_header + 8, forged_method)
+        struct.pack_into('<I', data, local_header + 22, 10)
+        struct.pack_into('<H', data, central_entry + 10, forged_method)
+        struct.pack_into('<I', data, central_entry + 24, 10)
+    path.write_bytes(bytes(data))
+    return str(path)
+
+
+def test_clean_archive(tmp_path):
+    apk = _write_apk(tmp_path / 'clean.apk', [('classes.dex', b'dex\n035\x00' + b'\x00' * 64)])
+    check = TamperCheck(apk)
+    assert check.run() == 'androguard'
+    assert check.info['status'] == 'ok'
+    assert check.get_files() == ['classes.dex']
+
+
+def test_memory_budget_ignores_forged_sizes(tmp_path):
+    # Declares 10 bytes, inflates to 8 MB
+    apk = _write_apk(tmp_path / 'bomb.apk', [('AndroidManifest.xml', b'\x00' * (8 << 20))], forged_method=99)
+    check = TamperCheck(apk, memory_budget=1 << 20)
+    assert check.run() is None
+    assert check.info['status'] == 'memory'
+    assert check.error
+
+
+def test_time_budget(tmp_path):
+    apk = _write_apk(tmp_path / 'slow.apk', [(f'res/{i}.png', b'') for i in range(10)])
+    check = TamperCheck(apk, time_budget=0)
+    assert check.run() is None
+    assert check.info['status'] == 'timeout'